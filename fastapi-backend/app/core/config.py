@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     QDRANT_API_KEY: Optional[str] = None
     QDRANT_HOST: str = "localhost"  # Fallback for local dev
     QDRANT_PORT: int = 6333  # Fallback for local dev
+    # gRPC transport for point/payload operations (HTTP is still used where gRPC has no mapping).
+    QDRANT_PREFER_GRPC: bool = True
+    QDRANT_GRPC_PORT: int = 6334
 
     # Global firm knowledge collection (Tier 1 - firm-wide, is_global=true)
     QDRANT_COLLECTION_TIER_1: str = "riley_campaigns_768"
@@ -33,17 +36,36 @@ class Settings(BaseSettings):
     NEO4J_URI: str = "bolt://localhost:7687"
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: str = "password"
+    # Driver pool sizing. Requests that can't get a connection within the acquisition
+    # timeout fail instead of queueing for the driver's 60s default.
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT_SECONDS: float = 30.0
+    NEO4J_MAX_CONNECTION_LIFETIME_SECONDS: int = 3600
+    # Circuit breaker: once held session slots (each with a pool connection checked out) stay
+    # at/above the threshold for the window, new graph sessions fail fast (503) instead of
+    # queueing behind the pool.
+    NEO4J_CIRCUIT_BREAKER_UTILIZATION: float = 0.95
+    NEO4J_CIRCUIT_BREAKER_WINDOW_SECONDS: float = 5.0
 
     # Google Gemini / Generative AI
     GOOGLE_API_KEY: Optional[str] = None
     EMBEDDING_MODEL: str = "models/gemini-embedding-001"  # Supported Gemini embedding model
     EMBEDDING_DIM: int = 3072  # gemini-embedding-001 outputs 3072-d vectors
+    # Warm the GenAI client (one tiny embedding) and Clerk HTTP pool during startup so the
+    # first request after a cold start doesn't pay SDK init + TLS handshakes. Best-effort.
+    WARMUP_ENABLED: bool = True
+    WARMUP_TIMEOUT_SECONDS: int = 10
 
     # Qdrant vector configuration
     # NOTE: Keep as a string for env override; code maps to qdrant_client Distance enum.
     QDRANT_DISTANCE: str = "Cosine"
     QDRANT_COST_PER_GB_MONTH_USD: float = 0.25
     BM25_ENABLED: bool = True
+    # int8 scalar quantization for newly created collections (existing ones are unchanged
+    # until recreated). Searches rescore quantized candidates against the original vectors.
+    QDRANT_SCALAR_QUANTIZATION: bool = True
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = 2.0
+    QDRANT_SEARCH_HNSW_EF: int = 64
     HYBRID_SEARCH_ENABLED: bool = True
     RERANK_ENABLED: bool = True
     RERANK_PROVIDER: str = "gemini"
@@ -114,6 +136,7 @@ class Settings(BaseSettings):
     OCR_ENABLED_SYSTEMWIDE: bool = False  # Master switch for OCR functionality
     OCR_MIN_CONFIDENCE: float = 0.50  # Minimum confidence threshold (0-1)
     OCR_MAX_CHARS: int = 10000  # Maximum characters to extract from OCR
+    OCR_MAX_CONCURRENCY: int = 8  # In-flight Vision image OCR requests per process
 
     # Upload limits (server-side hard cap)
     MAX_UPLOAD_MB: int = 25
@@ -127,6 +150,10 @@ class Settings(BaseSettings):
     PREVIEW_MAX_MB: int = 25
     PREVIEW_GENERATION_TIMEOUT_SECONDS: int = 20
     PREVIEW_BUCKET_PATH_PREFIX: str = "previews"
+    # Warm LibreOffice per worker via unoserver (needs python3-uno; see Dockerfile).
+    PREVIEW_UNOSERVER_ENABLED: bool = False
+    PREVIEW_UNOSERVER_COMMAND: str = "/usr/bin/python3 -m unoserver.server"
+    PREVIEW_UNOSERVER_PYTHONPATH: str = "/opt/unoserver"
     SIGN_PREVIEW_URLS: bool = True
     PREVIEW_URL_TTL_SECONDS: int = 3600
     SIGNING_SERVICE_ACCOUNT_EMAIL: Optional[str] = None  # Service account email for IAM-based signed URLs
@@ -10,7 +10,7 @@ from pathlib import Path
 from anyio import CapacityLimiter, to_thread
 from fastapi import FastAPI, Request, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.routers import (
     chat,
@@ -31,12 +31,15 @@ from app.routers import (
     uploads,
 )
 from app.dependencies.auth import verify_clerk_token, extract_tenant_id
-from app.services.graph import GraphService
+from app.services.clerk_directory import close_clerk_client, warm_clerk_client
+from app.services.genai_client import warm_genai_client
+from app.services.graph import GraphOverloadedError, get_graph_service
+from app.services.ingestion import shutdown_cpu_pool
 from app.services.pricing_registry import estimate_worker_runtime_cost
+from app.services.preview import start_preview_daemon, stop_preview_daemon
 from app.services.qdrant import vector_service
 from app.services.llm_cost_guardrail import (
     configure_guardrail_graph_service,
-    close_guardrail_driver,
 )
 from app.services.request_observability import (
     classify_operation_type,
@@ -52,7 +55,8 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan: startup and shutdown events."""
     # Startup: Initialize Neo4j connection and store in app.state
     settings = get_settings()
-    app.state.graph = GraphService()
+    app.state.graph = get_graph_service()
+    await app.state.graph.connect()
     configure_guardrail_graph_service(app.state.graph)
     if getattr(settings, "MISSION_CONTROL_AUTO_SCHEMA_SETUP", False):
         timeout_seconds = max(
@@ -109,6 +113,19 @@ async def lifespan(app: FastAPI):
         # Don't hard-crash app startup; surface clearly so deploy logs explain Qdrant issues.
         print(f"⚠️ Qdrant collection ensure failed: {exc}")
     
+    if settings.WARMUP_ENABLED:
+        warmup_timeout_seconds = max(1, int(settings.WARMUP_TIMEOUT_SECONDS))
+        warmups = {"genai": warm_genai_client(), "clerk": warm_clerk_client()}
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(warmup, timeout=warmup_timeout_seconds) for warmup in warmups.values()),
+            return_exceptions=True,
+        )
+        for name, outcome in zip(warmups, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning("startup_warmup_failed target=%s error=%r", name, outcome)
+            else:
+                logger.info("startup_warmup_completed target=%s", name)
+
     # Ensure static directory exists for file uploads
     static_dir = Path("static")
     static_dir.mkdir(exist_ok=True)
@@ -119,6 +136,8 @@ async def lifespan(app: FastAPI):
     if isinstance(limiter, CapacityLimiter):
         limiter.total_tokens = 100
 
+    await start_preview_daemon()
+
     if settings.MISSION_CONTROL_ROLLUP_AUTO_REFRESH_ENABLED:
         create_task(
             app.state.graph.rebuild_analytics_daily_rollups(
@@ -129,12 +148,16 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown: Close Neo4j connection
     configure_guardrail_graph_service(None)
-    await close_guardrail_driver()
+    await close_clerk_client()
+    await stop_preview_daemon()
+    await shutdown_cpu_pool()
     if hasattr(app.state, "graph") and app.state.graph:
         await app.state.graph.close()
+    # The closed driver must not be handed out again (e.g. a second lifespan in tests).
+    get_graph_service.cache_clear()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 def _safe_int(value: object, default: int = 0) -> int:
@@ -376,6 +399,31 @@ async def healthz_graph(request: Request):
     return {"status": "ok", "graph": "reachable"}
 
 
+@app.get("/healthz/neo4j")
+async def healthz_neo4j(request: Request):
+    """Neo4j session pool pressure; 503 while the graph circuit breaker is open."""
+    graph = getattr(request.app.state, "graph", None)
+    if graph is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Graph service not initialized",
+        )
+    stats = graph.pool_stats()
+    if stats["circuit_open"]:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=stats)
+    return stats
+
+
+@app.exception_handler(GraphOverloadedError)
+async def graph_overloaded_handler(request: Request, exc: GraphOverloadedError):
+    """Fail fast with a retryable 503 when the graph circuit breaker rejects a session."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "5"},
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler to catch unhandled errors.
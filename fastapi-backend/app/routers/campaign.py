@@ -1399,7 +1399,7 @@ async def add_campaign_member(
     try:
         clerk_user = find_user_by_id(normalized_user_id) if normalized_user_id else None
         if clerk_user is None:
-            clerk_user = find_user_by_email(normalized_email)
+            clerk_user = await find_user_by_email(normalized_email)
         if not clerk_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -9,6 +9,7 @@ from fastapi import APIRouter, HTTPException, Request, status, Depends
 
 from app.core.config import get_settings
 from app.dependencies.graph_dep import get_graph
+from app.services.clerk_directory import invalidate_user_directory_cache
 from app.services.graph import GraphService
 
 router = APIRouter()
@@ -175,11 +176,13 @@ async def handle_clerk_webhook(
             display_name=display_name,
             avatar_url=avatar_url,
         )
+        invalidate_user_directory_cache(email=email, user_id=clerk_user_id)
         logger.info("clerk_webhook_user_synced event=%s user_id=%s", event_type, clerk_user_id)
         return {"ok": True, "event_type": event_type, "user_id": clerk_user_id}
 
     if event_type == "user.deleted":
         if clerk_user_id:
+            invalidate_user_directory_cache(user_id=clerk_user_id)
             await graph.mark_user_deleted_from_clerk(user_id=clerk_user_id)
             logger.info("clerk_webhook_user_marked_deleted user_id=%s", clerk_user_id)
         return {"ok": True, "event_type": event_type, "user_id": clerk_user_id}
@@ -1,21 +1,27 @@
+import asyncio
 import logging
 from datetime import datetime
-from pathlib import Path
+from functools import partial
 from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, Form, Query, Depends, Request, Header
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, Form, Query, Depends, Request, Header
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from qdrant_client.http import models
 from qdrant_client.http.models import Filter, FieldCondition, MatchValue
 
 from app.core.config import get_settings
 from app.dependencies.auth import verify_clerk_token, verify_tenant_access, check_tenant_membership
 from app.dependencies.graph_dep import get_graph
-from app.services.ocr import run_ocr, is_image_ext
+from app.services.ocr import gcs_uri_from_url, is_image_ext, run_ocr, run_ocr_from_gcs
 from app.services.graph import GraphService
 from app.services.pricing_registry import estimate_single_unit_cost, estimate_storage_cost
 from app.services.qdrant import vector_service
+from app.services.query_cache import invalidate_search_results
 from app.services.ingestion import (
     process_upload,
+    read_upload_bounded,
     delete_file,
     untag_file,
     _generate_embedding,
@@ -29,6 +35,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Settings are process-wide (get_settings is cached), so hot-path constants are bound once.
+_SETTINGS = get_settings()
+TIER_1_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_1
+TIER_2_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_2
+MAX_UPLOAD_BYTES = int(_SETTINGS.MAX_UPLOAD_MB) * 1024 * 1024
+
 
 class FileItem(BaseModel):
     id: str
@@ -86,6 +98,20 @@ class FileListResponse(BaseModel):
     files: List[FileListItem]
 
 
+# The list routes return ORJSONResponse bodies directly (FastAPI would otherwise dump and
+# re-validate every item against response_model); these are the FileListItem defaults.
+_FILE_LIST_ITEM_DEFAULTS: Dict[str, Any] = {
+    name: field.default
+    for name, field in FileListItem.model_fields.items()
+    if not field.is_required()
+}
+
+
+def _file_list_item(**fields: Any) -> Dict[str, Any]:
+    """A FileListItem as a plain dict, with every field present like model_dump()."""
+    return {**_FILE_LIST_ITEM_DEFAULTS, **fields}
+
+
 class FirmDocumentsAuditResponse(BaseModel):
     total_scanned: int
     valid_records: int
@@ -164,9 +190,8 @@ async def _get_file_point_for_tenant(
     collection_name: Optional[str] = None,
 ) -> tuple[Any, Dict[str, Any], str]:
     """Load a file point and enforce tenant/file ownership before action."""
-    settings = get_settings()
     resolved_collection = collection_name or (
-        settings.QDRANT_COLLECTION_TIER_1 if tenant_id == "global" else settings.QDRANT_COLLECTION_TIER_2
+        TIER_1_COLLECTION if tenant_id == "global" else TIER_2_COLLECTION
     )
     points = await vector_service.client.retrieve(
         collection_name=resolved_collection,
@@ -197,6 +222,59 @@ async def _get_file_point_for_tenant(
     return point, payload, resolved_collection
 
 
+# UntagRequest.tag values that clear every tag (compared case-insensitively).
+_UNTAG_ALL_SENTINELS = frozenset({"*", "all"})
+
+# Short-lived per-tenant cache for /list. Dashboards poll it every few seconds;
+# mutation endpoints invalidate their tenant's entry explicitly.
+_FILE_LIST_CACHE_TTL_SECONDS = 3
+_file_list_cache: TTLCache = TTLCache(maxsize=512, ttl=_FILE_LIST_CACHE_TTL_SECONDS)
+_file_list_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+_file_list_generation: Dict[str, int] = {}
+
+
+def _invalidate_file_list_cache(
+    *tenant_ids: Optional[str],
+    collection_name: Optional[str] = None,
+    payload: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Drop cached/in-flight listings (and search results) so reads reflect a mutation.
+
+    A mutated Tier-1 point, or one flagged is_global, also drops the "global" listing.
+    """
+    if collection_name == TIER_1_COLLECTION or bool((payload or {}).get("is_global")):
+        tenant_ids = (*tenant_ids, "global")
+    for tenant_id in tenant_ids:
+        if not tenant_id:
+            continue
+        _file_list_cache.pop(tenant_id, None)
+        _file_list_inflight.pop(tenant_id, None)
+        _file_list_generation[tenant_id] = _file_list_generation.get(tenant_id, 0) + 1
+    invalidate_search_results(*tenant_ids)
+
+
+def _store_file_list_result(
+    tenant_id: str,
+    generation: int,
+    future: "asyncio.Future[Dict[str, Any]]",
+) -> None:
+    if _file_list_inflight.get(tenant_id) is future:
+        _file_list_inflight.pop(tenant_id, None)
+    if future.cancelled() or future.exception() is not None:
+        return
+    # A mutation during the scroll bumps the generation; don't cache the stale result.
+    if _file_list_generation.get(tenant_id, 0) == generation:
+        _file_list_cache[tenant_id] = future.result()
+
+
+def _file_extension(filename: str) -> str:
+    """Lower-cased extension without the dot (Path.suffix semantics, no Path allocation)."""
+    head, sep, tail = filename.rpartition(".")
+    if not sep or not head or head.endswith("/") or "/" in tail:
+        return ""
+    return tail.lower()
+
+
 def _normalize_user_id(value: Any) -> str:
     return str(value or "").strip().lower()
 
@@ -356,11 +434,10 @@ async def get_tenant_files(
     
     SECURITY: Tenant membership is enforced via verify_tenant_access dependency.
     """
-    settings = get_settings()
 
     try:
         files = await vector_service.list_tenant_files(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             tenant_id=tenant_id,
             limit=20,
         )
@@ -383,12 +460,16 @@ async def get_tenant_files(
     return FilesResponse(files=file_items)
 
 
-@router.get("/list", response_model=FileListResponse)
+@router.get(
+    "/list",
+    response_class=ORJSONResponse,
+    responses={200: {"model": FileListResponse}},
+)
 async def list_files(
     tenant_id: str = Query(..., description="Tenant/client ID to filter files, or 'global' for firm archive"),
     current_user: Dict = Depends(verify_tenant_access),
     graph: GraphService = Depends(get_graph),
-) -> FileListResponse:
+) -> ORJSONResponse:
     """
     List files from Qdrant filtered by tenant_id (source of truth).
     
@@ -404,9 +485,7 @@ async def list_files(
     """
     # Log user_id + tenant_id for every request
     user_id = current_user.get("id", "unknown")
-    print(f"List files request: user_id={user_id}, tenant_id={tenant_id}")
-    
-    settings = get_settings()
+    logger.info("list_files_request user_id=%s tenant_id=%s", user_id, tenant_id)
     
     # Enforce tenant_id requirement
     if not tenant_id or not tenant_id.strip():
@@ -415,14 +494,37 @@ async def list_files(
             detail="tenant_id is required for file listing. Cannot perform unfiltered query."
         )
     
-    files = []
+    cached = _file_list_cache.get(tenant_id)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    # Concurrent identical polls share one in-flight Qdrant scroll.
+    inflight = _file_list_inflight.get(tenant_id)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_load_file_list(tenant_id=tenant_id, graph=graph))
+        _file_list_inflight[tenant_id] = inflight
+        inflight.add_done_callback(
+            partial(
+                _store_file_list_result,
+                tenant_id,
+                _file_list_generation.get(tenant_id, 0),
+            )
+        )
+    return ORJSONResponse(await asyncio.shield(inflight))
+
+
+async def _load_file_list(*, tenant_id: str, graph: GraphService) -> Dict[str, Any]:
+    """Build the /list response body (FileListResponse shape) for a tenant or the global archive."""
+    # Items are plain dicts: payloads come from our own Qdrant writes, and the route returns
+    # an ORJSONResponse directly, so this (up to 1000-row) response is never validated.
+    files: List[Dict[str, Any]] = []
     
     try:
         # Special handling for global archive
         if tenant_id == "global":
             # Query Tier 1 collection for global files
             global_files = await vector_service.list_global_files(
-                collection_name=settings.QDRANT_COLLECTION_TIER_1,
+                collection_name=TIER_1_COLLECTION,
                 limit=1000,
             )
             origin_campaign_ids = sorted(
@@ -445,14 +547,14 @@ async def list_files(
                 origin_campaign_id = _resolve_origin_campaign_id(file_data)
                 
                 # Determine file type from extension or payload
-                extension = Path(filename).suffix.lower().lstrip(".")
+                extension = _file_extension(filename)
                 file_type = file_data.get("type") or extension or "unknown"
                 
                 # Ensure date is always a string
                 promoted_at = file_data.get("promoted_at")
                 date = promoted_at if isinstance(promoted_at, str) and promoted_at else datetime.now().isoformat()
                 
-                files.append(FileListItem(
+                files.append(_file_list_item(
                     id=file_data.get("id", ""),
                     name=filename,
                     url=file_data.get("url", ""),
@@ -482,9 +584,12 @@ async def list_files(
                     extracted_char_count=file_data.get("extracted_char_count"),
                     chunk_count=file_data.get("chunk_count"),
                 ))
+            # Sort by date (newest first)
+            files.sort(key=lambda x: x["date"], reverse=True)
         else:
+            # list_tenant_files already returns files newest first.
             tenant_files = await vector_service.list_tenant_files(
-                collection_name=settings.QDRANT_COLLECTION_TIER_2,
+                collection_name=TIER_2_COLLECTION,
                 tenant_id=tenant_id,
                 limit=1000,
             )
@@ -492,9 +597,9 @@ async def list_files(
                 filename = file_data.get("filename")
                 if not filename:
                     continue
-                extension = Path(filename).suffix.lower().lstrip(".")
+                extension = _file_extension(filename)
                 file_type = file_data.get("type") or extension or "unknown"
-                files.append(FileListItem(
+                files.append(_file_list_item(
                     id=file_data.get("id", ""),
                     name=filename,
                     url=file_data.get("url", ""),
@@ -521,18 +626,15 @@ async def list_files(
                     chunk_count=file_data.get("chunk_count"),
                 ))
         
-        # Sort by date (newest first)
-        files.sort(key=lambda x: x.date, reverse=True)
-        
     except Exception as exc:
         # If Qdrant query fails, raise HTTPException instead of returning empty list
-        logger.error(f"Error fetching files from Qdrant: {exc}", exc_info=True)
+        logger.error("list_files_qdrant_failed tenant_id=%s error=%s", tenant_id, exc, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Error fetching files from Qdrant: {exc}"
         ) from exc
     
-    return FileListResponse(files=files)
+    return {"files": files}
 
 
 @router.post("/files/{file_id}/firm-archive/remove", response_model=DeleteResponse)
@@ -546,16 +648,16 @@ async def remove_or_delete_firm_archive_file(
     if tenant_id != "global":
         raise HTTPException(status_code=400, detail="tenant_id must be 'global' for firm archive removal actions.")
 
-    settings = get_settings()
-    await _get_file_point_for_tenant(
+    _, global_payload, _ = await _get_file_point_for_tenant(
         file_id=file_id,
         tenant_id="global",
-        collection_name=settings.QDRANT_COLLECTION_TIER_1,
+        collection_name=TIER_1_COLLECTION,
     )
 
     removed_from_global = await vector_service.remove_from_global_archive(file_id)
     if not removed_from_global:
         raise HTTPException(status_code=404, detail=f"File {file_id} is not currently promoted in Firm Archive.")
+    _invalidate_file_list_cache("global", _resolve_origin_campaign_id(global_payload))
 
     if request.mode == "archive_only":
         return DeleteResponse(
@@ -567,7 +669,7 @@ async def remove_or_delete_firm_archive_file(
     try:
         await delete_file(
             file_id=file_id,
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
         )
         source_deletion_note = "Source campaign document and storage were deleted."
     except HTTPException as exc:
@@ -592,9 +694,8 @@ async def audit_firm_documents(
     if tenant_id != "global":
         raise HTTPException(status_code=400, detail="tenant_id must be 'global' for this audit endpoint.")
 
-    settings = get_settings()
     global_files = await vector_service.list_global_files(
-        collection_name=settings.QDRANT_COLLECTION_TIER_1,
+        collection_name=TIER_1_COLLECTION,
         limit=5000,
     )
 
@@ -642,13 +743,16 @@ async def audit_firm_documents(
     )
 
 
-@router.get("/files/messaging/list", response_model=FileListResponse)
+@router.get(
+    "/files/messaging/list",
+    response_class=ORJSONResponse,
+    responses={200: {"model": FileListResponse}},
+)
 async def list_messaging_files(
     tenant_id: str = Query(..., description="Tenant/client ID for campaign Messaging Studio"),
     current_user: Dict = Depends(verify_tenant_access),
-) -> FileListResponse:
+) -> ORJSONResponse:
     """List Messaging Studio files visible to the current user only."""
-    settings = get_settings()
     if tenant_id == "global":
         raise HTTPException(status_code=400, detail="Messaging Studio is campaign-scoped.")
     user_id = _normalize_user_id(current_user.get("id"))
@@ -657,21 +761,21 @@ async def list_messaging_files(
 
     try:
         tenant_files = await vector_service.list_tenant_files(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             tenant_id=tenant_id,
             limit=1000,
         )
-        files: List[FileListItem] = []
+        files: List[Dict[str, Any]] = []
         for file_data in tenant_files:
             if not _is_messaging_visible_to_user(file_data, user_id):
                 continue
             filename = file_data.get("filename")
             if not filename:
                 continue
-            extension = Path(filename).suffix.lower().lstrip(".")
+            extension = _file_extension(filename)
             file_type = file_data.get("type") or extension or "unknown"
             files.append(
-                FileListItem(
+                _file_list_item(
                     id=file_data.get("id", ""),
                     name=filename,
                     url=file_data.get("url", ""),
@@ -701,8 +805,7 @@ async def list_messaging_files(
                     chunk_count=file_data.get("chunk_count"),
                 )
             )
-        files.sort(key=lambda x: x.date, reverse=True)
-        return FileListResponse(files=files)
+        return ORJSONResponse({"files": files})
     except HTTPException:
         raise
     except Exception as exc:
@@ -790,7 +893,7 @@ async def create_file_comment(
         }
         comments.append(new_comment)
         await vector_service.client.set_payload(
-            collection_name=get_settings().QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             payload={"comments": comments},
             points=[file_id],
         )
@@ -849,7 +952,7 @@ async def get_file_preview_url(
     """
     settings = get_settings()
     collection_name = (
-        settings.QDRANT_COLLECTION_TIER_1 if tenant_id == "global" else settings.QDRANT_COLLECTION_TIER_2
+        TIER_1_COLLECTION if tenant_id == "global" else TIER_2_COLLECTION
     )
 
     try:
@@ -923,7 +1026,7 @@ async def upload_file(
     """
     # Log user_id + tenant_id for every request
     user_id = current_user.get("id", "unknown")
-    print(f"Upload file request: user_id={user_id}, tenant_id={tenant_id}")
+    logger.info("upload_file_request user_id=%s tenant_id=%s", user_id, tenant_id)
 
     # SECURITY: verify_tenant_access cannot read multipart FormData tenant_id automatically.
     # Enforce membership explicitly using the parsed form tenant_id.
@@ -947,36 +1050,12 @@ async def upload_file(
             ),
         )
 
-    # Hard server-side file size limit (prevents memory/OCR/ingestion failures)
-    max_bytes = int(settings.MAX_UPLOAD_MB) * 1024 * 1024
-
-    # If client provided size metadata, enforce immediately
-    file_size = getattr(file, "size", None)
-    if isinstance(file_size, int) and file_size > max_bytes:
-        raise HTTPException(
-            status_code=413,
-            detail=f"This file is too large. Current limit is {settings.MAX_UPLOAD_MB} MB.",
-        )
-
-    # Always enforce by reading in chunks (covers missing/incorrect size metadata)
-    total = 0
-    try:
-        while True:
-            chunk = await file.read(1024 * 1024)  # 1MB chunks
-            if not chunk:
-                break
-            total += len(chunk)
-            if total > max_bytes:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"This file is too large. Current limit is {settings.MAX_UPLOAD_MB} MB.",
-                )
-    finally:
-        # Reset stream for downstream ingestion
-        await file.seek(0)
+    # Hard server-side file size limit (prevents memory/OCR/ingestion failures).
+    # The bounded read is the one read of the upload; its bytes go straight to ingestion.
+    file_content = await read_upload_bounded(file, MAX_UPLOAD_BYTES)
 
     # Parse comma-separated tags
-    tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else []
+    tag_list = [tag for tag in (raw.strip() for raw in tags.split(",")) if tag] if tags else []
     
     try:
         result = await process_upload(
@@ -984,15 +1063,17 @@ async def upload_file(
             tenant_id=tenant_id,
             tags=tag_list,
             overwrite=overwrite,
+            file_content=file_content,
         )
+        _invalidate_file_list_cache(tenant_id)
         # Keep campaign card activity reads cheap by maintaining denormalized last_activity_at.
         if tenant_id != "global":
             await graph.touch_campaign_last_activity(tenant_id)
         try:
             target_collection = (
-                settings.QDRANT_COLLECTION_TIER_1
+                TIER_1_COLLECTION
                 if tenant_id == "global"
-                else settings.QDRANT_COLLECTION_TIER_2
+                else TIER_2_COLLECTION
             )
             uploaded_id = str(result.get("id") or "")
             uploaded_records = await vector_service.client.retrieve(
@@ -1074,11 +1155,9 @@ async def rename_file(
     
     Validates that the extension is preserved to prevent file corruption.
     """
-    settings = get_settings()
-    
     # Validate extension preservation
-    old_ext = Path(request.old_name).suffix.lower()
-    new_ext = Path(request.new_name).suffix.lower()
+    old_ext = _file_extension(request.old_name)
+    new_ext = _file_extension(request.new_name)
     
     if old_ext != new_ext:
         raise HTTPException(
@@ -1106,10 +1185,10 @@ async def rename_file(
         )
         
         scroll_result = await vector_service.client.scroll(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             scroll_filter=tenant_filter,
             limit=1,
-            with_payload=True,
+            with_payload=["url"],
             with_vectors=False,
         )
         
@@ -1127,10 +1206,11 @@ async def rename_file(
         # Update filename in Qdrant payload
         # Note: The GCS URL remains the same, only the display name changes
         await vector_service.client.set_payload(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             payload={"filename": request.new_name},
             points=[file_id]
         )
+        _invalidate_file_list_cache(tenant_id)
         
         return RenameResponse(
             status="success",
@@ -1160,15 +1240,17 @@ async def delete_file_endpoint(
     SECURITY: Tenant membership is enforced by retrieving the file's client_id
     from Tier 2 and verifying the user has access to that tenant.
     """
-    settings = get_settings()
     user_id = current_user.get("id", "unknown")
     
     try:
-        # Step 1: Retrieve the file point from Tier 2 to get tenant_id from payload
+        # Step 1: Retrieve the file point from Tier 2 to get tenant_id from payload.
+        # Only ownership, storage and promotion fields are needed; the payload is reused by
+        # delete_file and by the list-cache invalidation (is_global also clears "global").
         points = await vector_service.client.retrieve(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             ids=[file_id],
-            with_payload=True,
+            with_payload=["client_id", "url", "is_global"],
+            with_vectors=False,
         )
         
         # Step 2: Check if file exists
@@ -1192,11 +1274,13 @@ async def delete_file_endpoint(
         # Step 4: Verify tenant membership before deleting
         await check_tenant_membership(user_id, tenant_id, request)
         
-        # Step 5: Delete the file
+        # Step 5: Delete the file (reuses the payload loaded in step 1)
         await delete_file(
             file_id=file_id,
-            collection_name=settings.QDRANT_COLLECTION_TIER_2
+            collection_name=TIER_2_COLLECTION,
+            payload=payload,
         )
+        _invalidate_file_list_cache(tenant_id, payload=payload)
         return DeleteResponse(
             status="success",
             message=f"File {file_id} deleted successfully"
@@ -1225,17 +1309,16 @@ async def untag_file_endpoint(
     
     If tag is "*" or "all", removes all tags from the file.
     """
-    settings = get_settings()
-    
     try:
         await _get_file_point_for_tenant(file_id=file_id, tenant_id=tenant_id)
-        if request.tag == "*" or request.tag.lower() == "all":
+        if request.tag.casefold() in _UNTAG_ALL_SENTINELS:
             # Clear all tags
             await untag_file(
                 file_id=file_id,
                 tag=None,  # None means clear all
-                collection_name=settings.QDRANT_COLLECTION_TIER_2
+                collection_name=TIER_2_COLLECTION
             )
+            _invalidate_file_list_cache(tenant_id)
             return DeleteResponse(
                 status="success",
                 message=f"All tags removed from file {file_id}"
@@ -1244,8 +1327,9 @@ async def untag_file_endpoint(
             await untag_file(
                 file_id=file_id,
                 tag=request.tag,
-                collection_name=settings.QDRANT_COLLECTION_TIER_2
+                collection_name=TIER_2_COLLECTION
             )
+            _invalidate_file_list_cache(tenant_id)
             return DeleteResponse(
                 status="success",
                 message=f"Tag '{request.tag}' removed from file {file_id}"
@@ -1271,8 +1355,6 @@ async def update_tags_endpoint(
     
     This replaces the entire tags list with the provided tags array.
     """
-    settings = get_settings()
-    
     try:
         _, current_payload, _ = await _get_file_point_for_tenant(file_id=file_id, tenant_id=tenant_id)
         current_tags = current_payload.get("tags") if isinstance(current_payload.get("tags"), list) else []
@@ -1290,10 +1372,11 @@ async def update_tags_endpoint(
 
         # Update tags in Qdrant
         await vector_service.client.set_payload(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
             payload=payload_update,
             points=[file_id]
         )
+        _invalidate_file_list_cache(tenant_id, payload=current_payload)
         
         return DeleteResponse(
             status="success",
@@ -1321,31 +1404,31 @@ async def assign_file_endpoint(
     
     This updates the file's status and adds the assignee to the file's metadata.
     """
-    settings = get_settings()
-    
     try:
         # Get current payload
         _, current_payload, _ = await _get_file_point_for_tenant(
             file_id=file_id,
             tenant_id=tenant_id,
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
         )
         actor_user_id = _normalize_user_id(current_user.get("id"))
         previous_assignee = _normalize_user_id(current_payload.get("assignee"))
         previous_status = str(current_payload.get("status") or "").strip().lower()
         assignee_value = _normalize_user_id(request.assignee)
+        # Lists are normalized (deduped) once; the already-normalized assignee is appended only if new.
         assigned_to = _normalize_user_id_list(current_payload.get("assigned_to"))
-        if assignee_value:
-            assigned_to = _normalize_user_id_list([*assigned_to, assignee_value])
+        if assignee_value and assignee_value not in assigned_to:
+            assigned_to.append(assignee_value)
 
-        tags = current_payload.get("tags") if isinstance(current_payload.get("tags"), list) else []
+        tags = current_payload.get("tags")
+        if not isinstance(tags, list):
+            tags = []
         messaging_visible_ids = _normalize_user_id_list(current_payload.get("messaging_visible_user_ids"))
-        if "Messaging" in tags and assignee_value:
-            messaging_visible_ids = _normalize_user_id_list([*messaging_visible_ids, assignee_value])
+        if assignee_value and "Messaging" in tags and assignee_value not in messaging_visible_ids:
+            messaging_visible_ids.append(assignee_value)
         
-        # Update payload with assignee and status
-        updated_payload = {
-            **current_payload,
+        # set_payload merges keys server-side, so only the changed fields are sent.
+        payload_update = {
             "status": request.status,
             "assignee": assignee_value or "",
             "assigned_to": assigned_to,
@@ -1354,10 +1437,11 @@ async def assign_file_endpoint(
         
         # Update Qdrant payload
         await vector_service.client.set_payload(
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
-            payload=updated_payload,
+            collection_name=TIER_2_COLLECTION,
+            payload=payload_update,
             points=[file_id]
         )
+        _invalidate_file_list_cache(tenant_id, payload=current_payload)
 
         # Best-effort campaign event for dashboard/feed realism.
         try:
@@ -1463,20 +1547,19 @@ async def promote_to_archive(
     """
     # Log user_id for every request
     user_id = current_user.get("id", "unknown")
-    print(f"Promote to archive request: user_id={user_id}, file_id={file_id}")
-    settings = get_settings()
-    
+    logger.info("promote_to_archive_request user_id=%s file_id=%s", user_id, file_id)
     try:
         await _get_file_point_for_tenant(
             file_id=file_id,
             tenant_id=tenant_id,
-            collection_name=settings.QDRANT_COLLECTION_TIER_2,
+            collection_name=TIER_2_COLLECTION,
         )
         await vector_service.promote_to_global(
             file_id=file_id,
             is_golden=request.is_golden,
             source_campaign_id=tenant_id,
         )
+        _invalidate_file_list_cache("global")
         
         golden_text = " (marked as Golden Standard)" if request.is_golden else ""
         return DeleteResponse(
@@ -1534,13 +1617,6 @@ async def toggle_ai_enabled(
                 }
             )
 
-        # Update ai_enabled flag in Qdrant payload
-        await vector_service.client.set_payload(
-            collection_name=resolved_collection,
-            payload=payload_update,
-            points=[file_id]
-        )
-
         # Keep chunk records aligned with parent AI toggle.
         chunk_filter = Filter(
             must=[
@@ -1585,12 +1661,26 @@ async def toggle_ai_enabled(
                 point for point in points_with_payload
                 if (point.payload or {}).get("record_type") == "chunk"
             ]
+        # Parent flag and chunk flags go out in a single Qdrant round trip.
+        update_operations: List[Any] = [
+            models.SetPayloadOperation(
+                set_payload=models.SetPayload(payload=payload_update, points=[file_id])
+            )
+        ]
         if chunk_points:
-            await vector_service.client.set_payload(
-                collection_name=resolved_collection,
-                payload={"ai_enabled": request.ai_enabled},
-                points=[str(point.id) for point in chunk_points],
+            update_operations.append(
+                models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload={"ai_enabled": request.ai_enabled},
+                        points=[str(point.id) for point in chunk_points],
+                    )
+                )
             )
+        await vector_service.client.batch_update_points(
+            collection_name=resolved_collection,
+            update_operations=update_operations,
+        )
+        _invalidate_file_list_cache(tenant_id, collection_name=resolved_collection, payload=payload)
 
         # Turning Riley Memory ON is the explicit ingestion trigger.
         if request.ai_enabled:
@@ -1622,14 +1712,62 @@ class OCRResponse(BaseModel):
     ocr_status: str
 
 
+async def _finalize_ocr(
+    *,
+    file_id: str,
+    ocr_text: str,
+    merged_payload: Dict[str, Any],
+    collection_name: str,
+    tenant_id: str,
+) -> None:
+    """Embed OCR text and upsert the point with its merged payload.
+
+    Runs after the response by default; raises nothing. A failure marks ocr_status="failed".
+    """
+    try:
+        # Generate new embedding from OCR text for improved retrieval
+        # Truncate to 9000 chars (same as ingestion) for embedding
+        new_vector = await _generate_embedding(ocr_text[:9000])
+
+        # Update the point with new vector and merged payload
+        await vector_service.client.upsert(
+            collection_name=collection_name,
+            points=[PointStruct(id=file_id, vector=new_vector, payload=merged_payload)]
+        )
+    except Exception as exc:
+        logger.error("ocr_finalize_failed file_id=%s error=%s", file_id, exc)
+        try:
+            await vector_service.client.set_payload(
+                collection_name=collection_name,
+                payload={
+                    "ocr_status": "failed",
+                    "ocr_error": f"OCR result could not be saved: {exc}",
+                },
+                points=[file_id]
+            )
+        except Exception as status_exc:
+            logger.warning(
+                "ocr_failed_status_write_failed file_id=%s error=%s",
+                file_id,
+                str(status_exc),
+            )
+    finally:
+        _invalidate_file_list_cache(tenant_id, collection_name=collection_name, payload=merged_payload)
+
+
 # SINGLE SOURCE OF TRUTH: Only ONE OCR endpoint exists in the codebase
 # This endpoint handles: cache check, queued status, GCS download, OCR execution,
 # payload merge, preserves ai_enabled toggle state, vector embedding update, and upsert.
 @router.post("/files/{file_id}/ocr", response_model=OCRResponse)
 async def request_ocr(
     file_id: str,
+    background_tasks: BackgroundTasks,
     collection: str = Query(..., description="Collection name: 'tier_1' or 'tier_2'"),
     tenant_id: str = Query(..., description="Tenant/client ID that owns this file"),
+    wait_for_index: bool = Query(
+        False,
+        description="Wait for the updated vector/payload to be written before responding",
+    ),
     current_user: Dict = Depends(verify_tenant_access),
     graph: GraphService = Depends(get_graph),
 ) -> OCRResponse:
@@ -1642,13 +1780,15 @@ async def request_ocr(
     1. Validates system-wide OCR is enabled
     2. Checks if OCR is already complete (returns cached result immediately)
     3. Sets status to "queued" and persists
-    4. Downloads file bytes from GCS
+    4. Hands the GCS object to Vision (downloads bytes only for non-GCS URLs)
     5. Runs OCR extraction
     6. On success:
        - Merges OCR fields into existing payload (preserves all existing fields)
        - Preserves existing ai_enabled value (does not auto-enable Riley Memory)
        - Generates new embedding from OCR text (truncated to 9000 chars)
        - Upserts PointStruct with NEW vector and MERGED payload
+       - Embedding + upsert run after the response unless wait_for_index=true; a failed
+         background write marks ocr_status="failed"
     7. On failure: Sets ocr_status="failed" and stores error
     
     OCR only runs if:
@@ -1659,6 +1799,7 @@ async def request_ocr(
     Args:
         file_id: The Qdrant point ID (UUID) of the file
         collection: Collection name - 'tier_1' for global archive, 'tier_2' for campaign assets
+        wait_for_index: Embed + upsert before responding (read-after-write) instead of in the background
     
     Returns:
         OCRResponse with OCR status and extracted text (if successful)
@@ -1681,8 +1822,8 @@ async def request_ocr(
     
     # Determine collection name
     collection_name = (
-        settings.QDRANT_COLLECTION_TIER_1 if collection == "tier_1"
-        else settings.QDRANT_COLLECTION_TIER_2
+        TIER_1_COLLECTION if collection == "tier_1"
+        else TIER_2_COLLECTION
     )
     
     try:
@@ -1714,17 +1855,6 @@ async def request_ocr(
                 ocr_status="complete"
             )
         
-        # Set status to queued
-        await vector_service.client.set_payload(
-            collection_name=collection_name,
-            payload={
-                "ocr_enabled": True,
-                "ocr_status": "queued",
-                "ocr_error": None,
-            },
-            points=[file_id]
-        )
-        
         # Get file content from GCS
         file_url = payload.get("url")
         if not file_url:
@@ -1733,12 +1863,51 @@ async def request_ocr(
                 detail=f"File URL not found for ID {file_id}"
             )
         
-        # Download file from GCS
-        file_content = await StorageService.download_file(file_url)
+        # Set status to queued while the GCS download runs; the status write is
+        # best-effort and must not fail the OCR request.
+        async def _mark_ocr_queued() -> None:
+            # Retries/polls on an already-queued file would rewrite identical fields.
+            if (
+                payload.get("ocr_status") == "queued"
+                and payload.get("ocr_enabled") is True
+                and payload.get("ocr_error") is None
+            ):
+                return
+            try:
+                await vector_service.client.set_payload(
+                    collection_name=collection_name,
+                    payload={
+                        "ocr_enabled": True,
+                        "ocr_status": "queued",
+                        "ocr_error": None,
+                    },
+                    points=[file_id]
+                )
+            except Exception as exc:
+                logger.warning(
+                    "ocr_queued_status_write_failed file_id=%s error=%s",
+                    file_id,
+                    str(exc),
+                )
+        
+        # gs:// sources are read by Vision directly; anything else is downloaded first.
+        source_uri = gcs_uri_from_url(file_url, settings.GCS_BUCKET_NAME)
+        file_content: Optional[bytes] = None
+        if source_uri:
+            await _mark_ocr_queued()
+        else:
+            file_content, _ = await asyncio.gather(
+                StorageService.download_file(file_url),
+                _mark_ocr_queued(),
+            )
+        _invalidate_file_list_cache(tenant_id, collection_name=collection_name, payload=payload)
         
         # Perform OCR
         try:
-            ocr_result = await run_ocr(file_content, max_chars=settings.OCR_MAX_CHARS)
+            if file_content is None:
+                ocr_result = await run_ocr_from_gcs(source_uri, max_chars=settings.OCR_MAX_CHARS)
+            else:
+                ocr_result = await run_ocr(file_content, max_chars=settings.OCR_MAX_CHARS)
             
             # Update payload with OCR results
             ocr_extracted_at = datetime.now().isoformat()
@@ -1759,22 +1928,24 @@ async def request_ocr(
                 "content_preview": ocr_result["text"][:1000],
             })
             
-            # Generate new embedding from OCR text for improved retrieval
-            # Truncate to 9000 chars (same as ingestion) for embedding
-            ocr_text_for_embedding = ocr_result["text"][:9000]
-            new_vector = await _generate_embedding(ocr_text_for_embedding)
-            
-            # Update the point with new vector and merged payload
-            updated_point = PointStruct(
-                id=file_id,
-                vector=new_vector,
-                payload=merged_payload
-            )
-            
-            await vector_service.client.upsert(
-                collection_name=collection_name,
-                points=[updated_point]
-            )
+            if wait_for_index:
+                # Read-after-write callers keep the old inline behavior, including the
+                # failed-status handling below when embedding or upsert raises.
+                new_vector = await _generate_embedding(ocr_result["text"][:9000])
+                await vector_service.client.upsert(
+                    collection_name=collection_name,
+                    points=[PointStruct(id=file_id, vector=new_vector, payload=merged_payload)]
+                )
+                _invalidate_file_list_cache(tenant_id, collection_name=collection_name, payload=payload)
+            else:
+                background_tasks.add_task(
+                    _finalize_ocr,
+                    file_id=file_id,
+                    ocr_text=ocr_result["text"],
+                    merged_payload=merged_payload,
+                    collection_name=collection_name,
+                    tenant_id=tenant_id,
+                )
             try:
                 pages_processed = 1
                 requests_count = 1
@@ -1817,7 +1988,11 @@ async def request_ocr(
             
             return OCRResponse(
                 status="success",
-                message="OCR completed successfully and vector embedding updated",
+                message=(
+                    "OCR completed successfully and vector embedding updated"
+                    if wait_for_index
+                    else "OCR completed successfully; vector embedding update scheduled"
+                ),
                 ocr_text=ocr_result["text"],
                 ocr_confidence=ocr_result["confidence"],
                 ocr_language=ocr_result["language"],
@@ -1834,13 +2009,14 @@ async def request_ocr(
                 },
                 points=[file_id]
             )
+            _invalidate_file_list_cache(tenant_id, collection_name=collection_name, payload=payload)
             raise HTTPException(
                 status_code=500,
                 detail=error_msg
             ) from e
         except Exception as e:
             error_msg = f"OCR processing failed: {str(e)}"
-            logger.error(f"OCR failed for file {file_id}: {e}")
+            logger.error("ocr_failed file_id=%s error=%s", file_id, e)
             await vector_service.client.set_payload(
                 collection_name=collection_name,
                 payload={
@@ -1849,6 +2025,7 @@ async def request_ocr(
                 },
                 points=[file_id]
             )
+            _invalidate_file_list_cache(tenant_id, collection_name=collection_name, payload=payload)
             raise HTTPException(
                 status_code=500,
                 detail=error_msg
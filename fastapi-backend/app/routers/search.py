@@ -1,23 +1,58 @@
-from typing import Any, Dict, List
+import asyncio
+from contextlib import suppress
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from qdrant_client.http.models import Filter, FieldCondition, MatchValue
 
 from app.core.config import get_settings
 from app.dependencies.auth import verify_clerk_token, check_tenant_membership
-from app.services.genai_client import get_genai_client
+from app.services.genai_client import embed_batched
 from app.services.llm_cost_guardrail import (
     GUARDRAIL_USER_MESSAGE,
     LLMCostGuardrailExceeded,
     enforce_monthly_llm_cost_guardrail,
 )
 from app.services.qdrant import vector_service
+from app.services.query_cache import (
+    EMBED_CACHE,
+    GLOBAL_SCOPE,
+    RESULT_CACHE,
+    QuantizedEmbedding,
+    dequantize_embedding,
+    embed_cache_key,
+    find_similar_embedding,
+    get_or_compute,
+    normalize_query_text,
+    quantize_embedding,
+    remember_embedding,
+    result_cache_key,
+)
 
 
 router = APIRouter()
 
+# Settings are process-wide (get_settings is cached), so hot-path constants are bound once.
+_SETTINGS = get_settings()
+TIER_1_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_1
+TIER_2_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_2
+EMBEDDING_MODEL = _SETTINGS.EMBEDDING_MODEL
+EXPECTED_EMBEDDING_DIM = _SETTINGS.EMBEDDING_DIM
+
+# SECURITY: Always require is_global == true filter for global search.
+# Shared across requests; search_global derives a new Filter and never mutates it.
+_GLOBAL_FILTER = Filter(
+    must=[
+        FieldCondition(
+            key="is_global",
+            match=MatchValue(value=True),
+        )
+    ]
+)
+
 
 class SearchRequest(BaseModel):
     query_text: str = Field(..., max_length=2000, description="Search query text (max 2000 characters)")
@@ -25,9 +60,18 @@ class SearchRequest(BaseModel):
 
 
 class SearchResponse(BaseModel):
+    """Response schema (OpenAPI). Handlers return ORJSONResponse directly, so the
+    results payload from Qdrant is serialized as-is instead of being re-validated."""
+
+    model_config = ConfigDict(defer_build=True)
+
     results: List[Dict[str, Any]]
 
 
+def _search_response(results: List[Dict[str, Any]]) -> ORJSONResponse:
+    return ORJSONResponse({"results": results})
+
+
 class GlobalSearchRequest(BaseModel):
     """Request model for global (firm-wide) search.
 
@@ -47,118 +91,158 @@ class GlobalSearchRequest(BaseModel):
     )
 
 
-def _embed_query_text_sync(text: str) -> List[float]:
-    """Embed the query text using Gemini text embeddings.
-    
-    Uses the new google-genai SDK via the shared client.
-    This function is synchronous and should be run in a threadpool.
+def _reject_degenerate_query(text: str) -> None:
+    """400 for queries with nothing to embed (blank, punctuation-only, one repeated char).
+
+    These would otherwise still cost a Gemini embedding and a Qdrant search.
     """
-    settings = get_settings()
-    model_name = settings.EMBEDDING_MODEL
-    
-    try:
-        # Get client (lazy initialization)
-        client = get_genai_client()
-        # Use the shared client to generate embedding
-        response = client.models.embed_content(
-            model=model_name,
-            contents=text
-        )
-        
-        # Extract embedding vector from response
-        if not response.embeddings or len(response.embeddings) == 0:
-            raise RuntimeError(
-                f"Embedding response did not contain any embeddings for model '{model_name}'."
-            )
-        
-        embedding = response.embeddings[0].values
-        if not isinstance(embedding, list):
-            raise RuntimeError(
-                f"Embedding response did not contain a valid vector for model '{model_name}'."
-            )
-        
-        return embedding
-    except RuntimeError:
-        # Re-raise RuntimeError as-is
-        raise
-    except Exception as exc:
-        error_msg = (
-            f"Query embedding failed using model '{model_name}': {exc}"
+    normalized = normalize_query_text(text)
+    if not any(ch.isalnum() for ch in normalized) or len(set(normalized)) == 1:
+        raise HTTPException(
+            status_code=400,
+            detail="query_text must contain searchable text",
         )
-        raise RuntimeError(error_msg) from exc
 
 
-async def _embed_query_text(content: str) -> List[float]:
+async def _embed_query_text(content: str) -> np.ndarray:
     """Embed the query text using Gemini text embeddings.
 
-    Wraps _embed_query_text_sync in a threadpool for async execution.
+    Uses the shared micro-batching embedder from genai_client. Embeddings are
+    cached per normalized query text (with near-duplicate reuse), so repeated queries
+    skip the Gemini call.
+
+    The cache holds int8-quantized vectors; every caller (including the one that paid for
+    the Gemini call) gets the same dequantized float32 vector, so results stay consistent.
     """
-    try:
+    cache_key = embed_cache_key(EMBEDDING_MODEL, content)
+
+    async def _compute() -> QuantizedEmbedding:
+        similar = find_similar_embedding(EMBEDDING_MODEL, content)
+        if similar is not None:
+            return similar
         await enforce_monthly_llm_cost_guardrail()
-        # Run blocking GenAI call in threadpool to avoid blocking event loop
-        return await run_in_threadpool(_embed_query_text_sync, content)
+        # Coalesced with concurrent searches into one embed_content call (run in a threadpool)
+        values = await embed_batched(content, EMBEDDING_MODEL)
+        embedding = quantize_embedding(np.asarray(values, dtype=np.float32))
+        remember_embedding(EMBEDDING_MODEL, content, embedding)
+        return embedding
+
+    try:
+        return dequantize_embedding(await get_or_compute(EMBED_CACHE, cache_key, _compute))
     except LLMCostGuardrailExceeded as exc:
         raise RuntimeError(GUARDRAIL_USER_MESSAGE) from exc
     except RuntimeError:
         # Re-raise RuntimeError as-is
         raise
     except Exception as exc:
-        settings = get_settings()
-        model_name = settings.EMBEDDING_MODEL
         error_msg = (
-            f"Query embedding failed using model '{model_name}': {exc}"
+            f"Query embedding failed using model '{EMBEDDING_MODEL}': {exc}"
         )
         raise RuntimeError(error_msg) from exc
 
 
+async def _cancel_membership_check(task: Optional["asyncio.Task[None]"]) -> None:
+    # Awaited so a 403 (or the cancellation) is retrieved, not logged as never retrieved.
+    if task is None:
+        return
+    task.cancel()
+    with suppress(asyncio.CancelledError, HTTPException):
+        await task
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search(
     request: SearchRequest,
     http_request: Request,
     current_user: Dict = Depends(verify_clerk_token)
-) -> SearchResponse:
+) -> ORJSONResponse:
     """Search tenant-scoped vectors using a natural language query.
     
-    SECURITY: Tenant membership is enforced after parsing the request body.
+    SECURITY: Tenant membership is enforced after parsing the request body. A cached answer
+    is settled before any embedding is paid for; otherwise the lookup runs concurrently with
+    query embedding, but nothing is searched or returned until it passes.
     """
+    _reject_degenerate_query(request.query_text)
+
     # Verify tenant membership (tenant_id comes from request body)
     user_id = current_user.get("id", "unknown")
-    await check_tenant_membership(user_id, request.tenant_id, http_request)
-    
+    graph = getattr(http_request.app.state, "graph", None)
+    membership_task: Optional["asyncio.Task[None]"] = None
+    if graph is None or graph.membership_known(user_id, request.tenant_id):
+        # No Neo4j round trip to overlap, so a refused caller never reaches Gemini.
+        await check_tenant_membership(user_id, request.tenant_id, http_request)
+    else:
+        membership_task = asyncio.create_task(
+            check_tenant_membership(user_id, request.tenant_id, http_request)
+        )
+
+    cache_key = result_cache_key(
+        TIER_2_COLLECTION,
+        request.tenant_id,
+        EMBEDDING_MODEL,
+        request.query_text,
+    )
+    cached = RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        if membership_task is not None:
+            await membership_task
+        return _search_response(cached)
+
     try:
         query_vector = await _embed_query_text(request.query_text)
     except RuntimeError as exc:
+        # Don't leave the membership lookup running for a request that already failed.
+        await _cancel_membership_check(membership_task)
         raise HTTPException(
             status_code=500,
             detail=f"Embedding generation failed: {exc}"
         ) from exc
     except Exception as exc:
+        await _cancel_membership_check(membership_task)
         raise HTTPException(
             status_code=500,
             detail=f"Unexpected error during embedding: {exc}"
         ) from exc
 
-    settings = get_settings()
-
-    results = await vector_service.search_silo(
-        collection_name=settings.QDRANT_COLLECTION_TIER_2,
-        query_vector=query_vector,
-        tenant_id=request.tenant_id,
+    if membership_task is not None:
+        await membership_task
+
+    results = await get_or_compute(
+        RESULT_CACHE,
+        cache_key,
+        lambda: vector_service.search_silo(
+            collection_name=TIER_2_COLLECTION,
+            query_vector=query_vector,
+            tenant_id=request.tenant_id,
+        ),
     )
 
-    return SearchResponse(results=results)
+    return _search_response(results)
 
 
 @router.post("/search/global", response_model=SearchResponse)
 async def search_global(
     request: GlobalSearchRequest,
     current_user: Dict = Depends(verify_clerk_token),
-) -> SearchResponse:
+) -> ORJSONResponse:
     """Search global Tier 1 vectors using a natural language query.
 
     SECURITY: This endpoint is authenticated via Clerk but is NOT tenant-scoped.
     Only documents explicitly marked as global (is_global == true) are searched.
     """
+    _reject_degenerate_query(request.query_text)
+
+    cache_key = result_cache_key(
+        TIER_1_COLLECTION,
+        GLOBAL_SCOPE,
+        EMBEDDING_MODEL,
+        request.query_text,
+        request.limit,
+    )
+    cached = RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return _search_response(cached)
+
     try:
         query_vector = await _embed_query_text(request.query_text)
     except RuntimeError as exc:
@@ -173,37 +257,29 @@ async def search_global(
             detail=f"Unexpected error during embedding: {exc}",
         ) from exc
 
-    settings = get_settings()
-
     # Validate embedding dimension matches expected dimension
-    expected_dim = settings.EMBEDDING_DIM
-    if len(query_vector) != expected_dim:
+    if query_vector.shape[0] != EXPECTED_EMBEDDING_DIM:
         raise HTTPException(
             status_code=500,
             detail=(
-                f"Embedding dimension mismatch: got {len(query_vector)} expected {expected_dim}. "
+                f"Embedding dimension mismatch: got {query_vector.shape[0]} "
+                f"expected {EXPECTED_EMBEDDING_DIM}. "
                 f"Check EMBEDDING_MODEL/EMBEDDING_DIM vs Qdrant collection dim."
             ),
         )
 
-    # SECURITY: Always require is_global == true filter for global search
-    global_filter = Filter(
-        must=[
-            FieldCondition(
-                key="is_global",
-                match=MatchValue(value=True),
-            )
-        ]
-    )
-
-    results = await vector_service.search_global(
-        collection_name=settings.QDRANT_COLLECTION_TIER_1,
-        query_vector=query_vector,
-        limit=request.limit,
-        filter=global_filter,
+    results = await get_or_compute(
+        RESULT_CACHE,
+        cache_key,
+        lambda: vector_service.search_global(
+            collection_name=TIER_1_COLLECTION,
+            query_vector=query_vector,
+            limit=request.limit,
+            filter=_GLOBAL_FILTER,
+        ),
     )
 
-    return SearchResponse(results=results)
+    return _search_response(results)
 
 
 
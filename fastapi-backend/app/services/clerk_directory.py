@@ -7,11 +7,65 @@ using the Clerk Backend API.
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
 import requests
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
 
+CLERK_API_BASE_URL = "https://api.clerk.com"
+
+# Lazy singleton - pooled keep-alive connections for async Clerk lookups
+_async_client: Optional[httpx.AsyncClient] = None
+
+# Email lookup cache keyed by lowercased email. Misses get a shorter TTL so a user who
+# signs up right after a failed invite is found quickly (webhooks also invalidate).
+_user_by_email_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)  # 5 minutes
+_user_by_email_miss_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)  # 30 seconds
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get or create the shared async Clerk HTTP client (HTTP/2, keep-alive pool)."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            base_url=CLERK_API_BASE_URL,
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _async_client
+
+
+async def warm_clerk_client() -> None:
+    """Open a pooled connection to Clerk ahead of the first real lookup."""
+    await _get_async_client().head("/")
+
+
+async def close_clerk_client() -> None:
+    """Close the shared async Clerk client (called on application shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+def invalidate_user_directory_cache(
+    email: Optional[str] = None,
+    user_id: Optional[str] = None,
+) -> None:
+    """Drop cached email lookups for an email and/or a Clerk user id."""
+    if email:
+        email_key = email.strip().lower()
+        _user_by_email_cache.pop(email_key, None)
+        _user_by_email_miss_cache.pop(email_key, None)
+    if user_id:
+        stale = [key for key, user in list(_user_by_email_cache.items()) if user.get("id") == user_id]
+        for key in stale:
+            _user_by_email_cache.pop(key, None)
+
 
 def _to_object(value: Any) -> Any:
     """Recursively convert dict/list payloads to attribute-style objects."""
@@ -55,7 +109,7 @@ def _extract_primary_email(user: Any) -> str:
     return ""
 
 
-def find_user_by_email(email: str) -> Optional[Dict[str, str]]:
+async def find_user_by_email(email: str) -> Optional[Dict[str, str]]:
     """Find a user in Clerk by email address.
     
     Uses the Clerk Backend API to search for users by email.
@@ -79,39 +133,42 @@ def find_user_by_email(email: str) -> Optional[Dict[str, str]]:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Clerk secret key not configured. Set CLERK_SECRET_KEY environment variable."
         )
-    
-    # Clerk Backend API endpoint for listing users
-    api_url = "https://api.clerk.com/v1/users"
+
+    cache_key = email.strip().lower()
+    cached_user = _user_by_email_cache.get(cache_key)
+    if cached_user is not None:
+        return dict(cached_user)
+    if cache_key in _user_by_email_miss_cache:
+        return None
     
     headers = {
         "Authorization": f"Bearer {secret_key}",
         "Content-Type": "application/json"
     }
     
-    # Search for users - Clerk API supports query parameter for email search
-    # We'll use the query parameter if available, otherwise search through results
-    params = {
-        "query": email
-    }
+    # Exact-match filter (server-side) instead of the fuzzy `query` search; Clerk stores
+    # addresses lowercased. List form so the key repeats if more emails are ever passed.
+    params = [("email_address", cache_key), ("limit", "1")]
     
     try:
-        response = requests.get(api_url, headers=headers, params=params, timeout=10)
+        # Clerk Backend API endpoint for listing users
+        response = await _get_async_client().get("/v1/users", headers=headers, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         users = _extract_users_payload(data)
         
-        # Find exact email match (case-insensitive)
-        email_lower = email.lower()
+        # Safety net: confirm the primary address matches (case-insensitive). cache_key is
+        # already the normalized email, and each user's primary address is lowercased once.
         for user in users:
             primary_email = _extract_primary_email(user)
-            if primary_email.lower() == email_lower:
+            if primary_email.lower() == cache_key:
                 first_name = str(getattr(user, "first_name", "") or "").strip()
                 last_name = str(getattr(user, "last_name", "") or "").strip()
                 username = str(getattr(user, "username", "") or "").strip()
                 user_id = str(getattr(user, "id", "") or "").strip()
                 full_name = f"{first_name} {last_name}".strip()
-                return {
+                user_info = {
                     "id": user_id,
                     "email": primary_email,
                     "username": username,
@@ -124,11 +181,22 @@ def find_user_by_email(email: str) -> Optional[Dict[str, str]]:
                         or "Unknown user"
                     ),
                 }
+                _user_by_email_cache[cache_key] = user_info
+                return dict(user_info)
         
         # No exact match found
+        _user_by_email_miss_cache[cache_key] = True
         return None
         
-    except requests.exceptions.RequestException as exc:
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code in (401, 403):
+            # Credentials/permissions changed on the Clerk side; don't keep serving old answers.
+            invalidate_user_directory_cache(email=email)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to query Clerk API: {exc}"
+        ) from exc
+    except httpx.HTTPError as exc:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Failed to query Clerk API: {exc}"
@@ -7,9 +7,16 @@ The client is initialized on first use, not at import time, to prevent Cloud Run
 if GOOGLE_API_KEY is missing or there are transient API issues.
 """
 
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from fastapi.concurrency import run_in_threadpool
 from google import genai
 from app.core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 # Lazy singleton pattern - client initialized on first use
 _client = None
 
@@ -43,3 +50,156 @@ def get_genai_client():
             ) from exc
     
     return _client
+
+
+async def warm_genai_client() -> None:
+    """Initialize the client and issue one tiny embedding so the connection is open."""
+    settings = get_settings()
+    await run_in_threadpool(_embed_contents_sync, settings.EMBEDDING_MODEL, ["warmup"])
+
+
+# Micro-batching for single-text embeddings. Concurrent callers enqueue their text and a
+# consumer per lane flushes up to EMBED_MAX_BATCH texts per embed_content call, waiting at
+# most EMBED_MAX_WAIT_SECONDS for a batch to fill. Flushes run as their own tasks, at most
+# EMBED_MAX_CONCURRENT_FLUSHES per lane at once. The queues are bounded for backpressure.
+#
+# Lanes keep interactive query embeddings ("interactive") from queueing behind ingestion
+# chunks ("bulk"): each has its own queue, consumer and flush slots.
+EMBED_MAX_BATCH = 32
+EMBED_MAX_WAIT_SECONDS = 0.010
+EMBED_QUEUE_MAXSIZE = 256
+EMBED_MAX_CONCURRENT_FLUSHES = 4
+EMBED_LANES = ("interactive", "bulk")
+
+_embed_queues: Dict[str, "asyncio.Queue[Tuple[str, str, asyncio.Future]]"] = {}
+_embed_consumers: Dict[str, "asyncio.Task[None]"] = {}
+
+
+def _embed_contents_sync(model_name: str, texts: List[str]) -> List[List[float]]:
+    client = get_genai_client()
+    response = client.models.embed_content(model=model_name, contents=texts)
+    embeddings = response.embeddings or []
+    if len(embeddings) != len(texts):
+        raise RuntimeError(
+            f"Embedding response returned {len(embeddings)} embeddings for {len(texts)} inputs "
+            f"(model '{model_name}')."
+        )
+    vectors = []
+    for embedding in embeddings:
+        if not isinstance(embedding.values, list):
+            raise RuntimeError(
+                f"Embedding response did not contain a valid vector for model '{model_name}'."
+            )
+        vectors.append(embedding.values)
+    return vectors
+
+
+def _settle_embed_futures(
+    items: List[Tuple[str, asyncio.Future]], vectors: List[List[float]]
+) -> None:
+    for (_, future), vector in zip(items, vectors):
+        if not future.done():
+            future.set_result(vector)
+
+
+async def _flush_embed_batch(batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+    # A batch can mix models only if settings change at runtime; group to be safe.
+    by_model: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+    for model_name, text, future in batch:
+        if not future.done():
+            by_model.setdefault(model_name, []).append((text, future))
+
+    for model_name, items in by_model.items():
+        try:
+            vectors = await run_in_threadpool(
+                _embed_contents_sync, model_name, [text for text, _ in items]
+            )
+        except Exception as exc:
+            if len(items) == 1:
+                if not items[0][1].done():
+                    items[0][1].set_exception(exc)
+                continue
+            # One bad input fails the whole request; retry singly so only its caller sees it.
+            logger.warning(
+                "embed_batch_failed size=%s model=%s error=%s; retrying per text",
+                len(items),
+                model_name,
+                exc,
+            )
+            for text, future in items:
+                if future.done():
+                    continue
+                try:
+                    item_vectors = await run_in_threadpool(_embed_contents_sync, model_name, [text])
+                except Exception as item_exc:
+                    if not future.done():
+                        future.set_exception(item_exc)
+                    continue
+                _settle_embed_futures([(text, future)], item_vectors)
+            continue
+        _settle_embed_futures(items, vectors)
+
+
+async def _flush_embed_batch_in_slot(
+    batch: List[Tuple[str, str, asyncio.Future]], slots: asyncio.Semaphore
+) -> None:
+    try:
+        await _flush_embed_batch(batch)
+    except Exception as exc:
+        logger.exception("embed_batch_flush_failed size=%s", len(batch))
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+    finally:
+        slots.release()
+
+
+async def _run_embed_consumer(queue: "asyncio.Queue[Tuple[str, str, asyncio.Future]]") -> None:
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(EMBED_MAX_CONCURRENT_FLUSHES)
+    # Strong references so in-flight flush tasks aren't garbage collected.
+    flushes: "set[asyncio.Task[None]]" = set()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + EMBED_MAX_WAIT_SECONDS
+        while len(batch) < EMBED_MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        # Waiting for a free slot here lets the bounded queue push back on callers.
+        await slots.acquire()
+        flush = asyncio.create_task(_flush_embed_batch_in_slot(batch, slots))
+        flushes.add(flush)
+        flush.add_done_callback(flushes.discard)
+
+
+async def embed_batched(text: str, model_name: str, *, lane: str = "interactive") -> List[float]:
+    """Embed one text, coalescing with concurrent callers into a single Gemini request.
+
+    Args:
+        text: Text to embed
+        model_name: Embedding model name
+        lane: "interactive" for request-path queries, "bulk" for ingestion/re-embedding
+
+    Raises:
+        RuntimeError: If the client cannot be initialized or the response is malformed
+        ValueError: If lane is not one of EMBED_LANES
+    """
+    if lane not in EMBED_LANES:
+        raise ValueError(f"Unknown embedding lane '{lane}'; expected one of {EMBED_LANES}")
+
+    # Surface missing-credential errors to the caller instead of the consumer task.
+    get_genai_client()
+
+    consumer = _embed_consumers.get(lane)
+    if consumer is None or consumer.done():
+        _embed_queues[lane] = asyncio.Queue(maxsize=EMBED_QUEUE_MAXSIZE)
+        _embed_consumers[lane] = asyncio.create_task(_run_embed_consumer(_embed_queues[lane]))
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    await _embed_queues[lane].put((model_name, text, future))
+    return await future
@@ -1,9 +1,16 @@
+import asyncio
+import re
+import time
 import uuid
 import logging
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Final, List, Optional
 
-from neo4j import AsyncGraphDatabase
+from cachetools import TTLCache
+from neo4j import READ_ACCESS, AsyncGraphDatabase
+from neo4j.exceptions import ResultNotSingleError
 
 from app.core.config import get_settings
 from app.services.clerk_directory import find_user_by_id
@@ -18,6 +25,108 @@ from app.services.analytics_contract import (
 
 logger = logging.getLogger(__name__)
 
+# Driver connections kept outside the session-slot semaphore, for sessions a slot holder
+# opens while already inside one.
+SESSION_SLOT_POOL_MARGIN = 4
+
+# Riley chat messages are written by one background writer per process: save_message enqueues
+# a row and the writer flushes up to SAVE_MSG_MAX_BATCH rows per UNWIND transaction, waiting
+# at most SAVE_MSG_MAX_WAIT_SECONDS for a batch to fill. The queue is bounded for backpressure.
+SAVE_MSG_MAX_BATCH = 100
+SAVE_MSG_MAX_WAIT_SECONDS = 0.100
+SAVE_MSG_QUEUE_MAXSIZE = 1000
+
+# search_campaigns_fuzzy tokenization: words of 3+ letters/digits, minus common stop words.
+_CAMPAIGN_TERM_RE = re.compile(r"[^\W_]{3,}")
+_CAMPAIGN_SEARCH_STOP_WORDS: Final[frozenset] = frozenset({
+    "have", "we", "done", "the", "a", "an", "and", "or", "but", "in", "on", "at", "to",
+    "for", "of", "with", "by", "is", "are", "was", "were", "be", "been", "being",
+})
+
+# Cypher for the per-request hot paths (auth, scoping, Riley chat memory), kept in one place.
+_Q_CLIENT_STRUCTURE: Final[str] = """
+MATCH (c:Client {id: $client_id})-[:RUNS_CAMPAIGN]->(cmp:Campaign)
+OPTIONAL MATCH (cmp)-[:HAS_ASSET]->(a:Asset)
+RETURN c.name as ClientName, collect(cmp.name) as Campaigns, count(a) as AssetCount
+"""
+
+# Rows carry their own timestamp (taken when save_message was called): datetime() is fixed
+# per statement, so a batch would otherwise give a user turn and its reply the same time.
+# Session creation time is read once per batch.
+_Q_SAVE_MSG_BATCH: Final[str] = """
+WITH datetime() AS now
+UNWIND $rows AS row
+MERGE (s:ChatSession {
+    id: row.session_id,
+    tenant_id: row.tenant_id,
+    user_id: row.user_id
+})
+ON CREATE SET s.created_at = now
+CREATE (m:Message {
+    role: row.role,
+    content: row.content,
+    timestamp: row.timestamp
+})
+CREATE (m)-[:BELONGS_TO]->(s)
+"""
+
+_Q_CHAT_HISTORY: Final[str] = """
+MATCH (m:Message)-[:BELONGS_TO]->(s:ChatSession {
+    id: $session_id,
+    tenant_id: $tenant_id,
+    user_id: $user_id
+})
+WITH m
+ORDER BY m.timestamp DESC
+LIMIT $limit
+RETURN m.role as role, m.content as content, toString(m.timestamp) as timestamp
+ORDER BY m.timestamp ASC
+"""
+
+_Q_CHECK_MEMBERSHIP: Final[str] = """
+MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(c:Campaign {id: $tenant_id})
+RETURN count(u) > 0 as is_member
+"""
+
+_Q_CAMPAIGN_FULLTEXT: Final[str] = """
+CALL db.index.fulltext.queryNodes('campaign_fts', $q) YIELD node, score
+RETURN node.name as name, node.description as description
+ORDER BY score DESC
+LIMIT 3
+"""
+
+_Q_CAMPAIGN_CONTAINS: Final[str] = """
+MATCH (c:Campaign)
+WHERE toLower(c.name) CONTAINS $term OR toLower(c.description) CONTAINS $term
+RETURN c.name as name, c.description as description
+LIMIT 3
+"""
+
+_Q_MEMBER_ROLE: Final[str] = """
+MATCH (u:User {id: $user_id})-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
+RETURN r.role as role
+"""
+
+
+class GraphOverloadedError(RuntimeError):
+    """Raised instead of queueing when the session circuit breaker is open."""
+
+
+async def _tx_single(tx: Any, query: str, **params: Any) -> Dict[str, Any]:
+    """Transaction function: run a query that must return exactly one record.
+
+    Raises ResultNotSingleError otherwise, which rolls the transaction back.
+    """
+    result = await tx.run(query, **params)
+    record = await result.single(strict=True)
+    return record.data()
+
+
+async def _tx_consume(tx: Any, query: str, **params: Any) -> None:
+    """Transaction function: run a write query and discard its result."""
+    result = await tx.run(query, **params)
+    await result.consume()
+
 
 class GraphService:
     """Service responsible for Neo4j graph database operations.
@@ -29,10 +138,123 @@ class GraphService:
     def __init__(self, driver: Optional[Any] = None) -> None:
         settings = get_settings()
 
-        self._driver = driver or AsyncGraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        # The driver is created by connect() (application startup), not at construction.
+        self._settings = settings
+        self._driver = driver
+        # Back-pressure ahead of the driver pool: queue here instead of timing out on
+        # connection acquisition. The margin leaves connections for nested sessions.
+        self._session_slot_total = max(
+            1, int(settings.NEO4J_MAX_CONNECTION_POOL_SIZE) - SESSION_SLOT_POOL_MARGIN
         )
+        self._session_slots = asyncio.Semaphore(self._session_slot_total)
+        # Tasks currently holding a slot. Methods that call other GraphService methods from
+        # inside an open session reuse their slot instead of waiting for a second one (which
+        # could deadlock once every slot is held by such an outer call). Keyed by task rather
+        # than a ContextVar so tasks spawned while a slot is held don't inherit it.
+        self._slot_holders: set["asyncio.Task[Any]"] = set()
+        # Outer sessions currently holding or waiting for a slot (reported by pool_stats), and
+        # when held slots first reached the breaker threshold (None while below it).
+        self._session_slot_demand = 0
+        self._saturated_since: Optional[float] = None
+        # Read-aside caches for the per-request auth/scoping lookups, keyed on the bound
+        # query params. Short TTLs bound staleness from writers outside this process.
+        self._structure_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+        self._membership_cache: TTLCache = TTLCache(maxsize=16384, ttl=30)
+        # search_campaigns_fuzzy summaries keyed by the query's term set: rephrasings with the
+        # same terms ("campaigns we've done for X" / "have we done X campaigns") share an entry.
+        self._campaign_search_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+        # Batched chat-message writer, started lazily on the first save_message.
+        self._msg_queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+        self._msg_writer: Optional["asyncio.Task[None]"] = None
+        # Held by the writer for each batch and by clear_chat_history for its delete, so a clear
+        # never interleaves with an in-flight batch for the same session.
+        self._msg_write_lock = asyncio.Lock()
+        # (session_id, tenant_id, user_id) -> when it was cleared. Queued rows for that session
+        # timestamped at or before this are dropped instead of re-creating the session.
+        self._msg_cleared_at: TTLCache = TTLCache(maxsize=4096, ttl=600)
+
+    def _invalidate_membership(self, campaign_id: str, user_id: Optional[str] = None) -> None:
+        """Drop cached membership answers for one user, or every user, of a campaign."""
+        if user_id is not None:
+            self._membership_cache.pop((user_id, campaign_id), None)
+            return
+        stale = [key for key in list(self._membership_cache.keys()) if key[1] == campaign_id]
+        for key in stale:
+            self._membership_cache.pop(key, None)
+
+    def _slot_utilization(self) -> float:
+        # Held slots only: each one has a driver connection checked out, while waiters are
+        # just queued requests and say nothing about the pool itself.
+        return len(self._slot_holders) / self._session_slot_total
+
+    def _circuit_open(self) -> bool:
+        """Update saturation tracking and report whether new sessions should fail fast."""
+        settings = self._settings
+        utilization = self._slot_utilization()
+        if utilization < settings.NEO4J_CIRCUIT_BREAKER_UTILIZATION:
+            self._saturated_since = None
+            return False
+        now = time.monotonic()
+        if self._saturated_since is None:
+            self._saturated_since = now
+        return now - self._saturated_since >= settings.NEO4J_CIRCUIT_BREAKER_WINDOW_SECONDS
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Session-slot and driver pool pressure, for the /healthz/neo4j probe."""
+        return {
+            "session_slots_total": self._session_slot_total,
+            "session_slots_in_use": len(self._slot_holders),
+            "session_slot_demand": self._session_slot_demand,
+            "utilization": round(self._slot_utilization(), 3),
+            "circuit_open": self._circuit_open(),
+            "max_connection_pool_size": self._settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        }
+
+    @asynccontextmanager
+    async def _session(self, **session_kwargs: Any) -> AsyncIterator[Any]:
+        """Open a driver session behind the session-slot semaphore.
+
+        Raises:
+            GraphOverloadedError: If held slots have stayed saturated for the breaker window
+        """
+        driver = self._ensure_driver()
+        task = asyncio.current_task()
+        if task in self._slot_holders:
+            async with driver.session(**session_kwargs) as session:
+                yield session
+            return
+        if self._circuit_open():
+            logger.warning(
+                "graph_circuit_open slots_in_use=%s slot_demand=%s slots_total=%s",
+                len(self._slot_holders),
+                self._session_slot_demand,
+                self._session_slot_total,
+            )
+            raise GraphOverloadedError("Graph database is overloaded; retry shortly")
+        self._session_slot_demand += 1
+        try:
+            async with self._session_slots:
+                self._slot_holders.add(task)
+                try:
+                    async with driver.session(**session_kwargs) as session:
+                        yield session
+                finally:
+                    self._slot_holders.discard(task)
+        finally:
+            self._session_slot_demand -= 1
+
+    async def _read(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """Run a read-only query as a managed read transaction and return records as dicts.
+
+        READ access lets a cluster route it to a replica; execute_read retries transient errors.
+        """
+
+        async def _work(tx: Any) -> List[Dict[str, Any]]:
+            result = await tx.run(query, **params)
+            return await result.data()
+
+        async with self._session(default_access_mode=READ_ACCESS) as session:
+            return await session.execute_read(_work)
 
     def _require_team_chat_author_id(self, author_id: Optional[str], *, campaign_id: str, thread_id: Optional[str] = None) -> str:
         """Validate author IDs for Team Chat write paths."""
@@ -86,19 +308,98 @@ class GraphService:
         normalized_type = str(notification_type or "").strip()
         return mapping.get(normalized_type, f"Campaign update{campaign_suffix}")
 
+    async def connect(self) -> None:
+        """Create the Neo4j driver (idempotent); called from application startup."""
+        self._ensure_driver()
+
+    def _ensure_driver(self) -> Any:
+        # Fallback for callers that run before startup (scripts, tests): create on first use.
+        if self._driver is None:
+            settings = self._settings
+            self._driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+                connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT_SECONDS,
+                max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME_SECONDS,
+                keep_alive=True,
+            )
+        return self._driver
+
     @property
     def driver(self) -> Any:
         """Return the Neo4j driver instance."""
-        return self._driver
+        return self._ensure_driver()
+
+    def _msg_row_cleared(self, row: Dict[str, Any]) -> bool:
+        cleared_at = self._msg_cleared_at.get((row["session_id"], row["tenant_id"], row["user_id"]))
+        return cleared_at is not None and row["timestamp"] <= cleared_at
+
+    async def _write_message_rows(self, rows: List[Dict[str, Any]]) -> None:
+        async with self._session() as session:
+            await session.execute_write(_tx_consume, _Q_SAVE_MSG_BATCH, rows=rows)
+
+    async def _write_message_batch(self, rows: List[Dict[str, Any]]) -> None:
+        async with self._msg_write_lock:
+            rows = [row for row in rows if not self._msg_row_cleared(row)]
+            if not rows:
+                return
+            try:
+                await self._write_message_rows(rows)
+                return
+            except Exception as exc:
+                if len(rows) == 1:
+                    logger.exception("chat_message_write_failed session_id=%s", rows[0]["session_id"])
+                    return
+                logger.warning(
+                    "chat_message_batch_write_failed size=%s error=%s; retrying per message",
+                    len(rows),
+                    exc,
+                )
+            # One bad row (or a transient error) shouldn't cost every other user's turn.
+            # Chat memory is best-effort: failures are logged and the writer keeps going.
+            for row in rows:
+                try:
+                    await self._write_message_rows([row])
+                except Exception:
+                    logger.exception("chat_message_write_failed session_id=%s", row["session_id"])
+
+    async def _flush_messages(self, queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + SAVE_MSG_MAX_WAIT_SECONDS
+            while len(batch) < SAVE_MSG_MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._write_message_batch(batch)
+            for _ in batch:
+                queue.task_done()
 
     async def close(self) -> None:
-        """Close the Neo4j driver connection."""
+        """Flush queued chat messages and close the Neo4j driver connection."""
+        if self._msg_writer is not None and not self._msg_writer.done():
+            try:
+                await asyncio.wait_for(self._msg_queue.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "chat_message_queue_flush_timed_out pending=%s", self._msg_queue.qsize()
+                )
+            self._msg_writer.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._msg_writer
         if self._driver:
             await self._driver.close()
+            self._driver = None
 
     async def verify_connectivity(self) -> None:
         """Verify the configured Neo4j endpoint is reachable."""
-        await self._driver.verify_connectivity()
+        await self._ensure_driver().verify_connectivity()
 
     async def ensure_mission_control_schema(self) -> None:
         """Create high-value indexes/constraints for Mission Control analytics paths."""
@@ -174,8 +475,46 @@ class GraphService:
             CREATE CONSTRAINT analytics_daily_provider_rollup_key_unique IF NOT EXISTS
             FOR (r:AnalyticsDailyProviderRollup) REQUIRE (r.event_date, r.provider, r.model) IS UNIQUE
             """,
+            # {id: $x} lookups used by nearly every method; the constraint's backing index
+            # turns label scans into index seeks
+            """
+            CREATE CONSTRAINT client_id_unique IF NOT EXISTS
+            FOR (c:Client) REQUIRE c.id IS UNIQUE
+            """,
+            """
+            CREATE CONSTRAINT campaign_id_unique IF NOT EXISTS
+            FOR (c:Campaign) REQUIRE c.id IS UNIQUE
+            """,
+            """
+            CREATE CONSTRAINT user_id_unique IF NOT EXISTS
+            FOR (u:User) REQUIRE u.id IS UNIQUE
+            """,
+            """
+            CREATE CONSTRAINT team_message_id_unique IF NOT EXISTS
+            FOR (m:TeamMessage) REQUIRE m.id IS UNIQUE
+            """,
+            # ChatSession is merged on (id, tenant_id, user_id); an index, not a uniqueness
+            # constraint on id, so the scoped MERGE semantics are unchanged
+            """
+            CREATE INDEX chat_session_scope_idx IF NOT EXISTS
+            FOR (s:ChatSession) ON (s.tenant_id, s.user_id, s.id)
+            """,
+            # Campaign lookup from Riley chat (search_campaigns_fuzzy)
+            """
+            CREATE FULLTEXT INDEX campaign_fts IF NOT EXISTS
+            FOR (c:Campaign) ON EACH [c.name, c.description]
+            """,
+            # Chat timelines (Riley history, Team Comms) are range-scanned by timestamp
+            """
+            CREATE INDEX message_timestamp_idx IF NOT EXISTS
+            FOR (m:Message) ON (m.timestamp)
+            """,
+            """
+            CREATE INDEX team_message_timestamp_idx IF NOT EXISTS
+            FOR (m:TeamMessage) ON (m.timestamp)
+            """,
         ]
-        async with self._driver.session() as session:
+        async with self._session() as session:
             for statement in statements:
                 try:
                     result = await session.run(statement)
@@ -189,7 +528,7 @@ class GraphService:
 
     async def _label_exists(self, label: str) -> bool:
         """Return True if the Neo4j label exists in current DB."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 CALL db.labels() YIELD label
@@ -290,7 +629,7 @@ class GraphService:
         if total_tokens is None and input_tokens is not None and output_tokens is not None:
             total_tokens = input_tokens + output_tokens
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (e:AnalyticsEvent {event_id: $event_id})
             ON CREATE SET
@@ -347,7 +686,7 @@ class GraphService:
 
     async def rebuild_analytics_daily_rollups(self, *, days_back: int = 30) -> Dict[str, int]:
         """Rebuild v1 daily analytics rollups from AnalyticsEvent."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             campaign_query = """
             MATCH (e:AnalyticsEvent)
             WHERE e.occurred_at >= $start_iso
@@ -504,28 +843,29 @@ class GraphService:
         Raises:
             Exception: If the query fails or client is not found.
         """
-        cypher_query = """
-        MATCH (c:Client {id: $client_id})-[:RUNS_CAMPAIGN]->(cmp:Campaign)
-        OPTIONAL MATCH (cmp)-[:HAS_ASSET]->(a:Asset)
-        RETURN c.name as ClientName, collect(cmp.name) as Campaigns, count(a) as AssetCount
-        """
+        cached = self._structure_cache.get(client_id)
+        if cached is not None:
+            return {**cached, "Campaigns": list(cached["Campaigns"])}
 
-        async with self._driver.session() as session:
-            result = await session.run(cypher_query, client_id=client_id)
+        async with self._session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_Q_CLIENT_STRUCTURE, client_id=client_id)
             record = await result.single()
 
             if not record:
-                return {
+                structure = {
                     "ClientName": None,
                     "Campaigns": [],
                     "AssetCount": 0,
                 }
+            else:
+                structure = {
+                    "ClientName": record["ClientName"],
+                    "Campaigns": record["Campaigns"] or [],
+                    "AssetCount": record["AssetCount"] or 0,
+                }
 
-            return {
-                "ClientName": record["ClientName"],
-                "Campaigns": record["Campaigns"] or [],
-                "AssetCount": record["AssetCount"] or 0,
-            }
+        self._structure_cache[client_id] = structure
+        return {**structure, "Campaigns": list(structure["Campaigns"])}
 
     async def save_message(
         self, session_id: str, role: str, content: str, tenant_id: str, user_id: str
@@ -536,6 +876,9 @@ class GraphService:
         Schema: (Session:ChatSession {id: "...", tenant_id: "...", user_id: "..."}) <-[:BELONGS_TO]- (Message:Message {role: "...", content: "...", timestamp: "..."})
         
         SECURITY: The MERGE includes tenant_id and user_id to prevent cross-tenant/user memory mixing.
+
+        The message is queued for the batched background writer (see SAVE_MSG_MAX_BATCH) and
+        is timestamped here, so ordering follows call order. Write failures are logged only.
         
         Args:
             session_id: Unique identifier for the chat session
@@ -544,30 +887,19 @@ class GraphService:
             tenant_id: Tenant/client identifier for scope isolation
             user_id: User identifier for scope isolation
         """
-        async with self._driver.session() as session:
-            query = """
-            MERGE (s:ChatSession {
-                id: $session_id,
-                tenant_id: $tenant_id,
-                user_id: $user_id
-            })
-            ON CREATE SET s.created_at = datetime()
-            CREATE (m:Message {
-                role: $role,
-                content: $content,
-                timestamp: datetime()
-            })
-            CREATE (m)-[:BELONGS_TO]->(s)
-            """
-            
-            await session.run(
-                query,
-                session_id=session_id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                role=role,
-                content=content,
-            )
+        if self._msg_writer is None or self._msg_writer.done():
+            self._msg_queue = asyncio.Queue(maxsize=SAVE_MSG_QUEUE_MAXSIZE)
+            self._msg_writer = asyncio.create_task(self._flush_messages(self._msg_queue))
+        await self._msg_queue.put(
+            {
+                "session_id": session_id,
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+                "role": role,
+                "content": content,
+                "timestamp": datetime.now(timezone.utc),
+            }
+        )
         await self.append_analytics_event(
             event_id=f"assistant_message:{session_id}:{role}:{now_iso_utc()}",
             source_event_type_raw="assistant_message_saved",
@@ -585,8 +917,8 @@ class GraphService:
     ) -> List[Dict[str, str]]:
         """Retrieve chat history for a session.
         
-        Gets the last N messages ordered by timestamp DESC, then reverses
-        to return in chronological order (oldest -> newest).
+        Gets the last N messages (newest N by timestamp), returned by Neo4j in
+        chronological order (oldest -> newest).
         
         SECURITY: MATCH includes tenant_id and user_id to prevent cross-scope memory access.
         Never returns messages across different tenants or users.
@@ -600,112 +932,88 @@ class GraphService:
         Returns:
             List of message dicts with 'role' and 'content' keys, ordered chronologically
         """
-        async with self._driver.session() as session:
-            query = """
-            MATCH (m:Message)-[:BELONGS_TO]->(s:ChatSession {
-                id: $session_id,
-                tenant_id: $tenant_id,
-                user_id: $user_id
-            })
-            RETURN m.role as role, m.content as content, toString(m.timestamp) as timestamp
-            ORDER BY m.timestamp DESC
-            LIMIT $limit
-            """
-            
-            result = await session.run(
-                query,
-                session_id=session_id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                limit=limit
-            )
-            
-            messages = []
-            async for record in result:
-                messages.append({
-                    "role": record["role"],
-                    "content": record["content"],
-                })
-            
-            # Reverse to get chronological order (oldest -> newest)
-            messages.reverse()
-            return messages
+        records = await self._read(
+            _Q_CHAT_HISTORY,
+            session_id=session_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            limit=limit
+        )
+
+        return [
+            {"role": record["role"], "content": record["content"]}
+            for record in records
+        ]
 
     async def list_riley_conversations(
         self, tenant_id: str, user_id: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
         """List persisted Riley conversations for a user and tenant."""
-        async with self._driver.session() as session:
-            query = """
-            MATCH (s:ChatSession {tenant_id: $tenant_id, user_id: $user_id})
-            OPTIONAL MATCH (m:Message)-[:BELONGS_TO]->(s)
-            WITH s, m
-            ORDER BY m.timestamp DESC
-            WITH s, collect(m)[0] as latest
-            RETURN
-                s.id as id,
-                coalesce(s.title, "New Conversation") as title,
-                s.project_id as project_id,
-                latest.content as last_message,
-                toString(latest.timestamp) as last_message_at,
-                toString(s.created_at) as created_at
-            ORDER BY coalesce(latest.timestamp, s.created_at) DESC
-            LIMIT $limit
-            """
-            result = await session.run(
-                query,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                limit=limit,
-            )
+        query = """
+        MATCH (s:ChatSession {tenant_id: $tenant_id, user_id: $user_id})
+        OPTIONAL MATCH (m:Message)-[:BELONGS_TO]->(s)
+        WITH s, m
+        ORDER BY m.timestamp DESC
+        WITH s, collect(m)[0] as latest
+        RETURN
+            s.id as id,
+            coalesce(s.title, "New Conversation") as title,
+            s.project_id as project_id,
+            latest.content as last_message,
+            toString(latest.timestamp) as last_message_at,
+            toString(s.created_at) as created_at
+        ORDER BY coalesce(latest.timestamp, s.created_at) DESC
+        LIMIT $limit
+        """
+        records = await self._read(
+            query,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            limit=limit,
+        )
 
-            conversations: List[Dict[str, Any]] = []
-            async for record in result:
-                conversations.append(
-                    {
-                        "id": record["id"],
-                        "title": record.get("title") or "New Conversation",
-                        "project_id": record.get("project_id"),
-                        "last_message": record.get("last_message") or "",
-                        "last_message_at": record.get("last_message_at"),
-                        "created_at": record.get("created_at"),
-                    }
-                )
-            return conversations
+        return [
+            {
+                "id": record["id"],
+                "title": record.get("title") or "New Conversation",
+                "project_id": record.get("project_id"),
+                "last_message": record.get("last_message") or "",
+                "last_message_at": record.get("last_message_at"),
+                "created_at": record.get("created_at"),
+            }
+            for record in records
+        ]
 
     async def list_riley_projects(
         self, tenant_id: str, user_id: str, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """List Riley projects for a user and tenant scope."""
-        async with self._driver.session() as session:
-            query = """
-            MATCH (p:RileyProject {tenant_id: $tenant_id, user_id: $user_id})
-            RETURN
-                p.id as id,
-                p.name as name,
-                toString(p.created_at) as created_at,
-                toString(p.updated_at) as updated_at
-            ORDER BY coalesce(p.updated_at, p.created_at) DESC
-            LIMIT $limit
-            """
-            result = await session.run(
-                query,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                limit=limit,
-            )
+        query = """
+        MATCH (p:RileyProject {tenant_id: $tenant_id, user_id: $user_id})
+        RETURN
+            p.id as id,
+            p.name as name,
+            toString(p.created_at) as created_at,
+            toString(p.updated_at) as updated_at
+        ORDER BY coalesce(p.updated_at, p.created_at) DESC
+        LIMIT $limit
+        """
+        records = await self._read(
+            query,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            limit=limit,
+        )
 
-            projects: List[Dict[str, Any]] = []
-            async for record in result:
-                projects.append(
-                    {
-                        "id": record["id"],
-                        "name": record.get("name") or "Untitled Project",
-                        "created_at": record.get("created_at"),
-                        "updated_at": record.get("updated_at"),
-                    }
-                )
-            return projects
+        return [
+            {
+                "id": record["id"],
+                "name": record.get("name") or "Untitled Project",
+                "created_at": record.get("created_at"),
+                "updated_at": record.get("updated_at"),
+            }
+            for record in records
+        ]
 
     async def create_riley_project(
         self, tenant_id: str, user_id: str, name: str, project_id: Optional[str] = None
@@ -716,7 +1024,7 @@ class GraphService:
             normalized_name = "Untitled Project"
         next_project_id = project_id or f"riley_project_{uuid.uuid4()}"
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             CREATE (p:RileyProject {
                 id: $project_id,
@@ -757,7 +1065,7 @@ class GraphService:
         if normalized_name == "":
             raise Exception("Project name cannot be empty")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (p:RileyProject {id: $project_id, tenant_id: $tenant_id, user_id: $user_id})
             SET p.name = $name, p.updated_at = datetime()
@@ -786,7 +1094,7 @@ class GraphService:
 
     async def delete_riley_project(self, project_id: str, tenant_id: str, user_id: str) -> None:
         """Delete a Riley project and unassign conversations in scope."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             OPTIONAL MATCH (s:ChatSession {tenant_id: $tenant_id, user_id: $user_id, project_id: $project_id})
             SET s.project_id = null
@@ -809,7 +1117,7 @@ class GraphService:
         project_id: Optional[str],
     ) -> Dict[str, Any]:
         """Assign or clear a Riley conversation's project."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             if project_id is None:
                 clear_query = """
                 MATCH (s:ChatSession {id: $session_id, tenant_id: $tenant_id, user_id: $user_id})
@@ -854,7 +1162,7 @@ class GraphService:
 
     async def delete_riley_conversation(self, session_id: str, tenant_id: str, user_id: str) -> None:
         """Delete a Riley conversation and all messages in scope."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (s:ChatSession {id: $session_id, tenant_id: $tenant_id, user_id: $user_id})
             OPTIONAL MATCH (m:Message)-[:BELONGS_TO]->(s)
@@ -878,7 +1186,7 @@ class GraphService:
             normalized_title = None
         conversation_id = session_id or f"session_{tenant_id}_{user_id}_{uuid.uuid4()}"
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (s:ChatSession {id: $session_id, tenant_id: $tenant_id, user_id: $user_id})
             ON CREATE SET s.created_at = datetime()
@@ -921,7 +1229,7 @@ class GraphService:
         self, session_id: str, tenant_id: str, user_id: str, limit: int = 100
     ) -> List[Dict[str, str]]:
         """Get messages for a Riley conversation in chronological order."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (m:Message)-[:BELONGS_TO]->(s:ChatSession {
                 id: $session_id,
@@ -954,7 +1262,7 @@ class GraphService:
         self, session_id: str, tenant_id: str, user_id: str, role: str, content: str
     ) -> None:
         """Append a message to an existing Riley conversation."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (s:ChatSession {
                 id: $session_id,
@@ -1001,7 +1309,7 @@ class GraphService:
         mode: str,
     ) -> Dict[str, Any]:
         """Create a durable Riley report job node."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             CREATE (r:RileyReportJob {
                 id: $report_job_id,
@@ -1114,7 +1422,7 @@ class GraphService:
         if not await self._label_exists("RileyReportJob"):
             return []
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (r:RileyReportJob {tenant_id: $tenant_id, user_id: $user_id})
             WHERE r.deleted_at IS NULL AND coalesce(r.status, "") <> "deleted"
@@ -1175,7 +1483,7 @@ class GraphService:
         """Count active report jobs for a tenant across all users."""
         if not await self._label_exists("RileyReportJob"):
             return 0
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (r:RileyReportJob {tenant_id: $tenant_id})
             WHERE r.deleted_at IS NULL
@@ -1199,7 +1507,7 @@ class GraphService:
         if not await self._label_exists("RileyReportJob"):
             return None
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (r:RileyReportJob {
                 id: $report_job_id,
@@ -1262,7 +1570,7 @@ class GraphService:
         if not await self._label_exists("RileyReportJob"):
             return None
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (r:RileyReportJob {id: $report_job_id})
             RETURN properties(r) as props
@@ -1338,7 +1646,7 @@ class GraphService:
         failure_detail: Optional[str] = None,
     ) -> None:
         """Update report job status and optional output fields."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (r:RileyReportJob {
                 id: $report_job_id,
@@ -1502,7 +1810,7 @@ class GraphService:
     ) -> None:
         """Persist per-document intelligence artifact in Neo4j."""
         artifact_id = f"{tenant_id}:{file_id}"
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (d:RileyDocumentIntelligence {id: $artifact_id})
             ON CREATE SET
@@ -1640,7 +1948,7 @@ class GraphService:
         trigger_source: str,
     ) -> Dict[str, Any]:
         """Create a campaign-level intelligence aggregation job record."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             CREATE (j:RileyCampaignIntelligenceJob {
                 id: $job_id,
@@ -1682,7 +1990,7 @@ class GraphService:
         job_id: str,
     ) -> Optional[Dict[str, Any]]:
         """Get one campaign intelligence job by ID for trusted worker execution."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (j:RileyCampaignIntelligenceJob {id: $job_id})
             RETURN
@@ -1710,7 +2018,7 @@ class GraphService:
         error_message: Optional[str] = None,
     ) -> None:
         """Update campaign intelligence job status."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (j:RileyCampaignIntelligenceJob {id: $job_id})
             SET
@@ -1764,7 +2072,7 @@ class GraphService:
         input_quality_note: str,
     ) -> int:
         """Create a versioned campaign intelligence snapshot and return the version."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             OPTIONAL MATCH (prev:RileyCampaignIntelligenceSnapshot {tenant_id: $tenant_id})
             WITH coalesce(max(prev.version), 0) + 1 as next_version
@@ -1838,7 +2146,7 @@ class GraphService:
         tenant_id: str,
     ) -> Optional[Dict[str, Any]]:
         """Return latest campaign intelligence snapshot for a tenant."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (s:RileyCampaignIntelligenceSnapshot {tenant_id: $tenant_id})
             RETURN
@@ -1880,7 +2188,9 @@ class GraphService:
     async def search_campaigns_fuzzy(self, query: str) -> str:
         """Search campaigns in the graph using fuzzy matching on name and description.
         
-        Removes common stop words and searches for campaigns that contain the query terms.
+        Removes common stop words and matches the remaining terms against the
+        campaign_fts full-text index (falling back to a CONTAINS scan on the first
+        term if the index is unavailable).
         This is the "Golden Set" - structured campaign data from the graph.
         
         Args:
@@ -1889,36 +2199,53 @@ class GraphService:
         Returns:
             Formatted string summary of matching campaigns, or empty string if none found
         """
-        # Remove common stop words
-        stop_words = {"have", "we", "done", "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "was", "were", "be", "been", "being"}
-        query_terms = [word.lower() for word in query.split() if word.lower() not in stop_words and len(word) > 2]
-        
+        query_terms = [
+            term
+            for term in (match.group().lower() for match in _CAMPAIGN_TERM_RE.finditer(query))
+            if term not in _CAMPAIGN_SEARCH_STOP_WORDS
+        ]
         if not query_terms:
             return ""
-        
-        # Use the first meaningful term for search
-        search_term = query_terms[0]
-        
+
+        cache_key = frozenset(query_terms)
+        cached = self._campaign_search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            async with self._driver.session() as session:
-                cypher_query = """
-                MATCH (c:Campaign)
-                WHERE toLower(c.name) CONTAINS $term OR toLower(c.description) CONTAINS $term
-                RETURN c.name as name, c.description as description
-                LIMIT 3
-                """
-                
-                result = await session.run(cypher_query, term=search_term)
-                
+            async with self._session(default_access_mode=READ_ACCESS) as session:
+                cacheable = True
+                try:
+                    # Terms are plain alphanumerics, so no Lucene escaping is needed; the
+                    # trailing wildcard keeps the old substring feel for partial words.
+                    result = await session.run(
+                        _Q_CAMPAIGN_FULLTEXT,
+                        q=" ".join(f"{term}*" for term in query_terms),
+                    )
+                    records = await result.data()
+                except Exception as exc:
+                    # Index not created yet (schema statements run at startup): scan instead.
+                    logger.warning(
+                        "campaign_fulltext_search_failed error_type=%s error=%s",
+                        type(exc).__name__,
+                        exc,
+                    )
+                    # Use the first meaningful term for search
+                    result = await session.run(_Q_CAMPAIGN_CONTAINS, term=query_terms[0])
+                    records = await result.data()
+                    # Order-dependent, and only a stopgap until the index exists
+                    cacheable = False
+
                 campaigns = []
-                async for record in result:
+                for record in records:
                     name = record.get("name", "Unknown Campaign")
                     description = record.get("description", "No description")
                     campaigns.append(f"Campaign: '{name}' ({description})")
                 
-                if campaigns:
-                    return "Graph found: " + " | ".join(campaigns)
-                return ""
+                summary = "Graph found: " + " | ".join(campaigns) if campaigns else ""
+                if cacheable:
+                    self._campaign_search_cache[cache_key] = summary
+                return summary
         except Exception as e:
             # Log error but return empty string to not break the flow
             print(f"Error searching campaigns in graph: {e}")
@@ -1933,7 +2260,7 @@ class GraphService:
         ]
         if not normalized_ids:
             return {}
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign)
             WHERE c.id IN $campaign_ids
@@ -1957,7 +2284,7 @@ class GraphService:
     ) -> None:
         """Persist one daily Qdrant usage snapshot for forecasting."""
         snapshot_date = datetime.now(timezone.utc).date().isoformat()
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (s:QdrantUsageSnapshot {snapshot_date: $snapshot_date})
             ON CREATE SET s.created_at = datetime()
@@ -1980,7 +2307,7 @@ class GraphService:
         safe_days_back = max(2, int(days_back))
         safe_limit = max(2, int(limit))
         start_day = (datetime.now(timezone.utc).date() - timedelta(days=safe_days_back - 1)).isoformat()
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (s:QdrantUsageSnapshot)
             WHERE s.snapshot_date >= $start_day
@@ -2028,26 +2355,32 @@ class GraphService:
             Exception: If the deletion fails (wrapped in try/except by caller)
         """
         try:
-            async with self._driver.session() as session:
-                # Delete session and all its messages
-                # DETACH DELETE removes the node and all its relationships
-                # SECURITY: Only delete if all three match (prevents cross-scope deletion)
-                query = """
-                MATCH (s:ChatSession {
-                    id: $session_id,
-                    tenant_id: $tenant_id,
-                    user_id: $user_id
-                })-[r:BELONGS_TO]-(m:Message)
-                DETACH DELETE s, m
-                """
-                
-                result = await session.run(
-                    query,
-                    session_id=session_id,
-                    tenant_id=tenant_id,
-                    user_id=user_id
-                )
-                await result.consume()  # Ensure query executes
+            # Under the writer lock: an in-flight batch lands before the delete, and rows still
+            # queued for this session are dropped by the writer rather than re-MERGEing it.
+            async with self._msg_write_lock:
+                self._msg_cleared_at[(session_id, tenant_id, user_id)] = datetime.now(timezone.utc)
+                async with self._session() as session:
+                    # Delete session and all its messages
+                    # DETACH DELETE removes the node and all its relationships
+                    # SECURITY: Only delete if all three match (prevents cross-scope deletion)
+                    # OPTIONAL MATCH so a session with no messages is still removed
+                    query = """
+                    MATCH (s:ChatSession {
+                        id: $session_id,
+                        tenant_id: $tenant_id,
+                        user_id: $user_id
+                    })
+                    OPTIONAL MATCH (m:Message)-[:BELONGS_TO]->(s)
+                    DETACH DELETE m, s
+                    """
+
+                    await session.execute_write(
+                        _tx_consume,
+                        query,
+                        session_id=session_id,
+                        tenant_id=tenant_id,
+                        user_id=user_id,
+                    )
         except Exception as e:
             # Log error but don't crash - let the router handle it
             print(f"Error clearing chat history for session {session_id}: {e}")
@@ -2074,7 +2407,7 @@ class GraphService:
             ValueError: If the session is not found (doesn't match all three criteria)
             Exception: If the update fails
         """
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (s:ChatSession {
                 id: $id,
@@ -2085,19 +2418,19 @@ class GraphService:
             RETURN s.title as title
             """
             
-            result = await session.run(
-                query,
-                id=session_id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                title=title
-            )
-            record = await result.single()
-            
-            if not record:
+            try:
+                record = await session.execute_write(
+                    _tx_single,
+                    query,
+                    id=session_id,
+                    tenant_id=tenant_id,
+                    user_id=user_id,
+                    title=title,
+                )
+            except ResultNotSingleError as exc:
                 raise ValueError(
                     f"Session {session_id} not found for tenant {tenant_id} and user {user_id}"
-                )
+                ) from exc
             
             return record["title"]
 
@@ -2121,7 +2454,7 @@ class GraphService:
         """
         campaign_id = str(uuid.uuid4())
         
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             CREATE (c:Campaign {
@@ -2147,17 +2480,21 @@ class GraphService:
                 toString(c.last_activity_at) as last_activity_at
             """
             
-            result = await session.run(
-                query,
-                user_id=user_id,
-                campaign_id=campaign_id,
-                name=name,
-                description=description
-            )
-            record = await result.single()
-            
-            if not record:
-                raise Exception("Failed to create campaign")
+            try:
+                record = await session.execute_write(
+                    _tx_single,
+                    query,
+                    user_id=user_id,
+                    campaign_id=campaign_id,
+                    name=name,
+                    description=description,
+                )
+            except ResultNotSingleError as exc:
+                raise Exception("Failed to create campaign") from exc
+
+            # Client structures list campaigns; drop them rather than track which client changed.
+            self._structure_cache.clear()
+            self._campaign_search_cache.clear()
             
             return {
                 "id": record["id"],
@@ -2178,7 +2515,7 @@ class GraphService:
         Returns:
             List of campaign dictionaries: [{id, name, description, role}, ...]
         """
-        async with self._driver.session() as session:
+        async with self._session(default_access_mode=READ_ACCESS) as session:
             query = """
             MATCH (u:User {id: $user_id})-[r:MEMBER_OF]->(c:Campaign)
             WHERE (
@@ -2190,6 +2527,7 @@ class GraphService:
                 c.name as name,
                 c.description as description,
                 r.role as role,
+                "member" as access,
                 toString(c.created_at) as created_at,
                 coalesce(c.status, "active") as status,
                 toString(c.archived_at) as archived_at,
@@ -2198,22 +2536,7 @@ class GraphService:
             """
             
             result = await session.run(query, user_id=user_id, status_filter=status_filter)
-            
-            campaigns = []
-            async for record in result:
-                campaigns.append({
-                    "id": record["id"],
-                    "name": record["name"],
-                    "description": record.get("description"),
-                    "role": record["role"],
-                    "access": "member",
-                    "created_at": record.get("created_at"),
-                    "status": record.get("status") or "active",
-                    "archived_at": record.get("archived_at"),
-                    "last_activity_at": record.get("last_activity_at"),
-                })
-            
-            return campaigns
+            return await result.data()
 
     async def get_all_campaigns_with_access(
         self,
@@ -2228,7 +2551,7 @@ class GraphService:
         - "member" when the user has MEMBER_OF relationship to campaign
         - "requestable" otherwise
         """
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign)
             WHERE (
@@ -2300,7 +2623,7 @@ class GraphService:
         normalized_campaign_id = str(campaign_id or "").strip()
         if not normalized_campaign_id or normalized_campaign_id.lower() == "global":
             return
-        async with self._driver.session() as session:
+        async with self._session() as session:
             await session.run(
                 """
                 MATCH (c:Campaign {id: $campaign_id})
@@ -2311,7 +2634,7 @@ class GraphService:
 
     async def archive_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Archive a campaign by setting status and archived timestamp."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             SET
@@ -2334,7 +2657,7 @@ class GraphService:
 
     async def restore_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Restore an archived campaign to active status."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             SET
@@ -2358,7 +2681,7 @@ class GraphService:
 
     async def is_campaign_archived(self, campaign_id: str) -> bool:
         """Return whether campaign is archived; raise if missing."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             RETURN coalesce(c.status, "active") as status
@@ -2371,7 +2694,7 @@ class GraphService:
 
     async def hard_delete_campaign_graph_data(self, campaign_id: str) -> None:
         """Hard delete campaign graph data and campaign-scoped related nodes."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             await session.run(
                 """
                 MATCH (:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)
@@ -2409,6 +2732,9 @@ class GraphService:
                 """,
                 campaign_id=campaign_id,
             )
+        self._invalidate_membership(campaign_id)
+        self._structure_cache.clear()
+        self._campaign_search_cache.clear()
 
     async def create_access_request(
         self, tenant_id: str, requester_user_id: str, message: Optional[str] = None
@@ -2419,7 +2745,7 @@ class GraphService:
         if normalized_message == "":
             normalized_message = None
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $tenant_id})
             MERGE (u:User {id: $requester_user_id})
@@ -2504,7 +2830,7 @@ class GraphService:
         self, campaign_id: str, status: str = "pending", limit: int = 50
     ) -> List[Dict[str, Any]]:
         """List campaign access requests by status."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (ar:CampaignAccessRequest {campaign_id: $campaign_id})
             OPTIONAL MATCH (u:User {id: ar.user_id})
@@ -2565,7 +2891,7 @@ class GraphService:
         if normalized_decision not in {"approved", "denied"}:
             raise ValueError("decision must be 'approved' or 'denied'")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             existing_result = await session.run(
                 """
                 MATCH (ar:CampaignAccessRequest {id: $request_id, campaign_id: $campaign_id})
@@ -2655,6 +2981,7 @@ class GraphService:
             record = await result.single()
             if not record:
                 raise ValueError("Pending access request not found")
+            self._invalidate_membership(campaign_id, record.get("user_id"))
             decided_payload = {
                 "id": record.get("id"),
                 "user_id": record.get("user_id"),
@@ -2717,7 +3044,7 @@ class GraphService:
         viewer_user_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List recent campaign events for activity/feed surfaces."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (e:CampaignEvent {campaign_id: $campaign_id})
             WHERE
@@ -2848,7 +3175,7 @@ class GraphService:
         normalized_user_id = str(user_id or "").strip()
         if not normalized_campaign_id or not normalized_event_id or not normalized_user_id:
             raise ValueError("campaign_id, event_id, and user_id are required")
-        async with self._driver.session() as session:
+        async with self._session() as session:
             existing_result = await session.run(
                 """
                 MATCH (n:Notification {user_id: $user_id, event_id: $event_id})
@@ -2913,7 +3240,7 @@ class GraphService:
             if normalized_entity_id
             else None
         )
-        async with self._driver.session() as session:
+        async with self._session() as session:
             if normalized_event_id:
                 existing_result = await session.run(
                     """
@@ -3044,7 +3371,7 @@ class GraphService:
         user_id: str,
         limit: int = 50,
     ) -> List[Dict[str, Any]]:
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (n:Notification {user_id: $user_id, status: "unread"})
@@ -3098,7 +3425,7 @@ class GraphService:
     ) -> Dict[str, Any]:
         status_value = str(status or "").strip().lower()
         normalized_status = status_value if status_value in {"unread", "read", "completed"} else "unread"
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (n:Notification {id: $notification_id, user_id: $user_id})
@@ -3127,7 +3454,7 @@ class GraphService:
             return dict(record)
 
     async def count_unread_notifications(self, *, user_id: str) -> int:
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (n:Notification {user_id: $user_id, status: "unread"})
@@ -3165,7 +3492,7 @@ class GraphService:
         (backward-compatible with existing callers).
         """
         event_id = str(uuid.uuid4())
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             CREATE (e:CampaignEvent {
@@ -3251,7 +3578,7 @@ class GraphService:
 
     async def get_campaign_event_stream_state(self, campaign_id: str) -> Dict[str, Any]:
         """Read campaign event-stream version marker for SSE polling."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (c:Campaign {id: $campaign_id})
@@ -3305,7 +3632,7 @@ class GraphService:
                 raise ValueError("assigned_user_id must be a campaign member")
 
         deadline_id = str(uuid.uuid4())
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             CREATE (d:CampaignDeadline {
@@ -3389,7 +3716,7 @@ class GraphService:
         include_past: bool = False,
     ) -> List[Dict[str, Any]]:
         """List campaign deadlines visible to a specific user."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (d:CampaignDeadline {campaign_id: $campaign_id})
             WHERE
@@ -3448,7 +3775,7 @@ class GraphService:
         viewer_user_id: str,
     ) -> Dict[str, Any]:
         """Mark a visible deadline complete (idempotent)."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (d:CampaignDeadline {campaign_id: $campaign_id, id: $deadline_id})
             WHERE
@@ -3510,6 +3837,10 @@ class GraphService:
             )
             return completed
 
+    def membership_known(self, user_id: str, tenant_id: str) -> bool:
+        """True if check_membership would answer without a query (cached or "global")."""
+        return tenant_id == "global" or (user_id, tenant_id) in self._membership_cache
+
     async def check_membership(self, user_id: str, tenant_id: str) -> bool:
         """Check if a user is a member of a campaign (tenant).
         
@@ -3525,22 +3856,25 @@ class GraphService:
         # Special case: "global" tenant always allows access
         if tenant_id == "global":
             return True
+
+        cache_key = (user_id, tenant_id)
+        cached = self._membership_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        async with self._driver.session() as session:
-            query = """
-            MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(c:Campaign {id: $tenant_id})
-            RETURN count(u) > 0 as is_member
-            """
-            
-            result = await session.run(query, user_id=user_id, tenant_id=tenant_id)
+        async with self._session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_Q_CHECK_MEMBERSHIP, user_id=user_id, tenant_id=tenant_id)
             record = await result.single()
             
-            return record["is_member"] if record else False
+            is_member = bool(record["is_member"]) if record else False
+
+        self._membership_cache[cache_key] = is_member
+        return is_member
 
     async def ensure_public_conversation(self, campaign_id: str, created_by: str) -> Dict[str, Any]:
         """Ensure a single public conversation exists per campaign."""
         conversation_id = f"public:{campaign_id}"
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (c:Campaign {id: $campaign_id})
@@ -3584,7 +3918,7 @@ class GraphService:
     ) -> List[Dict[str, Any]]:
         """List public + private conversations visible to the user."""
         await self.ensure_public_conversation(campaign_id=campaign_id, created_by=user_id)
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (conv:Conversation {campaign_id: $campaign_id})
@@ -3689,7 +4023,7 @@ class GraphService:
         conversation_id = str(uuid.uuid4())
         normalized_name = str(name or "").strip() or None
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (campaign:Campaign {id: $campaign_id})
@@ -3772,7 +4106,7 @@ class GraphService:
         if normalized_history_access not in {"full", "from_join"}:
             raise ValueError("history_access must be one of: full, from_join")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (conv:Conversation {id: $conversation_id, type: "private"})
@@ -3806,7 +4140,7 @@ class GraphService:
 
     async def leave_conversation(self, *, conversation_id: str, user_id: str) -> Dict[str, Any]:
         """Leave a private conversation. Idempotent: succeeds even if already left."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (conv:Conversation {id: $conversation_id, type: "private"})
@@ -3836,7 +4170,7 @@ class GraphService:
         allow_permission_bypass: bool = False,
     ) -> List[Dict[str, Any]]:
         """Get messages for a public/private conversation with history access checks."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (conv:Conversation {id: $conversation_id, campaign_id: $campaign_id})
@@ -3960,7 +4294,7 @@ class GraphService:
             }
         )
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (conv:Conversation {id: $conversation_id, campaign_id: $campaign_id})
@@ -4106,20 +4440,13 @@ class GraphService:
         Raises:
             ValueError: If campaign doesn't exist
         """
-        async with self._driver.session() as session:
-            # First verify campaign exists
-            check_query = """
-            MATCH (c:Campaign {id: $tenant_id})
-            RETURN c.id as id
-            """
-            check_result = await session.run(check_query, tenant_id=tenant_id)
-            if not await check_result.single():
-                raise ValueError(f"Campaign {tenant_id} not found")
-            
-            # Add member
+        async with self._session() as session:
+            # One round trip: a missing campaign ends the pipeline at MATCH, so nothing is
+            # merged and no record comes back.
             query = """
-            MERGE (u:User {id: $target_user_id})
             MATCH (c:Campaign {id: $tenant_id})
+            WITH c
+            MERGE (u:User {id: $target_user_id})
             MERGE (u)-[r:MEMBER_OF]->(c)
             SET
                 r.role = $role,
@@ -4128,16 +4455,18 @@ class GraphService:
             RETURN c.id as tenant_id, u.id as user_id, r.role as role
             """
             
-            result = await session.run(
-                query,
-                tenant_id=tenant_id,
-                target_user_id=target_user_id,
-                role=role
-            )
-            record = await result.single()
-            
-            if not record:
-                raise Exception("Failed to add member")
+            try:
+                record = await session.execute_write(
+                    _tx_single,
+                    query,
+                    tenant_id=tenant_id,
+                    target_user_id=target_user_id,
+                    role=role,
+                )
+            except ResultNotSingleError as exc:
+                raise ValueError(f"Campaign {tenant_id} not found") from exc
+
+            self._invalidate_membership(tenant_id, target_user_id)
             
             return {
                 "tenant_id": record["tenant_id"],
@@ -4192,7 +4521,7 @@ class GraphService:
             }
         )
         
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             MERGE (u:User {id: $user_id})
@@ -4211,17 +4540,17 @@ class GraphService:
                 u.avatar_url as author_avatar_url
             """
             
-            result = await session.run(
-                query,
-                campaign_id=campaign_id,
-                user_id=user_id,
-                message_id=message_id,
-                content=content
-            )
-            record = await result.single()
-            
-            if not record:
-                raise Exception("Failed to create team message")
+            try:
+                record = await session.execute_write(
+                    _tx_single,
+                    query,
+                    campaign_id=campaign_id,
+                    user_id=user_id,
+                    message_id=message_id,
+                    content=content,
+                )
+            except ResultNotSingleError as exc:
+                raise Exception("Failed to create team message") from exc
             author_identity = await self.resolve_user_identity(
                 user_id=str(record.get("author_id") or "").strip(),
                 email_fallback=user.get("email"),
@@ -4298,7 +4627,7 @@ class GraphService:
         if invalid_members:
             raise ValueError("All thread members must be campaign members")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (c:Campaign {id: $campaign_id})
             MERGE (creator:User {id: $created_by_user_id})
@@ -4348,7 +4677,7 @@ class GraphService:
         self, campaign_id: str, user_id: str
     ) -> List[Dict[str, Any]]:
         """List private chat threads in campaign that the user belongs to."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (u:User {id: $user_id})-[:THREAD_MEMBER]->(t:ChatThread {tenant_id: $campaign_id, is_private: true})-[:THREAD_IN]->(:Campaign {id: $campaign_id})
             OPTIONAL MATCH (u)-[read:THREAD_READ]->(t)
@@ -4388,7 +4717,7 @@ class GraphService:
 
     async def get_team_comms_unread_status(self, campaign_id: str, user_id: str) -> Dict[str, Any]:
         """Return unread status for the main Team Comms thread for a user."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(c:Campaign {id: $campaign_id})
             OPTIONAL MATCH (u)-[read:TEAM_CHAT_READ]->(c)
@@ -4409,7 +4738,7 @@ class GraphService:
         self, campaign_id: str, thread_id: str, user_id: str, limit: int = 50, since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get messages from a private campaign thread for an authorized thread member."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             membership_query = """
             MATCH (u:User {id: $user_id})-[:THREAD_MEMBER]->(t:ChatThread {id: $thread_id, tenant_id: $campaign_id, is_private: true})
             RETURN t.id as thread_id
@@ -4527,7 +4856,7 @@ class GraphService:
             }
         )
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             membership_query = """
             MATCH (u:User {id: $user_id})-[:THREAD_MEMBER]->(t:ChatThread {id: $thread_id, tenant_id: $campaign_id, is_private: true})
             RETURN t.id as thread_id
@@ -4641,7 +4970,7 @@ class GraphService:
         if len(content) > 2000:
             raise ValueError("Message content cannot exceed 2000 characters")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             # Fetch message + author for explicit author check.
             lookup_query = """
             MATCH (c:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)<-[:SENT]-(u:User)
@@ -4706,7 +5035,7 @@ class GraphService:
         self, campaign_id: str, message_id: str, user_id: str
     ) -> Dict[str, Any]:
         """Soft-delete a team message (author only)."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             lookup_query = """
             MATCH (c:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)<-[:SENT]-(u:User)
             WHERE m.id = $message_id
@@ -4768,8 +5097,8 @@ class GraphService:
     ) -> List[Dict[str, Any]]:
         """Get team messages for a campaign.
         
-        Returns messages ordered by timestamp (newest first), then reversed
-        to return in chronological order (oldest -> newest).
+        Returns the newest ``limit`` messages (after ``since``, if given), in
+        chronological order (oldest -> newest) as sorted by Neo4j.
         
         Args:
             campaign_id: Campaign ID to get messages for
@@ -4780,73 +5109,42 @@ class GraphService:
             List of message dictionaries: [{id, content, timestamp (ISO string), author_id}, ...]
             Ordered chronologically (oldest -> newest)
         """
-        async with self._driver.session() as session:
-            if since:
-                # Parse ISO timestamp and use it in query
-                # Neo4j datetime() can parse ISO 8601 strings directly
-                query = """
-                MATCH (c:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)<-[:SENT]-(u:User)
-                WHERE m.timestamp > datetime($since)
-                RETURN
-                    m.id as id,
-                    m.content as content,
-                    toString(m.timestamp) as timestamp,
-                    u.id as author_id,
-                    u.avatar_url as author_avatar_url,
-                    toString(m.edited_at) as edited_at,
-                    toString(m.deleted_at) as deleted_at
-                ORDER BY m.timestamp DESC
-                LIMIT $limit
-                """
-                result = await session.run(
-                    query,
-                    campaign_id=campaign_id,
-                    since=since,  # ISO 8601 string, e.g., "2024-01-01T12:00:00Z"
-                    limit=limit
-                )
-            else:
-                query = """
-                MATCH (c:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)<-[:SENT]-(u:User)
-                RETURN
-                    m.id as id,
-                    m.content as content,
-                    toString(m.timestamp) as timestamp,
-                    u.id as author_id,
-                    u.avatar_url as author_avatar_url,
-                    toString(m.edited_at) as edited_at,
-                    toString(m.deleted_at) as deleted_at
-                ORDER BY m.timestamp DESC
-                LIMIT $limit
-                """
-                result = await session.run(
-                    query,
-                    campaign_id=campaign_id,
-                    limit=limit
-                )
+        async with self._session() as session:
+            # One query for both cases: a null $since disables the filter.
+            # Neo4j datetime() can parse ISO 8601 strings directly
+            query = """
+            MATCH (c:Campaign {id: $campaign_id})<-[:POSTED_IN]-(m:TeamMessage)<-[:SENT]-(u:User)
+            WHERE $since IS NULL OR m.timestamp > datetime($since)
+            WITH m, u
+            ORDER BY m.timestamp DESC
+            LIMIT $limit
+            RETURN
+                m.id as id,
+                m.content as content,
+                toString(m.timestamp) as timestamp,
+                u.id as author_id,
+                u.avatar_url as author_avatar_url,
+                toString(m.edited_at) as edited_at,
+                toString(m.deleted_at) as deleted_at
+            ORDER BY m.timestamp ASC
+            """
+            result = await session.run(
+                query,
+                campaign_id=campaign_id,
+                since=since or None,  # ISO 8601 string, e.g., "2024-01-01T12:00:00Z"
+                limit=limit
+            )
             
-            messages = []
-            async for record in result:
-                messages.append({
-                    "id": record["id"],
-                    "content": record["content"],
-                    "timestamp": record["timestamp"],
-                    "author_id": str(record.get("author_id") or "").strip(),
-                    "author_display_name": "",
-                    "author_avatar_url": record.get("author_avatar_url"),
-                    "edited_at": record.get("edited_at"),
-                    "deleted_at": record.get("deleted_at"),
-                })
+            messages = await result.data()
+            for item in messages:
+                item["author_id"] = str(item.get("author_id") or "").strip()
             identity_map = await self.resolve_user_identities_batch(
-                [str(item.get("author_id") or "").strip() for item in messages]
+                [item["author_id"] for item in messages]
             )
             for item in messages:
-                author_id = str(item.get("author_id") or "").strip()
-                identity = identity_map.get(author_id) or {}
+                identity = identity_map.get(item["author_id"]) or {}
                 item["author_display_name"] = identity.get("display_name") or "Unknown user"
                 item["author_avatar_url"] = identity.get("avatar_url") or item.get("author_avatar_url")
-            
-            # Reverse to get chronological order (oldest -> newest)
-            messages.reverse()
 
             # Opening Team Comms marks it read for this user.
             if user_id:
@@ -4871,13 +5169,8 @@ class GraphService:
         Returns:
             Role string ("Lead" or "Member") if user is a member, None otherwise
         """
-        async with self._driver.session() as session:
-            query = """
-            MATCH (u:User {id: $user_id})-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
-            RETURN r.role as role
-            """
-            
-            result = await session.run(query, user_id=user_id, campaign_id=campaign_id)
+        async with self._session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(_Q_MEMBER_ROLE, user_id=user_id, campaign_id=campaign_id)
             record = await result.single()
             
             return record["role"] if record else None
@@ -4891,7 +5184,7 @@ class GraphService:
         Returns:
             List of member dictionaries: [{id, email, role}, ...]
         """
-        async with self._driver.session() as session:
+        async with self._session(default_access_mode=READ_ACCESS) as session:
             query = """
             MATCH (u:User)-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
             RETURN u.id as id, u.email as email, r.role as role
@@ -4899,16 +5192,7 @@ class GraphService:
             """
             
             result = await session.run(query, campaign_id=campaign_id)
-            
-            members = []
-            async for record in result:
-                members.append({
-                    "id": record["id"],
-                    "email": record.get("email", ""),
-                    "role": record["role"]
-                })
-            
-            return members
+            return await result.data()
 
     async def list_campaign_members_for_mentions(
         self, campaign_id: str
@@ -4917,7 +5201,7 @@ class GraphService:
 
         Returns only users who are members of this campaign.
         """
-        async with self._driver.session() as session:
+        async with self._session(default_access_mode=READ_ACCESS) as session:
             query = """
             MATCH (u:User)-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
             RETURN
@@ -4998,7 +5282,7 @@ class GraphService:
 
     async def get_user_status(self, user_id: str) -> Dict[str, Any]:
         """Get global manual status for a user."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (u:User {id: $user_id})
             RETURN
@@ -5026,7 +5310,7 @@ class GraphService:
         if normalized_status not in {"active", "away", "in_meeting"}:
             raise ValueError("status must be active, away, or in_meeting")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             SET
@@ -5058,7 +5342,7 @@ class GraphService:
         email_fallback: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get Riley-native user profile fields."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (u:User {id: $user_id})
             RETURN
@@ -5302,7 +5586,7 @@ class GraphService:
         if isinstance(display_name, str):
             normalized_display_name = display_name.strip() or None
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             SET
@@ -5341,7 +5625,7 @@ class GraphService:
         avatar_url: Optional[str] = None,
     ) -> None:
         """Best-effort identity enrichment for User nodes."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             ON CREATE SET
@@ -5382,7 +5666,7 @@ class GraphService:
         if not normalized_user_id:
             raise ValueError("clerk user id is required")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             ON CREATE SET
@@ -5413,7 +5697,7 @@ class GraphService:
         if not normalized_user_id:
             raise ValueError("clerk user id is required")
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MERGE (u:User {id: $user_id})
             ON CREATE SET u.created_at = datetime()
@@ -5436,7 +5720,7 @@ class GraphService:
             return []
         capped_limit = max(1, min(int(limit), 20))
 
-        async with self._driver.session() as session:
+        async with self._session() as session:
             result = await session.run(
                 """
                 MATCH (u:User)
@@ -5488,7 +5772,7 @@ class GraphService:
 
     async def get_campaign_member_ids(self, campaign_id: str) -> List[str]:
         """Return all user IDs that are members of a campaign."""
-        async with self._driver.session() as session:
+        async with self._session() as session:
             query = """
             MATCH (u:User)-[:MEMBER_OF]->(c:Campaign {id: $campaign_id})
             RETURN u.id as user_id
@@ -5526,23 +5810,17 @@ class GraphService:
         Raises:
             ValueError: If campaign doesn't exist
         """
-        async with self._driver.session() as session:
-            # First verify campaign exists
-            check_query = """
-            MATCH (c:Campaign {id: $campaign_id})
-            RETURN c.id as id
-            """
-            check_result = await session.run(check_query, campaign_id=campaign_id)
-            if not await check_result.single():
-                raise ValueError(f"Campaign {campaign_id} not found")
-            
-            # Add or update member (idempotent MERGE, no duplicate relationships)
+        async with self._session() as session:
+            # Add or update member (idempotent MERGE, no duplicate relationships) in one
+            # round trip; a missing campaign ends the pipeline at MATCH and returns no record.
             query = """
+            MATCH (c:Campaign {id: $campaign_id})
+            WITH c
             MERGE (u:User {id: $target_user_id})
             SET u.email = $target_email
             SET u.first_name = coalesce($target_first_name, u.first_name)
             SET u.last_name = coalesce($target_last_name, u.last_name)
-            MATCH (c:Campaign {id: $campaign_id})
+            WITH u, c
             OPTIONAL MATCH (u)-[existing:MEMBER_OF]->(c)
             WITH u, c, existing
             MERGE (u)-[r:MEMBER_OF]->(c)
@@ -5556,18 +5834,20 @@ class GraphService:
                 (existing IS NOT NULL) as already_member
             """
 
-            result = await session.run(
-                query,
-                campaign_id=campaign_id,
-                target_user_id=target_user_id,
-                target_email=target_email,
-                role=role,
-                target_first_name=target_first_name,
-                target_last_name=target_last_name,
-            )
-            record = await result.single()
-            if not record:
-                raise Exception("Failed to add or load campaign membership")
+            try:
+                record = await session.execute_write(
+                    _tx_single,
+                    query,
+                    campaign_id=campaign_id,
+                    target_user_id=target_user_id,
+                    target_email=target_email,
+                    role=role,
+                    target_first_name=target_first_name,
+                    target_last_name=target_last_name,
+                )
+            except ResultNotSingleError as exc:
+                raise ValueError(f"Campaign {campaign_id} not found") from exc
+            self._invalidate_membership(campaign_id, target_user_id)
             return {
                 "campaign_id": record.get("campaign_id"),
                 "campaign_name": record.get("campaign_name"),
@@ -5599,20 +5879,35 @@ class GraphService:
             ValueError: If the membership relationship doesn't exist, or if
                 removing this member would leave the campaign with zero Leads.
         """
-        async with self._driver.session() as session:
-            lookup_query = """
-            MATCH (c:Campaign {id: $campaign_id})
-            OPTIONAL MATCH (u:User {id: $target_user_id})-[r:MEMBER_OF]->(c)
-            OPTIONAL MATCH (lead:User)-[lr:MEMBER_OF]->(c)
-            WHERE lr.role = "Lead"
-            RETURN
-                c.id as campaign_id,
-                c.name as campaign_name,
-                (r IS NOT NULL) as is_member,
-                r.role as role,
-                count(DISTINCT lead) as lead_count
-            """
-            lookup_result = await session.run(
+        lookup_query = """
+        MATCH (c:Campaign {id: $campaign_id})
+        SET c._LOCK_ = true
+        WITH c
+        OPTIONAL MATCH (u:User {id: $target_user_id})-[r:MEMBER_OF]->(c)
+        OPTIONAL MATCH (lead:User)-[lr:MEMBER_OF]->(c)
+        WHERE lr.role = "Lead"
+        RETURN
+            c.id as campaign_id,
+            c.name as campaign_name,
+            (r IS NOT NULL) as is_member,
+            r.role as role,
+            count(DISTINCT lead) as lead_count
+        """
+        delete_query = """
+        MATCH (u:User {id: $target_user_id})-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
+        DELETE r
+        WITH c, count(r) as deleted_count
+        REMOVE c._LOCK_
+        RETURN deleted_count
+        """
+
+        async def _remove(tx: Any) -> Dict[str, Any]:
+            # Reads take no locks under read-committed isolation, so two removals of different
+            # Leads could both count two Leads and both commit. The lookup first sets a
+            # property on the Campaign, taking its write lock until commit: concurrent
+            # removals queue there and count Leads only after the earlier one committed.
+            # Raising here rolls back the delete and the lock property.
+            lookup_result = await tx.run(
                 lookup_query,
                 campaign_id=campaign_id,
                 target_user_id=target_user_id,
@@ -5632,12 +5927,7 @@ class GraphService:
                     "Cannot remove the sole remaining Lead. Promote another member to Lead first."
                 )
 
-            delete_query = """
-            MATCH (u:User {id: $target_user_id})-[r:MEMBER_OF]->(c:Campaign {id: $campaign_id})
-            DELETE r
-            RETURN count(r) as deleted_count
-            """
-            delete_result = await session.run(
+            delete_result = await tx.run(
                 delete_query,
                 campaign_id=campaign_id,
                 target_user_id=target_user_id,
@@ -5647,6 +5937,12 @@ class GraphService:
                 raise ValueError(
                     f"User {target_user_id} is not a member of campaign {campaign_id}"
                 )
+            return {**lookup_record.data(), "role": role_value}
+
+        async with self._session() as session:
+            lookup_record = await session.execute_write(_remove)
+            role_value = lookup_record["role"]
+            self._invalidate_membership(campaign_id, target_user_id)
 
             return {
                 "campaign_id": lookup_record.get("campaign_id"),
@@ -5656,7 +5952,12 @@ class GraphService:
             }
 
 
-# Global service instance that can be imported by routers.
-# Note: This will be initialized in main.py startup event.
-graph_service: Optional[GraphService] = None
+@lru_cache(maxsize=1)
+def get_graph_service() -> GraphService:
+    """Return the process-wide GraphService (one driver, one connection pool).
+
+    main.py stores this instance on app.state.graph; code outside request scope should call
+    this instead of constructing GraphService() so it doesn't open another pool.
+    """
+    return GraphService()
 
@@ -4,37 +4,95 @@ import io
 import logging
 import csv
 import json
+import multiprocessing
 import re
+import os
+import shutil
 import uuid
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
+from cachetools import TTLCache
 from fastapi import UploadFile, HTTPException
 from fastapi.concurrency import run_in_threadpool
+import numpy as np
 from qdrant_client import models as qdrant_models
 from qdrant_client.http.models import PointStruct, Filter, FieldCondition, MatchValue
 from google.cloud import tasks_v2
 from google.api_core.exceptions import AlreadyExists
 
 from app.core.config import get_settings
-from app.services.genai_client import get_genai_client
+from app.services.genai_client import embed_batched
 from app.services.llm_cost_guardrail import enforce_monthly_llm_cost_guardrail
 from app.services.ocr import (
+    IMAGE_EXTENSIONS,
     gcs_uri_from_url,
-    is_image_ext,
     run_ocr,
     run_ocr_document_from_gcs,
 )
-from app.services.preview import is_office_or_html, generate_pdf_preview
+from app.services.preview import convert_with_daemon, generate_pdf_preview, is_office_or_html
 from app.services.qdrant import vector_service
+from app.services.query_cache import get_or_compute
 from app.services.storage import StorageService
 from app.services.token_utils import estimate_tokens
 from app.services.visual_understanding import summarize_visual_content
 
+# Optional extractor libraries are imported once per process (including process-pool
+# workers); a missing library leaves its name as None and that format degrades gracefully.
+try:
+    import fitz  # type: ignore  # PyMuPDF
+except ImportError:  # pragma: no cover - depends on installed extras
+    fitz = None  # type: ignore
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # pragma: no cover - depends on installed extras
+    PdfReader = None  # type: ignore
+
+try:
+    from docx import Document
+except ImportError:  # pragma: no cover - depends on installed extras
+    Document = None  # type: ignore
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # pragma: no cover - depends on installed extras
+    load_workbook = None  # type: ignore
+
+try:
+    from pptx import Presentation
+    from pptx.enum.shapes import MSO_SHAPE_TYPE  # type: ignore
+except ImportError:  # pragma: no cover - depends on installed extras
+    Presentation = None  # type: ignore
+    MSO_SHAPE_TYPE = None  # type: ignore
+
+try:
+    from bs4 import BeautifulSoup, FeatureNotFound
+except ImportError:  # pragma: no cover - depends on installed extras
+    BeautifulSoup = None  # type: ignore
+    FeatureNotFound = None  # type: ignore
+
+try:
+    from striprtf.striprtf import rtf_to_text
+except ImportError:  # pragma: no cover - depends on installed extras
+    rtf_to_text = None  # type: ignore
+
+try:
+    import textract
+except ImportError:  # pragma: no cover - depends on installed extras
+    textract = None  # type: ignore
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Constants for text extraction limits
 MAX_CHARS_TOTAL = 20_000
 CONTENT_PREVIEW_LENGTH = 1_000
@@ -61,12 +119,91 @@ MIN_MEANINGFUL_TOTAL_CHARS = 120
 MIN_PARTIAL_TOTAL_CHARS = 35
 MAX_RETRYABLE_INGESTION_ATTEMPTS = 5
 
+# Settings are process-wide (get_settings is cached), so upload hot-path constants are bound once.
+_SETTINGS = get_settings()
+EMBEDDING_MODEL = _SETTINGS.EMBEDDING_MODEL
+EMBEDDING_DIM = int(_SETTINGS.EMBEDDING_DIM)
+TIER_1_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_1
+TIER_2_COLLECTION = _SETTINGS.QDRANT_COLLECTION_TIER_2
+MAX_UPLOAD_BYTES = int(_SETTINGS.MAX_UPLOAD_MB) * 1024 * 1024
+PREVIEW_BUCKET_PATH_PREFIX = _SETTINGS.PREVIEW_BUCKET_PATH_PREFIX
+RILEY_VISION_ENABLED = bool(_SETTINGS.RILEY_VISION_ENABLED)
+ENABLE_PREVIEW_GENERATION = bool(_SETTINGS.ENABLE_PREVIEW_GENERATION)
+
 TEXT_NATIVE_EXTENSIONS = {
     "pdf", "docx", "doc", "pptx", "ppt", "txt", "md", "rtf",
     "html", "htm", "csv", "xlsx", "xls", "json", "tsv",
 }
 
-IMAGE_EXTENSIONS = {"png", "jpg", "jpeg", "webp", "tiff"}
+
+@dataclass(frozen=True)
+class FileTypePolicy:
+    """Per-extension upload/ingestion behavior, looked up once instead of re-derived."""
+
+    is_image: bool = False
+    # Layout-heavy documents whose thin native text means OCR should be tried.
+    ocr_capable_doc: bool = False
+    # Parent-file content shown before Riley Memory is enabled for the file.
+    upload_placeholder: str = ""
+
+
+_DEFAULT_FILE_TYPE_POLICY = FileTypePolicy()
+_IMAGE_FILE_TYPE_POLICY = FileTypePolicy(
+    is_image=True,
+    upload_placeholder="[Image file — Riley Memory is off by default; enable it to start OCR/ingestion]",
+)
+_OCR_CAPABLE_DOC_POLICY = FileTypePolicy(ocr_capable_doc=True)
+
+FILE_TYPE_POLICY: Dict[str, FileTypePolicy] = {
+    "pdf": _OCR_CAPABLE_DOC_POLICY,
+    "pptx": _OCR_CAPABLE_DOC_POLICY,
+    "ppt": _OCR_CAPABLE_DOC_POLICY,
+    **{ext: _IMAGE_FILE_TYPE_POLICY for ext in IMAGE_EXTENSIONS},
+}
+
+
+def _file_type_policy(ext: str) -> FileTypePolicy:
+    return FILE_TYPE_POLICY.get(ext, _DEFAULT_FILE_TYPE_POLICY)
+
+
+# CPU-bound pure-Python parsers (python-docx, openpyxl, python-pptx, BeautifulSoup) hold the
+# GIL, so a thread pool serializes concurrent uploads. They run in a process pool instead,
+# created lazily (after gunicorn forks workers) and capped so large uploads can't pile up.
+# Workers come from a forkserver, never a fork of this process: by then it runs gRPC channel
+# and threadpool threads, and forking a multi-threaded gRPC process can deadlock the child.
+CPU_POOL_MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_cpu_pool_slots = asyncio.Semaphore(CPU_POOL_MAX_WORKERS)
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    global _cpu_pool
+    if _cpu_pool is None:
+        _cpu_pool = ProcessPoolExecutor(
+            max_workers=CPU_POOL_MAX_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _cpu_pool
+
+
+async def shutdown_cpu_pool() -> None:
+    """Stop the extraction process pool (application shutdown); queued parses are cancelled."""
+    global _cpu_pool
+    pool, _cpu_pool = _cpu_pool, None
+    if pool is not None:
+        await run_in_threadpool(pool.shutdown, wait=True, cancel_futures=True)
+
+
+async def _run_in_cpu_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run a module-level function in the extraction process pool (args must pickle)."""
+    global _cpu_pool
+    async with _cpu_pool_slots:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(_get_cpu_pool(), func, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM on a huge file); start a fresh pool for later calls.
+            _cpu_pool = None
+            raise
 
 
 class IngestionPermanentFailure(RuntimeError):
@@ -96,6 +233,19 @@ def _format_file_size(size_bytes: int) -> str:
 
 
 
+def _uuid7() -> str:
+    """RFC 9562 UUIDv7: 48-bit Unix-ms timestamp, then 74 random bits (uuid.uuid7 is 3.14+)."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _file_extension(filename: str) -> str:
+    """Lower-cased text after the last dot, or "" when the name has no dot."""
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
 async def extract_text(
     file_bytes: bytes, filename: str
 ) -> str:
@@ -112,57 +262,53 @@ async def extract_text(
         Extracted text string, truncated to MAX_CHARS_TOTAL
         Returns "[Binary file — no text extracted]" on failure
     """
-    # Normalize file extension
-    file_ext = filename.split(".")[-1].lower() if "." in filename else ""
-    
+    extractor = TEXT_EXTRACTORS.get(_file_extension(filename))
+    if extractor is None:
+        return "[Unsupported file type for text extraction]"
+
     try:
-        if file_ext == "pdf":
-            return await _extract_text_from_pdf(file_bytes)
-        elif file_ext == "docx":
-            return await _extract_text_from_docx(file_bytes)
-        elif file_ext == "doc":
-            return await _extract_text_from_doc(file_bytes)
-        elif file_ext == "pptx":
-            return await _extract_text_from_pptx(file_bytes)
-        elif file_ext == "ppt":
-            return await _extract_text_from_ppt(file_bytes)
-        elif file_ext == "xlsx":
-            return await _extract_text_from_xlsx(file_bytes)
-        elif file_ext == "xls":
-            return await _extract_text_from_xls(file_bytes)
-        elif file_ext in ("html", "htm"):
-            return await _extract_text_from_html(file_bytes)
-        elif file_ext in ("txt", "md"):
-            return await _extract_text_from_plain_text(file_bytes)
-        elif file_ext == "csv":
-            return await _extract_text_from_csv_like(file_bytes, delimiter=",")
-        elif file_ext == "tsv":
-            return await _extract_text_from_csv_like(file_bytes, delimiter="\t")
-        elif file_ext == "json":
-            return await _extract_text_from_json(file_bytes)
-        elif file_ext == "rtf":
-            return await _extract_text_from_rtf(file_bytes)
-        elif file_ext in ("png", "jpg", "jpeg", "webp", "tiff"):
-            # OCR is never performed during extraction - must use dedicated endpoint
-            return await _extract_text_from_image(file_bytes, enable_ocr=False)
-        else:
-            return "[Unsupported file type for text extraction]"
+        return await extractor(file_bytes)
     except Exception as exc:
         logger.warning(f"Text extraction failed for {filename}: {type(exc).__name__}: {exc}")
         return "[Binary file — no text extracted]"
 
 
+def _iter_pdf_page_texts(file_content: bytes) -> Iterator[str]:
+    """Yield each PDF page's text in order.
+
+    Uses PyMuPDF (native MuPDF extraction) when installed and falls back
+    to pure-Python pypdf. Closing the generator early closes the document.
+    """
+    if fitz is not None:
+        doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            for page in doc:
+                yield page.get_text() or ""
+        finally:
+            doc.close()
+        return
+
+    reader = PdfReader(io.BytesIO(file_content))
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
 async def _extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from a PDF file using pypdf from file content in memory."""
+    """Extract text from a PDF file (PyMuPDF, pypdf fallback) from file content in memory."""
+    if fitz is None and PdfReader is None:
+        logger.error("No PDF library installed. Install with: pip install PyMuPDF")
+        return "[PDF extraction unavailable — PyMuPDF/pypdf not installed]"
     try:
-        from pypdf import PdfReader
-        
         def _read_pdf():
-            pdf_file = io.BytesIO(file_content)
-            reader = PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            parts: List[str] = []
+            total_chars = 0
+            for page_text in _iter_pdf_page_texts(file_content):
+                parts.append(page_text)
+                total_chars += len(page_text) + 1
+                # Later pages would be truncated away; stop extracting them.
+                if total_chars >= MAX_CHARS_TOTAL:
+                    break
+            text = "\n".join(parts)
             # Cap at MAX_CHARS_TOTAL
             if len(text) > MAX_CHARS_TOTAL:
                 text = text[:MAX_CHARS_TOTAL]
@@ -170,14 +316,32 @@ async def _extract_text_from_pdf(file_content: bytes) -> str:
         
         # Run blocking I/O in threadpool
         return await run_in_threadpool(_read_pdf)
-    except ImportError:
-        logger.error("pypdf is not installed. Install with: pip install pypdf")
-        return "[PDF extraction unavailable — pypdf not installed]"
     except Exception as exc:
         logger.warning(f"PDF extraction failed: {exc}")
         return "[Binary file — no text extracted]"
 
 
+def _read_docx(file_content: bytes) -> str:
+    """Process-pool worker for _extract_text_from_docx (module-level so it pickles)."""
+    docx_file = io.BytesIO(file_content)
+    doc = Document(docx_file)
+    text_parts = []
+
+    # Extract text from all paragraphs
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            text_parts.append(paragraph.text.strip())
+
+    # Join paragraphs with newlines
+    text = "\n".join(text_parts)
+
+    # Cap at MAX_CHARS_TOTAL
+    if len(text) > MAX_CHARS_TOTAL:
+        text = text[:MAX_CHARS_TOTAL]
+
+    return text
+
+
 async def _extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from a DOCX file using python-docx from file content in memory.
     
@@ -190,38 +354,61 @@ async def _extract_text_from_docx(file_content: bytes) -> str:
     Raises:
         HTTPException: If extraction fails or library is not installed
     """
-    try:
-        from docx import Document
-        
-        def _read_docx():
-            docx_file = io.BytesIO(file_content)
-            doc = Document(docx_file)
-            text_parts = []
-            
-            # Extract text from all paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text.strip())
-            
-            # Join paragraphs with newlines
-            text = "\n".join(text_parts)
-            
-            # Cap at MAX_CHARS_TOTAL
-            if len(text) > MAX_CHARS_TOTAL:
-                text = text[:MAX_CHARS_TOTAL]
-            
-            return text
-        
-        # Run blocking I/O in threadpool
-        return await run_in_threadpool(_read_docx)
-    except ImportError:
+    if Document is None:
         logger.error("python-docx is not installed. Install with: pip install python-docx")
         return "[DOCX extraction unavailable — python-docx not installed]"
+    try:
+        # Pure-Python parser: run in the process pool so concurrent uploads use all cores
+        return await _run_in_cpu_pool(_read_docx, file_content)
     except Exception as exc:
         logger.warning(f"DOCX extraction failed: {exc}")
         return "[Binary file — no text extracted]"
 
 
+def _read_xlsx(file_content: bytes) -> str:
+    """Process-pool worker for _extract_text_from_xlsx (module-level so it pickles)."""
+    xlsx_file = io.BytesIO(file_content)
+    # read_only streams rows from the sheet XML instead of loading every cell and style
+    workbook = load_workbook(xlsx_file, data_only=True, read_only=True)
+    text_parts = []
+
+    try:
+        # Process up to XLSX_MAX_SHEETS sheets
+        for sheet_name in workbook.sheetnames[:XLSX_MAX_SHEETS]:
+            sheet = workbook[sheet_name]
+            sheet_text_parts = []
+
+            # Read-only sheets pad rows out to max_col, so bound it by the sheet's own width
+            # (from its dimension record, when present) to keep the CSV-style output unchanged.
+            max_col = min(XLSX_MAX_COLS, sheet.max_column or XLSX_MAX_COLS)
+
+            # Process up to XLSX_MAX_ROWS rows and XLSX_MAX_COLS columns per row
+            for row in sheet.iter_rows(max_row=XLSX_MAX_ROWS, max_col=max_col, values_only=True):
+                # Convert cell values to strings, handling None
+                row_values = ["" if cell_value is None else str(cell_value) for cell_value in row]
+
+                # Join row values as CSV-style (comma-separated)
+                if any(row_values):  # Only add non-empty rows
+                    sheet_text_parts.append(",".join(row_values))
+
+            # Add sheet content with sheet name header
+            if sheet_text_parts:
+                text_parts.append(f"Sheet: {sheet_name}")
+                text_parts.extend(sheet_text_parts)
+    finally:
+        # Read-only workbooks keep the zip archive open until closed
+        workbook.close()
+
+    # Join all text parts with newlines
+    text = "\n".join(text_parts)
+
+    # Cap at MAX_CHARS_TOTAL
+    if len(text) > MAX_CHARS_TOTAL:
+        text = text[:MAX_CHARS_TOTAL]
+
+    return text
+
+
 async def _extract_text_from_xlsx(file_content: bytes) -> str:
     """Extract text from an XLSX file using openpyxl from file content in memory.
     
@@ -237,101 +424,106 @@ async def _extract_text_from_xlsx(file_content: bytes) -> str:
     Raises:
         HTTPException: If extraction fails or library is not installed
     """
-    try:
-        from openpyxl import load_workbook
-        
-        def _read_xlsx():
-            xlsx_file = io.BytesIO(file_content)
-            workbook = load_workbook(xlsx_file, data_only=True)
-            text_parts = []
-            
-            # Process up to XLSX_MAX_SHEETS sheets
-            sheet_count = 0
-            for sheet_name in workbook.sheetnames:
-                if sheet_count >= XLSX_MAX_SHEETS:
-                    break
-                
-                sheet = workbook[sheet_name]
-                sheet_text_parts = []
-                
-                # Process up to XLSX_MAX_ROWS rows
-                for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
-                    if row_idx >= XLSX_MAX_ROWS:
-                        break
-                    
-                    # Process up to XLSX_MAX_COLS columns per row
-                    row_values = []
-                    for col_idx, cell_value in enumerate(row):
-                        if col_idx >= XLSX_MAX_COLS:
-                            break
-                        
-                        # Convert cell value to string, handling None
-                        if cell_value is not None:
-                            row_values.append(str(cell_value))
-                        else:
-                            row_values.append("")
-                    
-                    # Join row values as CSV-style (comma-separated)
-                    if any(row_values):  # Only add non-empty rows
-                        sheet_text_parts.append(",".join(row_values))
-                
-                # Add sheet content with sheet name header
-                if sheet_text_parts:
-                    text_parts.append(f"Sheet: {sheet_name}")
-                    text_parts.extend(sheet_text_parts)
-                
-                sheet_count += 1
-            
-            # Join all text parts with newlines
-            text = "\n".join(text_parts)
-            
-            # Cap at MAX_CHARS_TOTAL
-            if len(text) > MAX_CHARS_TOTAL:
-                text = text[:MAX_CHARS_TOTAL]
-            
-            return text
-        
-        # Run blocking I/O in threadpool
-        return await run_in_threadpool(_read_xlsx)
-    except ImportError:
+    if load_workbook is None:
         logger.error("openpyxl is not installed. Install with: pip install openpyxl")
         return "[XLSX extraction unavailable — openpyxl not installed]"
+    try:
+        # Pure-Python parser: run in the process pool so concurrent uploads use all cores
+        return await _run_in_cpu_pool(_read_xlsx, file_content)
     except Exception as exc:
         logger.warning(f"XLSX extraction failed: {exc}")
         return "[Binary file — no text extracted]"
 
 
+DOC_CONVERT_TIMEOUT_SECONDS = 30.0
+
+
+def _stage_doc_conversion(file_content: bytes) -> str:
+    tmpdir = tempfile.mkdtemp(prefix="riley_doc_")
+    with open(os.path.join(tmpdir, "source.doc"), "wb") as handle:
+        handle.write(file_content)
+    return tmpdir
+
+
+def _read_doc_conversion(tmpdir: str) -> Optional[str]:
+    output_path = os.path.join(tmpdir, "source.txt")
+    if not os.path.exists(output_path):
+        return None
+    with open(output_path, "rb") as handle:
+        return handle.read().decode("utf-8-sig", errors="ignore")
+
+
 async def _extract_text_from_doc(file_content: bytes) -> str:
-    """Extract text from a DOC file using textract (legacy binary format).
-    
+    """Extract text from a DOC file (legacy binary format) with LibreOffice.
+
+    When the warm unoserver daemon is running (see preview.py), the DOC is converted to DOCX
+    there and read like any other DOCX. Otherwise runs `soffice --headless --convert-to txt`
+    on a temp copy under a hard timeout, so a malformed file cannot hang the ingestion job.
+
     Args:
         file_content: The DOC file content as bytes
-        
+
     Returns:
         Extracted text, capped at MAX_CHARS_TOTAL
     """
+    docx_bytes = await convert_with_daemon(file_content, "docx")
+    if docx_bytes:
+        return await _extract_text_from_docx(docx_bytes)
+
+    # Temp-dir setup, read-back and cleanup (including the LibreOffice profile) are blocking
+    # filesystem work, so they run in the threadpool.
+    tmpdir = await run_in_threadpool(_stage_doc_conversion, file_content)
     try:
-        import textract
-        
-        def _read_doc():
-            doc_file = io.BytesIO(file_content)
-            # textract can work with BytesIO
-            text = textract.process(doc_file, extension='doc', encoding='utf-8')
-            if isinstance(text, bytes):
-                text = text.decode('utf-8', errors='ignore')
-            # Cap at MAX_CHARS_TOTAL
-            if len(text) > MAX_CHARS_TOTAL:
-                text = text[:MAX_CHARS_TOTAL]
-            return text
-        
-        # Run blocking I/O in threadpool
-        return await run_in_threadpool(_read_doc)
-    except ImportError:
-        logger.error("textract is not installed. Install with: pip install textract")
-        return "[DOC extraction unavailable — textract not installed]"
-    except Exception as exc:
-        logger.warning(f"DOC extraction failed: {exc}")
-        return "[Binary file — no text extracted]"
+        cmd = [
+            "soffice",
+            "--headless",
+            "--nologo",
+            "--nofirststartwizard",
+            # A private profile lets concurrent conversions run without sharing a lock.
+            f"-env:UserInstallation=file://{tmpdir}/profile",
+            "--convert-to",
+            "txt:Text (encoded):UTF8",
+            "--outdir",
+            tmpdir,
+            os.path.join(tmpdir, "source.doc"),
+        ]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            logger.error("LibreOffice is not installed. Install with: apt-get install -y libreoffice")
+            return "[DOC extraction unavailable — LibreOffice not installed]"
+
+        try:
+            try:
+                _, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=DOC_CONVERT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                logger.warning(
+                    "doc_extraction_timeout timeout_seconds=%s", DOC_CONVERT_TIMEOUT_SECONDS
+                )
+                return "[Binary file — no text extracted]"
+
+            text = await run_in_threadpool(_read_doc_conversion, tmpdir)
+            if proc.returncode != 0 or text is None:
+                logger.warning(
+                    "doc_extraction_failed returncode=%s stderr=%s",
+                    proc.returncode,
+                    stderr.decode("utf-8", errors="ignore")[:500],
+                )
+                return "[Binary file — no text extracted]"
+            return text[:MAX_CHARS_TOTAL]
+        except Exception as exc:
+            logger.warning(f"DOC extraction failed: {exc}")
+            return "[Binary file — no text extracted]"
+    finally:
+        await run_in_threadpool(shutil.rmtree, tmpdir, ignore_errors=True)
 
 
 def _iter_pptx_text_pieces(shape):
@@ -343,19 +535,21 @@ def _iter_pptx_text_pieces(shape):
       - text frames whose body lives in run-level XML rather than paragraph.text
 
     This walker captures all of those without inflating image/chart shapes.
-    """
-    try:
-        from pptx.enum.shapes import MSO_SHAPE_TYPE  # type: ignore
-    except Exception:  # pragma: no cover - defensive import
-        MSO_SHAPE_TYPE = None  # type: ignore
 
-    shape_type = getattr(shape, "shape_type", None)
-    if MSO_SHAPE_TYPE is not None and shape_type == MSO_SHAPE_TYPE.GROUP:
-        for child in getattr(shape, "shapes", []) or []:
-            yield from _iter_pptx_text_pieces(child)
+    has_text_frame/has_table are defined on every python-pptx shape, so they are read
+    directly; text frames (the common case) are checked first.
+    """
+    if shape.has_text_frame:
+        try:
+            for paragraph in shape.text_frame.paragraphs:
+                line = "".join(run.text or "" for run in paragraph.runs).strip()
+                if line:
+                    yield line
+        except Exception:
+            pass
         return
 
-    if getattr(shape, "has_table", False):
+    if shape.has_table:
         try:
             for row in shape.table.rows:
                 cell_texts: List[str] = []
@@ -373,22 +567,86 @@ def _iter_pptx_text_pieces(shape):
             pass
         return
 
-    if getattr(shape, "has_text_frame", False):
-        try:
-            for paragraph in shape.text_frame.paragraphs:
-                line = "".join(run.text or "" for run in paragraph.runs).strip()
-                if line:
-                    yield line
-        except Exception:
-            pass
+    if MSO_SHAPE_TYPE is not None and shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        for child in shape.shapes:
+            yield from _iter_pptx_text_pieces(child)
         return
 
+    # Other shape kinds (pictures, charts, connectors) normally carry no text attribute.
     try:
-        text_value = getattr(shape, "text", None)
-        if isinstance(text_value, str) and text_value.strip():
-            yield text_value.strip()
+        text_value = shape.text
     except Exception:
         return
+    if isinstance(text_value, str) and text_value.strip():
+        yield text_value.strip()
+
+
+def _read_pptx(file_content: bytes) -> str:
+    """Process-pool worker for _extract_text_from_pptx (module-level so it pickles)."""
+    pptx_file = io.BytesIO(file_content)
+    prs = Presentation(pptx_file)
+    text_parts = []
+    # Joined length of text_parts so far; later slides would be truncated away.
+    total_chars = 0
+
+    # Process up to PPTX_MAX_SLIDES slides
+    for slide_idx, slide in enumerate(prs.slides):
+        if slide_idx >= PPTX_MAX_SLIDES:
+            break
+
+        slide_text_parts: List[str] = []
+        seen_pieces: set = set()
+        slide_title = ""
+        try:
+            title_shape = slide.shapes.title
+            if title_shape and getattr(title_shape, "text", None):
+                slide_title = str(title_shape.text).strip()
+        except Exception:
+            slide_title = ""
+
+        # Extract text from all shapes in the slide (recursively).
+        for shape in slide.shapes:
+            for piece in _iter_pptx_text_pieces(shape):
+                if not piece:
+                    continue
+                if piece in seen_pieces:
+                    continue
+                seen_pieces.add(piece)
+                slide_text_parts.append(piece)
+
+        notes_text = ""
+        try:
+            if bool(getattr(slide, "has_notes_slide", False)):
+                notes_slide = slide.notes_slide
+                notes_frame = getattr(notes_slide, "notes_text_frame", None)
+                if notes_frame and getattr(notes_frame, "text", None):
+                    notes_text = str(notes_frame.text).strip()
+        except Exception:
+            notes_text = ""
+
+        if slide_title:
+            slide_text_parts = [part for part in slide_text_parts if part != slide_title]
+            slide_text_parts.insert(0, f"Title: {slide_title}")
+        if notes_text:
+            slide_text_parts.append(f"Speaker notes: {notes_text}")
+
+        # Add slide content with slide number header
+        if slide_text_parts:
+            header = f"Slide {slide_idx + 1}:"
+            text_parts.append(header)
+            text_parts.extend(slide_text_parts)
+            total_chars += len(header) + sum(len(part) + 1 for part in slide_text_parts) + 1
+            if total_chars >= MAX_CHARS_TOTAL:
+                break
+
+    # Join all text parts with newlines
+    text = "\n".join(text_parts)
+
+    # Cap at MAX_CHARS_TOTAL
+    if len(text) > MAX_CHARS_TOTAL:
+        text = text[:MAX_CHARS_TOTAL]
+
+    return text
 
 
 async def _extract_text_from_pptx(file_content: bytes) -> str:
@@ -403,79 +661,45 @@ async def _extract_text_from_pptx(file_content: bytes) -> str:
     Returns:
         Extracted text, capped at MAX_CHARS_TOTAL
     """
-    try:
-        from pptx import Presentation
-        
-        def _read_pptx():
-            pptx_file = io.BytesIO(file_content)
-            prs = Presentation(pptx_file)
-            text_parts = []
-            
-            # Process up to PPTX_MAX_SLIDES slides
-            for slide_idx, slide in enumerate(prs.slides):
-                if slide_idx >= PPTX_MAX_SLIDES:
-                    break
-                
-                slide_text_parts: List[str] = []
-                seen_pieces: set = set()
-                slide_title = ""
-                try:
-                    title_shape = slide.shapes.title
-                    if title_shape and getattr(title_shape, "text", None):
-                        slide_title = str(title_shape.text).strip()
-                except Exception:
-                    slide_title = ""
-
-                # Extract text from all shapes in the slide (recursively).
-                for shape in slide.shapes:
-                    for piece in _iter_pptx_text_pieces(shape):
-                        if not piece:
-                            continue
-                        if piece in seen_pieces:
-                            continue
-                        seen_pieces.add(piece)
-                        slide_text_parts.append(piece)
-
-                notes_text = ""
-                try:
-                    if bool(getattr(slide, "has_notes_slide", False)):
-                        notes_slide = slide.notes_slide
-                        notes_frame = getattr(notes_slide, "notes_text_frame", None)
-                        if notes_frame and getattr(notes_frame, "text", None):
-                            notes_text = str(notes_frame.text).strip()
-                except Exception:
-                    notes_text = ""
-
-                if slide_title:
-                    slide_text_parts = [part for part in slide_text_parts if part != slide_title]
-                    slide_text_parts.insert(0, f"Title: {slide_title}")
-                if notes_text:
-                    slide_text_parts.append(f"Speaker notes: {notes_text}")
-                
-                # Add slide content with slide number header
-                if slide_text_parts:
-                    text_parts.append(f"Slide {slide_idx + 1}:")
-                    text_parts.extend(slide_text_parts)
-            
-            # Join all text parts with newlines
-            text = "\n".join(text_parts)
-            
-            # Cap at MAX_CHARS_TOTAL
-            if len(text) > MAX_CHARS_TOTAL:
-                text = text[:MAX_CHARS_TOTAL]
-            
-            return text
-        
-        # Run blocking I/O in threadpool
-        return await run_in_threadpool(_read_pptx)
-    except ImportError:
+    if Presentation is None:
         logger.error("python-pptx is not installed. Install with: pip install python-pptx")
         return "[PPTX extraction unavailable — python-pptx not installed]"
+    try:
+        # Pure-Python parser: run in the process pool so concurrent uploads use all cores
+        return await _run_in_cpu_pool(_read_pptx, file_content)
     except Exception as exc:
         logger.warning(f"PPTX extraction failed: {exc}")
         return "[Binary file — no text extracted]"
 
 
+# A line break (any str.splitlines() boundary) plus all whitespace around it, so runs of
+# blank or whitespace-only lines collapse to one newline and each line is stripped.
+_HTML_LINE_BREAK_RE = re.compile(r"\s*[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]\s*")
+
+
+def _read_html(file_content: bytes) -> str:
+    """Process-pool worker for _extract_text_from_html (module-level so it pickles)."""
+    # lxml (C tokenizer, pinned in requirements) is much faster than the stdlib html.parser;
+    # BeautifulSoup accepts the bytes directly and sniffs the encoding itself.
+    try:
+        soup = BeautifulSoup(file_content, 'lxml')
+    except FeatureNotFound:
+        soup = BeautifulSoup(file_content, 'html.parser')
+
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Get text and clean up whitespace: strip every line and drop blank ones in one pass
+    text = _HTML_LINE_BREAK_RE.sub("\n", soup.get_text()).strip()
+
+    # Cap at MAX_CHARS_TOTAL
+    if len(text) > MAX_CHARS_TOTAL:
+        text = text[:MAX_CHARS_TOTAL]
+
+    return text
+
+
 async def _extract_text_from_html(file_content: bytes) -> str:
     """Extract text from an HTML file using BeautifulSoup.
     
@@ -487,35 +711,12 @@ async def _extract_text_from_html(file_content: bytes) -> str:
     Returns:
         Extracted text, capped at MAX_CHARS_TOTAL
     """
-    try:
-        from bs4 import BeautifulSoup
-        
-        def _read_html():
-            html_file = io.BytesIO(file_content)
-            soup = BeautifulSoup(html_file, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text and clean up whitespace
-            text = soup.get_text()
-            # Clean up multiple newlines and spaces
-            lines = [line.strip() for line in text.splitlines()]
-            lines = [line for line in lines if line]  # Remove empty lines
-            text = "\n".join(lines)
-            
-            # Cap at MAX_CHARS_TOTAL
-            if len(text) > MAX_CHARS_TOTAL:
-                text = text[:MAX_CHARS_TOTAL]
-            
-            return text
-        
-        # Run blocking I/O in threadpool
-        return await run_in_threadpool(_read_html)
-    except ImportError:
+    if BeautifulSoup is None:
         logger.error("beautifulsoup4 is not installed. Install with: pip install beautifulsoup4")
         return "[HTML extraction unavailable — beautifulsoup4 not installed]"
+    try:
+        # Pure-Python parser: run in the process pool so concurrent uploads use all cores
+        return await _run_in_cpu_pool(_read_html, file_content)
     except Exception as exc:
         logger.warning(f"HTML extraction failed: {exc}")
         return "[Binary file — no text extracted]"
@@ -565,7 +766,8 @@ async def _extract_text_from_rtf(file_content: bytes) -> str:
     def _read_rtf() -> str:
         raw = file_content.decode("utf-8", errors="ignore")
         try:
-            from striprtf.striprtf import rtf_to_text
+            if rtf_to_text is None:
+                raise ImportError("striprtf is not installed")
             cleaned = rtf_to_text(raw)
         except Exception:
             cleaned = re.sub(r"\\[a-zA-Z]+-?\d* ?", " ", raw)
@@ -577,9 +779,9 @@ async def _extract_text_from_rtf(file_content: bytes) -> str:
 
 async def _extract_text_from_ppt(file_content: bytes) -> str:
     """Extract text from legacy PPT via textract."""
+    if textract is None:
+        return "[PPT extraction unavailable — textract not installed]"
     try:
-        import textract
-
         def _read_ppt() -> str:
             payload = textract.process(io.BytesIO(file_content), extension="ppt", encoding="utf-8")
             if isinstance(payload, bytes):
@@ -587,8 +789,6 @@ async def _extract_text_from_ppt(file_content: bytes) -> str:
             return payload[:MAX_CHARS_TOTAL]
 
         return await run_in_threadpool(_read_ppt)
-    except ImportError:
-        return "[PPT extraction unavailable — textract not installed]"
     except Exception as exc:
         logger.warning(f"PPT extraction failed: {exc}")
         return "[Binary file — no text extracted]"
@@ -596,9 +796,9 @@ async def _extract_text_from_ppt(file_content: bytes) -> str:
 
 async def _extract_text_from_xls(file_content: bytes) -> str:
     """Extract text from legacy XLS via textract."""
+    if textract is None:
+        return "[XLS extraction unavailable — textract not installed]"
     try:
-        import textract
-
         def _read_xls() -> str:
             payload = textract.process(io.BytesIO(file_content), extension="xls", encoding="utf-8")
             if isinstance(payload, bytes):
@@ -606,8 +806,6 @@ async def _extract_text_from_xls(file_content: bytes) -> str:
             return payload[:MAX_CHARS_TOTAL]
 
         return await run_in_threadpool(_read_xls)
-    except ImportError:
-        return "[XLS extraction unavailable — textract not installed]"
     except Exception as exc:
         logger.warning(f"XLS extraction failed: {exc}")
         return "[Binary file — no text extracted]"
@@ -631,44 +829,74 @@ async def _extract_text_from_image(file_content: bytes, enable_ocr: bool = False
     return "[Image file — OCR not requested]"
 
 
+# Extension -> extractor used by extract_text. Images never run OCR here; OCR must be
+# requested via the dedicated endpoint.
+TEXT_EXTRACTORS: Dict[str, Callable[[bytes], Awaitable[str]]] = {
+    "pdf": _extract_text_from_pdf,
+    "docx": _extract_text_from_docx,
+    "doc": _extract_text_from_doc,
+    "pptx": _extract_text_from_pptx,
+    "ppt": _extract_text_from_ppt,
+    "xlsx": _extract_text_from_xlsx,
+    "xls": _extract_text_from_xls,
+    "html": _extract_text_from_html,
+    "htm": _extract_text_from_html,
+    "txt": _extract_text_from_plain_text,
+    "md": _extract_text_from_plain_text,
+    "csv": partial(_extract_text_from_csv_like, delimiter=","),
+    "tsv": partial(_extract_text_from_csv_like, delimiter="\t"),
+    "json": _extract_text_from_json,
+    "rtf": _extract_text_from_rtf,
+    **{
+        image_ext: partial(_extract_text_from_image, enable_ocr=False)
+        for image_ext in ("png", "jpg", "jpeg", "webp", "tiff")
+    },
+}
+
+
+# Document embeddings keyed by (model, SHA-256 of the truncated text). Re-uploads and shared
+# templates embed identical text; vectors are held as float32 to keep entries ~3KB.
+DOCUMENT_EMBED_CACHE: TTLCache = TTLCache(maxsize=4_096, ttl=86_400)  # 1 day
+
+# Chunk embeddings requested together per file during ingestion (a few batcher batches).
+INGEST_EMBED_WINDOW = 128
+
+
 async def _generate_embedding(text: str) -> List[float]:
     """Generate an embedding vector for the given text using Google Gemini.
     
     This function is used for:
-    - Initial file upload embeddings
     - OCR re-embedding after OCR completes (in files.py OCR endpoint)
-    
-    Uses the new google-genai SDK via the shared client.
+
+    List form of _generate_embedding_array, for callers that build a PointStruct directly.
     """
-    settings = get_settings()
-    model_name = settings.EMBEDDING_MODEL
-    
-    def _embed_sync(truncated_text: str) -> List[float]:
-        """Synchronous embedding function to run in threadpool."""
+    return (await _generate_embedding_array(text)).tolist()
+
+
+async def _generate_embedding_array(text: str) -> np.ndarray:
+    """Generate a read-only float32 embedding for the given text using Google Gemini.
+
+    Ingestion keeps chunk vectors in this form until its points are built.
+
+    Uses the shared micro-batching embedder's "bulk" lane from genai_client, so concurrent
+    chunks, uploads and re-embeds share embed_content calls without delaying interactive
+    search queries. Identical text (per model) is served from DOCUMENT_EMBED_CACHE without
+    a Gemini call.
+    """
+    model_name = EMBEDDING_MODEL
+
+    # Truncate text to 9000 characters to avoid token limits
+    truncated_text = text[:9000]
+    cache_key = (
+        model_name,
+        hashlib.sha256(truncated_text.encode("utf-8"), usedforsecurity=False).hexdigest(),
+    )
+
+    async def _compute() -> np.ndarray:
+        await enforce_monthly_llm_cost_guardrail()
         try:
-            # Get client (lazy initialization)
-            client = get_genai_client()
-            # Use the shared client to generate embedding
-            response = client.models.embed_content(
-                model=model_name,
-                contents=truncated_text
-            )
-            
-            # Extract embedding vector from response
-            if not response.embeddings or len(response.embeddings) == 0:
-                raise RuntimeError(
-                    f"Embedding response did not contain any embeddings for model '{model_name}'."
-                )
-            
-            embedding = response.embeddings[0].values
-            if not isinstance(embedding, list):
-                raise RuntimeError(
-                    f"Embedding response did not contain a valid vector for model '{model_name}'."
-                )
-            
-            return embedding
+            values = await embed_batched(truncated_text, model_name, lane="bulk")
         except RuntimeError:
-            # Re-raise RuntimeError as-is
             raise
         except Exception as exc:
             error_msg = (
@@ -676,14 +904,13 @@ async def _generate_embedding(text: str) -> List[float]:
             )
             logger.error(error_msg)
             raise RuntimeError(error_msg) from exc
-    
+        vector = np.asarray(values, dtype=np.float32)
+        vector.flags.writeable = False
+        return vector
+
     try:
-        await enforce_monthly_llm_cost_guardrail()
-        # Truncate text to 9000 characters to avoid token limits
-        truncated_text = text[:9000]
-        
-        # Run blocking GenAI call in threadpool to avoid blocking event loop
-        return await run_in_threadpool(_embed_sync, truncated_text)
+        # Hits and misses both return the cached float32 values, so they never differ.
+        return await get_or_compute(DOCUMENT_EMBED_CACHE, cache_key, _compute)
     except RuntimeError:
         # Re-raise RuntimeError as-is
         raise
@@ -717,34 +944,37 @@ def _clean_extracted_text(text: str) -> str:
     return normalized
 
 
+# Substrings of the placeholder strings extractors return instead of raising.
+_EXTRACTION_PLACEHOLDER_MARKERS = (
+    "[binary file",
+    "no text extracted",
+    "extraction unavailable",
+    "unsupported file type",
+)
+
+
 def _assess_extraction_quality(text: str, filename: str, file_size_bytes: int) -> Tuple[str, str]:
     """Classify native extraction quality and return (status, reason)."""
     cleaned = _clean_extracted_text(text)
-    ext = filename.split(".")[-1].lower() if "." in filename else ""
+    ocr_capable_doc = _file_type_policy(_file_extension(filename)).ocr_capable_doc
 
     if not cleaned:
-        if ext in {"pdf", "pptx", "ppt"}:
+        if ocr_capable_doc:
             return "ocr_needed", "No extractable native text detected for visual document"
         return "low_text", "No extractable text detected"
 
     lowered = cleaned.lower()
-    placeholder_markers = [
-        "[binary file",
-        "no text extracted",
-        "extraction unavailable",
-        "unsupported file type",
-    ]
-    if any(marker in lowered for marker in placeholder_markers):
+    if any(marker in lowered for marker in _EXTRACTION_PLACEHOLDER_MARKERS):
         return "low_text", "Extraction returned placeholder text"
 
     # Keep native gate permissive; final status now uses multimodal scoring.
     if len(cleaned) < MIN_MEANINGFUL_NATIVE_CHARS and file_size_bytes > 10_000:
-        if ext in {"pdf", "pptx", "ppt"}:
+        if ocr_capable_doc:
             return "ocr_needed", "Native text is weak for visual-heavy document; OCR recommended"
         return "low_text", "Extracted text too short for file size"
 
     if len(cleaned) < MIN_PARTIAL_TOTAL_CHARS:
-        if ext in {"pdf", "pptx", "ppt"}:
+        if ocr_capable_doc:
             return "ocr_needed", "Native text is very short; OCR recommended"
         return "low_text", "Native extraction too short"
 
@@ -884,17 +1114,14 @@ async def _extract_structured_segments(
     extracted_text: str,
 ) -> List[Dict[str, Any]]:
     """Best-effort structural segmentation for citation-grade chunk metadata."""
-    file_ext = filename.split(".")[-1].lower() if "." in filename else ""
+    file_ext = _file_extension(filename)
 
     try:
         if file_ext == "pdf":
-            from pypdf import PdfReader
-
             def _read_pdf_segments() -> List[Dict[str, Any]]:
-                reader = PdfReader(io.BytesIO(file_bytes))
                 result: List[Dict[str, Any]] = []
-                for page_idx, page in enumerate(reader.pages):
-                    text = (page.extract_text() or "").strip()
+                for page_idx, page_text in enumerate(_iter_pdf_page_texts(file_bytes)):
+                    text = page_text.strip()
                     if not text:
                         continue
                     result.append(
@@ -912,9 +1139,7 @@ async def _extract_structured_segments(
             if segments:
                 return segments
 
-        if file_ext == "pptx":
-            from pptx import Presentation
-
+        if file_ext == "pptx" and Presentation is not None:
             def _read_pptx_segments() -> List[Dict[str, Any]]:
                 prs = Presentation(io.BytesIO(file_bytes))
                 result: List[Dict[str, Any]] = []
@@ -985,9 +1210,7 @@ async def _extract_structured_segments(
             if segments:
                 return segments
 
-        if file_ext == "docx":
-            from docx import Document
-
+        if file_ext == "docx" and Document is not None:
             def _read_docx_segments() -> List[Dict[str, Any]]:
                 doc = Document(io.BytesIO(file_bytes))
                 result: List[Dict[str, Any]] = []
@@ -1018,30 +1241,32 @@ async def _extract_structured_segments(
             if segments:
                 return segments
 
-        if file_ext in {"xlsx"}:
-            from openpyxl import load_workbook
-
+        if file_ext in {"xlsx"} and load_workbook is not None:
             def _read_xlsx_segments() -> List[Dict[str, Any]]:
-                wb = load_workbook(io.BytesIO(file_bytes), data_only=True)
+                wb = load_workbook(io.BytesIO(file_bytes), data_only=True, read_only=True)
                 result: List[Dict[str, Any]] = []
-                for sheet_name in wb.sheetnames[:XLSX_MAX_SHEETS]:
-                    sheet = wb[sheet_name]
-                    for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
-                        if row_idx > XLSX_MAX_ROWS:
-                            break
-                        values = [str(v) for v in row[:XLSX_MAX_COLS] if v is not None and str(v).strip()]
-                        if not values:
-                            continue
-                        text = ", ".join(values)
-                        result.append(
-                            {
-                                "text": text,
-                                "raw_text": text,
-                                "location_type": "sheet_row",
-                                "location_value": f"{sheet_name}:{row_idx}",
-                                "section_path": sheet_name,
-                            }
+                try:
+                    for sheet_name in wb.sheetnames[:XLSX_MAX_SHEETS]:
+                        sheet = wb[sheet_name]
+                        rows = sheet.iter_rows(
+                            max_row=XLSX_MAX_ROWS, max_col=XLSX_MAX_COLS, values_only=True
                         )
+                        for row_idx, row in enumerate(rows, start=1):
+                            values = [str(v) for v in row if v is not None and str(v).strip()]
+                            if not values:
+                                continue
+                            text = ", ".join(values)
+                            result.append(
+                                {
+                                    "text": text,
+                                    "raw_text": text,
+                                    "location_type": "sheet_row",
+                                    "location_value": f"{sheet_name}:{row_idx}",
+                                    "section_path": sheet_name,
+                                }
+                            )
+                finally:
+                    wb.close()
                 return result
 
             segments = await run_in_threadpool(_read_xlsx_segments)
@@ -1378,18 +1603,17 @@ def _ocr_required_for_file(
     file_size: int,
 ) -> bool:
     """Decide whether OCR should run for multimodal ingestion."""
-    ext = (file_type or "").lower()
-    ocr_capable_doc_types = {"pdf", "pptx", "ppt"}
-    if ext in IMAGE_EXTENSIONS:
+    policy = _file_type_policy((file_type or "").lower())
+    if policy.is_image:
         return True
-    if ext in ocr_capable_doc_types and quality_status in {"ocr_needed", "low_text"}:
+    if policy.ocr_capable_doc and quality_status in {"ocr_needed", "low_text"}:
         # P2 rule: low-text visual documents should always get an OCR attempt.
         return True
     if quality_status == "ocr_needed":
         # Safety net for any future OCR-capable file types.
         return True
     # Optional OCR for weak text on visual-heavy document types.
-    if ext in ocr_capable_doc_types and (
+    if policy.ocr_capable_doc and (
         len(cleaned_text) < max(600, MIN_EXTRACTED_CHARS * 3) or file_size > 250_000
     ):
         return True
@@ -1453,9 +1677,7 @@ async def _render_pdf_pages_for_vision(
     max_pages: int,
 ) -> Dict[int, bytes]:
     """Render selected PDF pages into PNG bytes for multimodal captioning."""
-    try:
-        import fitz  # type: ignore
-    except ImportError:
+    if fitz is None:
         logger.warning("vision_render_skipped reason=PyMuPDFNotInstalled")
         return {}
     if not page_numbers:
@@ -2367,7 +2589,6 @@ async def _run_ingestion_pipeline(
                     ocr_text=ocr_chunk_text,
                     vision_caption=vision_caption,
                 )
-                vector = await _generate_embedding(merged_chunk_text)
                 token_estimate = _estimate_tokens(merged_chunk_text)
                 total_tokens += token_estimate
                 chunk_processed_count += 1
@@ -2446,21 +2667,36 @@ async def _run_ingestion_pipeline(
                 chunk_rows.append(
                     {
                         "id": point_uuid,
-                        "dense_vector": vector,
+                        "dense_vector": None,
                         "chunk_text": merged_chunk_text,
                         "payload": chunk_payload,
                     }
                 )
 
+        # Embed the file's chunks concurrently so the batcher fills whole embed_content calls,
+        # a window at a time so the AI-disabled check still runs between windows. Vectors stay
+        # float32 (~3KB vs ~25KB of boxed floats) until the points are built.
+        for window_start in range(0, len(chunk_rows), INGEST_EMBED_WINDOW):
+            if window_start and await _abort_if_ai_disabled("chunk_embedding"):
+                return
+            window = chunk_rows[window_start:window_start + INGEST_EMBED_WINDOW]
+            vectors = await asyncio.gather(
+                *(_generate_embedding_array(row["chunk_text"]) for row in window)
+            )
+            for row, vector in zip(window, vectors):
+                row["dense_vector"] = vector
+
         def _build_chunk_points(include_bm25: bool) -> List[PointStruct]:
             points: List[PointStruct] = []
             for row in chunk_rows:
                 payload = dict(row["payload"])
                 payload["bm25_enabled"] = include_bm25
-                vector_payload: Any = row["dense_vector"]
+                # PointStruct validates vectors as lists of floats.
+                dense_vector = row["dense_vector"].tolist()
+                vector_payload: Any = dense_vector
                 if include_bm25:
                     vector_payload = {
-                        "": row["dense_vector"],
+                        "": dense_vector,
                         "bm25": qdrant_models.Document(text=row["chunk_text"], model=BM25_MODEL),
                     }
                 points.append(
@@ -2732,15 +2968,14 @@ async def _persist_uploaded_file_point(
     completion endpoint. It does NOT enqueue ingestion. `ai_enabled` stays False
     and `ingestion_status` stays `"uploaded"` until the user opts in.
     """
-    settings = get_settings()
     upload_date = datetime.now().isoformat()
-    file_type = filename.split(".")[-1].lower() if "." in filename else "unknown"
+    file_type = _file_extension(filename) if "." in filename else "unknown"
     is_global_upload = tenant_id == "global"
-    is_image = is_image_ext(filename)
+    file_policy = _file_type_policy(file_type)
     size_str = _format_file_size(int(file_size or 0))
     target_collection = (
-        settings.QDRANT_COLLECTION_TIER_1 if is_global_upload
-        else settings.QDRANT_COLLECTION_TIER_2
+        TIER_1_COLLECTION if is_global_upload
+        else TIER_2_COLLECTION
     )
     ingestion_status = "uploaded"
 
@@ -2765,7 +3000,7 @@ async def _persist_uploaded_file_point(
         "ingestion_error": None,
         "extracted_char_count": 0,
         "chunk_count": 0,
-        "embedding_model": settings.EMBEDDING_MODEL,
+        "embedding_model": EMBEDDING_MODEL,
         "embedding_tokens_estimate": 0,
         "embedding_cost_estimate_usd": 0.0,
         "chunk_profiles": {"micro": 0, "macro": 0},
@@ -2784,7 +3019,7 @@ async def _persist_uploaded_file_point(
         "ocr_processed": False,
         "vision_processed": False,
         "visual_chunk_count": 0,
-        "vision_enabled": bool(settings.RILEY_VISION_ENABLED),
+        "vision_enabled": RILEY_VISION_ENABLED,
         "vision_status": "not_requested",
         "vision_segments_annotated": 0,
         "analysis_status": "not_requested",
@@ -2793,8 +3028,8 @@ async def _persist_uploaded_file_point(
     }
     if not is_global_upload:
         payload["client_id"] = tenant_id
-    if is_image:
-        payload["content"] = "[Image file — Riley Memory is off by default; enable it to start OCR/ingestion]"
+    if file_policy.upload_placeholder:
+        payload["content"] = file_policy.upload_placeholder
         payload["content_preview"] = payload["content"]
 
     existing_points = await vector_service.client.retrieve(
@@ -2851,7 +3086,7 @@ async def _persist_uploaded_file_point(
             "ingestion_error": None,
             "extracted_char_count": 0,
             "chunk_count": 0,
-            "embedding_model": settings.EMBEDDING_MODEL,
+            "embedding_model": EMBEDDING_MODEL,
             "embedding_tokens_estimate": 0,
             "embedding_cost_estimate_usd": 0.0,
             "chunk_profiles": {"micro": 0, "macro": 0},
@@ -2865,7 +3100,7 @@ async def _persist_uploaded_file_point(
             "ocr_processed": False,
             "vision_processed": False,
             "visual_chunk_count": 0,
-            "vision_enabled": bool(settings.RILEY_VISION_ENABLED),
+            "vision_enabled": RILEY_VISION_ENABLED,
             "vision_status": "not_requested",
             "vision_segments_annotated": 0,
             "analysis_status": "not_requested",
@@ -2876,10 +3111,8 @@ async def _persist_uploaded_file_point(
             if key not in merged_payload:
                 merged_payload[key] = value
 
-        if is_image and not str(merged_payload.get("content") or "").strip():
-            merged_payload["content"] = (
-                "[Image file — Riley Memory is off by default; enable it to start OCR/ingestion]"
-            )
+        if file_policy.upload_placeholder and not str(merged_payload.get("content") or "").strip():
+            merged_payload["content"] = file_policy.upload_placeholder
             merged_payload["content_preview"] = merged_payload["content"]
 
         await vector_service.client.set_payload(
@@ -2888,10 +3121,11 @@ async def _persist_uploaded_file_point(
             points=[point_id],
         )
     else:
-        placeholder_vector = [0.0] * int(settings.EMBEDDING_DIM)
-        await vector_service.client.upsert(
-            collection_name=target_collection,
-            points=[PointStruct(id=point_id, vector=placeholder_vector, payload=payload)],
+        placeholder_vector = [0.0] * EMBEDDING_DIM
+        # Coalesced with concurrent uploads into one upsert call per collection.
+        await vector_service.upsert_batched(
+            target_collection,
+            PointStruct(id=point_id, vector=placeholder_vector, payload=payload),
         )
 
     logger.info(
@@ -2913,11 +3147,74 @@ async def _persist_uploaded_file_point(
     }
 
 
+UPLOAD_READ_CHUNK_BYTES = 1024 * 1024
+
+# (preview_url, preview_object_name, preview_type, preview_status, preview_error)
+PreviewOutcome = Tuple[Optional[str], Optional[str], Optional[str], str, Optional[str]]
+
+
+async def _preview_not_requested() -> PreviewOutcome:
+    return None, None, None, "not_requested", None
+
+
+async def _generate_and_upload_preview(
+    file_content: bytes,
+    filename: str,
+    point_id: str,
+) -> PreviewOutcome:
+    """Convert an Office/HTML upload to a PDF preview and store it; never raises."""
+    try:
+        pdf_bytes = await generate_pdf_preview(file_content, filename)
+        preview_object_name = f"{PREVIEW_BUCKET_PATH_PREFIX}/{point_id}.pdf"
+        preview_public_url = await StorageService.upload_bytes(
+            preview_object_name,
+            pdf_bytes,
+            content_type="application/pdf",
+        )
+        # Persist a stable preview pointer. Signed URLs are minted on demand.
+        return preview_public_url, preview_object_name, "pdf", "complete", None
+    except HTTPException as exc:
+        preview_error = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
+        return None, None, None, "failed", preview_error
+    except Exception as exc:
+        return None, None, None, "failed", str(exc)
+
+
+async def read_upload_bounded(file: UploadFile, max_bytes: int) -> bytes:
+    """Read an upload into memory, rejecting it with 413 past max_bytes.
+
+    Declared sizes are checked first so oversized uploads are refused before any read. A
+    declared in-limit upload is read with one capped read straight into the returned bytes
+    (no intermediate buffer); without size metadata it is read in 1MB chunks.
+    """
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"This file is too large. Current limit is {max_bytes // (1024 * 1024)} MB.",
+    )
+    declared_size = getattr(file, "size", None)
+    if isinstance(declared_size, int):
+        if declared_size > max_bytes:
+            raise too_large
+        # Capped at max_bytes + 1 so incorrect size metadata still cannot overrun the limit.
+        content = await file.read(max_bytes + 1)
+        if len(content) > max_bytes:
+            raise too_large
+        return content
+
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_READ_CHUNK_BYTES):
+        buffer += chunk
+        if len(buffer) > max_bytes:
+            raise too_large
+    return bytes(buffer)
+
+
 async def process_upload(
     file: UploadFile,
     tenant_id: str,
     tags: List[str],
     overwrite: bool = False,
+    file_content: Optional[bytes] = None,
 ) -> dict:
     """
     Process an uploaded file: upload to GCS, extract text, vectorize, and index in Qdrant.
@@ -2934,6 +3231,8 @@ async def process_upload(
         tenant_id: Tenant/client identifier for data isolation
         tags: List of tags associated with the file
         overwrite: If True, replace existing file with same name. If False, raise 409 on conflict.
+        file_content: The upload's bytes if the caller already read them (bounded); otherwise
+            they are read here, capped at MAX_UPLOAD_MB.
         Note: OCR is NOT performed during upload. OCR must be explicitly
         requested via the dedicated POST /files/{file_id}/ocr endpoint.
         
@@ -2944,54 +3243,60 @@ async def process_upload(
             - filename: The original filename
             - type: The file type/extension
     """
-    settings = get_settings()
-
+    # One time-ordered id names both the Qdrant point and the GCS object, so objects sort
+    # by upload time and point ids arrive in roughly increasing order.
+    point_id = _uuid7()
     if file.filename:
         file_extension = "." + file.filename.split(".")[-1] if "." in file.filename else ""
         base_name = file.filename.rsplit(".", 1)[0] if "." in file.filename else file.filename
-        unique_filename = f"{uuid.uuid4()}_{base_name}{file_extension}"
+        unique_filename = f"{point_id}_{base_name}{file_extension}"
     else:
-        unique_filename = str(uuid.uuid4())
+        unique_filename = point_id
 
     try:
-        file_content = await file.read()
+        if file_content is None:
+            file_content = await read_upload_bounded(file, MAX_UPLOAD_BYTES)
         file_size = len(file_content)
         filename = file.filename or "unknown"
 
-        point_id = str(uuid.uuid4())
-
-        # Upload original bytes first.
-        file_url = await StorageService.upload_bytes(
+        # The original upload and the preview (a LibreOffice conversion plus its own upload)
+        # are independent, so wall-clock is the slower of the two rather than their sum.
+        # The preview coroutine records its own failures, so only the upload can fail; then the
+        # point is never created and an already-stored preview is removed again.
+        upload_coro = StorageService.upload_bytes(
             unique_filename,
             file_content,
             content_type=file.content_type or "application/octet-stream",
         )
-
-        preview_url: Optional[str] = None
-        preview_object_name: Optional[str] = None
-        preview_type: Optional[str] = None
-        preview_status: str = "not_requested"
-        preview_error: Optional[str] = None
-        if settings.ENABLE_PREVIEW_GENERATION and is_office_or_html(filename):
-            preview_status = "processing"
-            try:
-                pdf_bytes = await generate_pdf_preview(file_content, filename)
-                preview_object_name = f"{settings.PREVIEW_BUCKET_PATH_PREFIX}/{point_id}.pdf"
-                preview_public_url = await StorageService.upload_bytes(
-                    preview_object_name,
-                    pdf_bytes,
-                    content_type="application/pdf",
-                )
-                # Persist a stable preview pointer. Signed URLs are minted on demand.
-                preview_url = preview_public_url
-                preview_type = "pdf"
-                preview_status = "complete"
-            except HTTPException as exc:
-                preview_status = "failed"
-                preview_error = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
-            except Exception as exc:
-                preview_status = "failed"
-                preview_error = str(exc)
+        if ENABLE_PREVIEW_GENERATION and is_office_or_html(filename):
+            preview_coro = _generate_and_upload_preview(file_content, filename, point_id)
+        else:
+            preview_coro = _preview_not_requested()
+        file_url, preview_outcome = await asyncio.gather(
+            upload_coro, preview_coro, return_exceptions=True
+        )
+        if isinstance(preview_outcome, BaseException):
+            # Only reachable if the preview task itself was cancelled.
+            preview_outcome = (None, None, None, "failed", repr(preview_outcome))
+        (
+            preview_url,
+            preview_object_name,
+            preview_type,
+            preview_status,
+            preview_error,
+        ) = preview_outcome
+        if isinstance(file_url, BaseException):
+            if preview_url:
+                try:
+                    await StorageService.delete_file(preview_url)
+                except Exception as cleanup_exc:
+                    logger.warning(
+                        "orphan_preview_cleanup_failed file_id=%s object=%s error=%s",
+                        point_id,
+                        preview_object_name,
+                        cleanup_exc,
+                    )
+            raise file_url
 
         return await _persist_uploaded_file_point(
             point_id=point_id,
@@ -3926,34 +4231,41 @@ async def backfill_indexed_content_hashes(
     return totals
 
 
-async def delete_file(file_id: str, collection_name: str) -> None:
+async def delete_file(
+    file_id: str,
+    collection_name: str,
+    payload: Optional[Dict[str, Any]] = None,
+) -> None:
     """
     Permanently delete a file from GCS and Qdrant.
     
     Args:
         file_id: The Qdrant point ID (UUID) of the file to delete
         collection_name: Name of the Qdrant collection
+        payload: File payload already loaded by the caller (must include "url");
+            skips the metadata retrieve when provided
         
     Raises:
         HTTPException: If file not found or deletion fails
     """
     # Retrieve the point to get file metadata
     try:
-        points = await vector_service.client.retrieve(
-            collection_name=collection_name,
-            ids=[file_id],
-            with_payload=True,
-            with_vectors=False
-        )
-        
-        if not points:
-            raise HTTPException(
-                status_code=404,
-                detail=f"File with ID {file_id} not found in Qdrant"
+        if payload is None:
+            points = await vector_service.client.retrieve(
+                collection_name=collection_name,
+                ids=[file_id],
+                with_payload=True,
+                with_vectors=False
             )
-        
-        point = points[0]
-        payload = point.payload or {}
+            
+            if not points:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"File with ID {file_id} not found in Qdrant"
+                )
+            
+            point = points[0]
+            payload = point.payload or {}
         file_url = payload.get("url")
         
         if not file_url:
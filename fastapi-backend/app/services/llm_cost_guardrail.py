@@ -2,10 +2,10 @@ from datetime import datetime, timezone
 import logging
 from typing import Optional
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver
 
 from app.core.config import get_settings
-from app.services.graph import GraphService
+from app.services.graph import GraphService, get_graph_service
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,6 @@ USER_OPERATION_LIMIT_MESSAGE = "You’ve reached your limit for Deep/Reports tod
 DEEP_DAILY_LIMIT = 10
 REPORTS_MONTHLY_LIMIT = 5
 
-_driver: Optional[AsyncDriver] = None
 _graph_service: Optional[GraphService] = None
 
 
@@ -27,19 +26,11 @@ class UserOperationLimitExceeded(RuntimeError):
 
 
 def _get_driver() -> AsyncDriver:
-    # Prefer the application-managed GraphService driver so we do not create
-    # an unmanaged second long-lived Neo4j connection pool in API runtime.
+    # Prefer the application-managed GraphService driver; outside the app lifespan, fall
+    # back to the shared process-wide service rather than opening a second pool.
     if _graph_service is not None:
         return _graph_service.driver
-
-    global _driver
-    if _driver is None:
-        settings = get_settings()
-        _driver = AsyncGraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
-        )
-    return _driver
+    return get_graph_service().driver
 
 
 def configure_guardrail_graph_service(graph: Optional[GraphService]) -> None:
@@ -48,14 +39,6 @@ def configure_guardrail_graph_service(graph: Optional[GraphService]) -> None:
     _graph_service = graph
 
 
-async def close_guardrail_driver() -> None:
-    """Close fallback lazy Neo4j driver when one was created."""
-    global _driver
-    if _driver is not None:
-        await _driver.close()
-        _driver = None
-
-
 async def get_current_month_llm_cost_usd() -> float:
     """Compute current calendar-month LLM spend from analytics events."""
     month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
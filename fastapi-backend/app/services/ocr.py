@@ -1,5 +1,6 @@
 """Google Cloud Vision OCR helpers used by ingestion and OCR endpoint."""
 
+import asyncio
 import json
 import logging
 import uuid
@@ -7,15 +8,27 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import unquote, urlparse
 
 from fastapi.concurrency import run_in_threadpool
+import numpy as np
+
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Image OCR uses Vision's asyncio client: one shared client (created on first use, inside the
+# running loop) and no threadpool worker parked per request. The semaphore bounds in-flight
+# calls so a burst of OCR requests cannot exhaust Vision quota or the gRPC channel.
+_vision_async_client: Any = None
+_ocr_slots = asyncio.Semaphore(max(1, int(get_settings().OCR_MAX_CONCURRENCY)))
+
+
+IMAGE_EXTENSIONS: frozenset[str] = frozenset({"png", "jpg", "jpeg", "webp", "tiff"})
+
 
 def is_image_ext(filename: str) -> bool:
     if not filename:
         return False
-    ext = filename.split(".")[-1].lower() if "." in filename else ""
-    return ext in ("png", "jpg", "jpeg", "webp", "tiff")
+    _, sep, ext = filename.rpartition(".")
+    return bool(sep) and ext.lower() in IMAGE_EXTENSIONS
 
 
 def gcs_uri_from_url(url: str, default_bucket: Optional[str] = None) -> Optional[str]:
@@ -47,19 +60,23 @@ def gcs_uri_from_url(url: str, default_bucket: Optional[str] = None) -> Optional
 
 
 def _extract_annotation_confidence(annotation: Any) -> Optional[float]:
+    # Word confidences are proto floats; collect them straight into an array and let NumPy
+    # mask and average instead of type-checking each word in Python.
     try:
-        pages = list(getattr(annotation, "pages", []) or [])
-        scores: List[float] = []
-        for page in pages:
-            for block in getattr(page, "blocks", []) or []:
-                for para in getattr(block, "paragraphs", []) or []:
-                    for word in getattr(para, "words", []) or []:
-                        conf = getattr(word, "confidence", None)
-                        if isinstance(conf, (float, int)) and conf >= 0:
-                            scores.append(float(conf))
-        if not scores:
+        scores = np.fromiter(
+            (
+                word.confidence
+                for page in annotation.pages
+                for block in page.blocks
+                for para in block.paragraphs
+                for word in para.words
+            ),
+            dtype=np.float64,
+        )
+        valid = scores[scores >= 0]
+        if not valid.size:
             return None
-        return max(0.0, min(1.0, sum(scores) / len(scores)))
+        return max(0.0, min(1.0, float(valid.mean())))
     except Exception:
         return None
 
@@ -86,23 +103,48 @@ async def run_ocr(image_bytes: bytes, max_chars: int = 8000) -> Dict[str, Option
     except ImportError as exc:
         raise ImportError("google-cloud-vision is required for OCR") from exc
 
-    def _perform() -> Dict[str, Optional[str | float]]:
-        client = vision.ImageAnnotatorClient()
-        image = vision.Image(content=image_bytes)
-        result = client.document_text_detection(image=image)
-        if result.error.message:
-            raise RuntimeError(f"Vision OCR failed: {result.error.message}")
-        annotation = result.full_text_annotation
-        text = (getattr(annotation, "text", "") or "").strip()
-        if len(text) > max_chars:
-            text = text[:max_chars]
-        return {
-            "text": text,
-            "confidence": _extract_annotation_confidence(annotation),
-            "language": _extract_annotation_language(annotation),
-        }
+    return await _run_image_ocr(vision, vision.Image(content=image_bytes), max_chars)
+
+
+async def run_ocr_from_gcs(gcs_source_uri: str, max_chars: int = 8000) -> Dict[str, Optional[str | float]]:
+    """OCR an image stored in GCS; Vision reads the object directly, so no bytes are buffered here."""
+    try:
+        from google.cloud import vision
+    except ImportError as exc:
+        raise ImportError("google-cloud-vision is required for OCR") from exc
 
-    return await run_in_threadpool(_perform)
+    image = vision.Image(source=vision.ImageSource(image_uri=gcs_source_uri))
+    return await _run_image_ocr(vision, image, max_chars)
+
+
+def _get_vision_async_client(vision: Any) -> Any:
+    global _vision_async_client
+    if _vision_async_client is None:
+        _vision_async_client = vision.ImageAnnotatorAsyncClient()
+    return _vision_async_client
+
+
+async def _run_image_ocr(vision: Any, image: Any, max_chars: int) -> Dict[str, Optional[str | float]]:
+    # The async client has no document_text_detection helper; this is the request it sends.
+    request = vision.AnnotateImageRequest(
+        image=image,
+        features=[vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)],
+    )
+    async with _ocr_slots:
+        batch = await _get_vision_async_client(vision).batch_annotate_images(requests=[request])
+
+    result = batch.responses[0]
+    if result.error.message:
+        raise RuntimeError(f"Vision OCR failed: {result.error.message}")
+    annotation = result.full_text_annotation
+    text = (getattr(annotation, "text", "") or "").strip()
+    if len(text) > max_chars:
+        text = text[:max_chars]
+    return {
+        "text": text,
+        "confidence": _extract_annotation_confidence(annotation),
+        "language": _extract_annotation_language(annotation),
+    }
 
 
 async def run_ocr_document_from_gcs(
@@ -1,20 +1,44 @@
 """Document preview generation service.
 
 Generates read-only PDF previews for Office/HTML documents using LibreOffice.
+
+When PREVIEW_UNOSERVER_ENABLED is set, each worker keeps one warm LibreOffice running under
+unoserver and converts through its XML-RPC API, so previews skip the multi-second soffice
+startup. If the daemon is missing or fails, conversion falls back to a one-shot
+`soffice --convert-to` subprocess.
 """
 
 import asyncio
+import logging
 import os
+import shlex
+import shutil
+import socket
 import tempfile
+import xmlrpc.client
+from contextlib import suppress
 from pathlib import Path
-from typing import Final
+from typing import Final, Optional
 
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+UNOSERVER_READY_TIMEOUT_SECONDS = 30.0
+UNOSERVER_CONVERT_TIMEOUT_SECONDS = 30.0
+
+_uno_process: Optional[asyncio.subprocess.Process] = None
+_uno_port: Optional[int] = None
+_uno_profile_dir: Optional[str] = None
+_uno_restart: Optional["asyncio.Task[None]"] = None
+# A single LibreOffice instance converts one document at a time.
+_uno_slots = asyncio.Semaphore(1)
+
 
-OFFICE_EXTENSIONS: Final[set[str]] = {
+OFFICE_EXTENSIONS: Final[frozenset[str]] = frozenset({
     "doc",
     "docx",
     "xls",
@@ -23,19 +47,216 @@ OFFICE_EXTENSIONS: Final[set[str]] = {
     "pptx",
     "html",
     "htm",
-}
+})
 
 
 def is_office_or_html(filename: str) -> bool:
     """Return True if the filename looks like an Office or HTML document."""
-    ext = Path(filename).suffix.lower().lstrip(".")
-    return ext in OFFICE_EXTENSIONS
+    # Same rpartition check as ocr.is_image_ext; no Path object per call.
+    _, sep, ext = filename.rpartition(".")
+    return bool(sep) and ext.lower() in OFFICE_EXTENSIONS
+
+
+# Fallback conversions stage files on tmpfs when the host has one, so the input write and
+# PDF read-back never touch disk. A conversion only uses it with free space for
+# PREVIEW_SCRATCH_HEADROOM_FACTOR times its input (input plus a PDF that can outgrow it).
+_SHM_DIR = "/dev/shm"
+PREVIEW_SCRATCH_HEADROOM_FACTOR = 4
+PREVIEW_SCRATCH_DIR: Optional[str] = (
+    _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
+)
+
+
+def _free_local_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _preview_daemon_alive() -> bool:
+    return _uno_process is not None and _uno_process.returncode is None
+
+
+async def _wait_for_port(port: int, timeout_seconds: float) -> bool:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    while loop.time() < deadline:
+        if not _preview_daemon_alive():
+            return False
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.25)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return True
+    return False
+
+
+async def start_preview_daemon() -> None:
+    """Launch this worker's unoserver (warm LibreOffice) if enabled; failures only log."""
+    global _uno_process, _uno_port, _uno_profile_dir
+
+    settings = get_settings()
+    if not (settings.ENABLE_PREVIEW_GENERATION and settings.PREVIEW_UNOSERVER_ENABLED):
+        return
+    if _preview_daemon_alive():
+        return
+
+    port = _free_local_port()
+    profile_dir = tempfile.mkdtemp(prefix="riley_uno_profile_")
+    cmd = shlex.split(settings.PREVIEW_UNOSERVER_COMMAND) + [
+        "--interface",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--uno-port",
+        str(_free_local_port()),
+        # Private profile: gunicorn workers each run their own instance without lock contention.
+        "--user-installation",
+        f"file://{profile_dir}",
+    ]
+    env = dict(os.environ)
+    if settings.PREVIEW_UNOSERVER_PYTHONPATH:
+        env["PYTHONPATH"] = settings.PREVIEW_UNOSERVER_PYTHONPATH
+    try:
+        _uno_process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+        )
+    except (FileNotFoundError, PermissionError) as exc:
+        logger.warning("preview_daemon_start_failed error=%s", exc)
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        return
+
+    _uno_port = port
+    _uno_profile_dir = profile_dir
+    if await _wait_for_port(port, UNOSERVER_READY_TIMEOUT_SECONDS):
+        logger.info("preview_daemon_started port=%s pid=%s", port, _uno_process.pid)
+    else:
+        logger.warning(
+            "preview_daemon_start_failed error=not ready after %ss", UNOSERVER_READY_TIMEOUT_SECONDS
+        )
+        await _terminate_preview_daemon()
+
+
+async def stop_preview_daemon() -> None:
+    global _uno_restart
+
+    restart, _uno_restart = _uno_restart, None
+    if restart is not None and not restart.done():
+        restart.cancel()
+        with suppress(asyncio.CancelledError):
+            await restart
+    await _terminate_preview_daemon()
+
+
+async def _terminate_preview_daemon() -> None:
+    global _uno_process, _uno_port, _uno_profile_dir
+
+    process, _uno_process, _uno_port = _uno_process, None, None
+    if process is not None and process.returncode is None:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+    if _uno_profile_dir:
+        shutil.rmtree(_uno_profile_dir, ignore_errors=True)
+        _uno_profile_dir = None
+
+
+async def _restart_preview_daemon() -> None:
+    await _terminate_preview_daemon()
+    await start_preview_daemon()
+
+
+def _schedule_preview_daemon_restart() -> None:
+    """Retire a hung daemon and start a fresh one in the background.
+
+    Terminating it closes the XML-RPC socket, which frees the threadpool thread still
+    blocked on it; conversions use the soffice exec fallback until the new one is up.
+    """
+    global _uno_restart
+    if _uno_restart is not None and not _uno_restart.done():
+        return
+    _uno_restart = asyncio.create_task(_restart_preview_daemon())
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport whose socket gives up after `timeout` seconds."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__()
+        self._timeout = timeout
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self._timeout
+        return connection
+
+
+def _convert_via_daemon(port: int, file_bytes: bytes, convert_to: str) -> bytes:
+    # unoserver's convert(inpath, indata, outpath, convert_to): bytes in, PDF bytes back, so
+    # nothing touches the filesystem. LibreOffice detects the input type from the content.
+    # The socket timeout bounds the threadpool thread; asyncio.wait_for alone only abandons it.
+    proxy = xmlrpc.client.ServerProxy(
+        f"http://127.0.0.1:{port}",
+        transport=_TimeoutTransport(UNOSERVER_CONVERT_TIMEOUT_SECONDS),
+        allow_none=True,
+    )
+    result = proxy.convert(None, xmlrpc.client.Binary(file_bytes), None, convert_to)
+    return result.data if isinstance(result, xmlrpc.client.Binary) else bytes(result or b"")
+
+
+async def convert_with_daemon(file_bytes: bytes, convert_to: str) -> Optional[bytes]:
+    """Convert a document with the warm unoserver daemon, e.g. convert_to="pdf" or "docx".
+
+    Returns None when the daemon isn't running or the conversion fails (logged), so callers
+    fall back to a one-shot soffice exec.
+    """
+    if not _preview_daemon_alive() or _uno_port is None:
+        return None
+    try:
+        async with _uno_slots:
+            converted = await asyncio.wait_for(
+                run_in_threadpool(_convert_via_daemon, _uno_port, file_bytes, convert_to),
+                # Backstop only: the socket timeout normally fires first.
+                timeout=UNOSERVER_CONVERT_TIMEOUT_SECONDS + 5,
+            )
+    except TimeoutError:
+        # Socket or wait_for timeout: LibreOffice is likely wedged on this document, so
+        # later conversions must not queue behind it.
+        logger.warning(
+            "preview_daemon_convert_timed_out convert_to=%s; restarting daemon, using soffice exec",
+            convert_to,
+        )
+        _schedule_preview_daemon_restart()
+        return None
+    except Exception as exc:
+        logger.warning(
+            "preview_daemon_convert_failed convert_to=%s error=%s; using soffice exec",
+            convert_to,
+            exc,
+        )
+        return None
+    if not converted:
+        logger.warning(
+            "preview_daemon_convert_failed convert_to=%s error=empty output; using soffice exec",
+            convert_to,
+        )
+        return None
+    return converted
 
 
 async def generate_pdf_preview(file_bytes: bytes, filename: str) -> bytes:
     """Generate a PDF preview for an Office/HTML document using LibreOffice.
 
-    Workflow:
+    Uses the warm unoserver daemon when it is running; otherwise (or if it fails):
     - Write the incoming bytes to a temp file with the correct extension.
     - Run `soffice --headless --convert-to pdf --outdir /tmp <input>`.
     - Read the resulting PDF bytes.
@@ -53,13 +274,56 @@ async def generate_pdf_preview(file_bytes: bytes, filename: str) -> bytes:
             detail=f"Preview generation skipped: file exceeds preview limit ({settings.PREVIEW_MAX_MB}MB).",
         )
 
+    pdf_bytes = await convert_with_daemon(file_bytes, "pdf")
+    if pdf_bytes:
+        return pdf_bytes
+
     ext = Path(filename).suffix or ""
     if not ext:
         # Default to .docx if extension missing but still requested
         ext = ".docx"
 
+    scratch_dir = _preview_scratch_dir(len(file_bytes))
+    if scratch_dir is not None:
+        try:
+            return await _convert_with_soffice(file_bytes, ext, scratch_dir)
+        except OSError as exc:
+            # tmpfs filled up between the space check and the write (concurrent previews).
+            logger.warning(
+                "preview_scratch_dir_failed dir=%s error=%s; retrying in default tempdir",
+                scratch_dir,
+                exc,
+            )
+    return await _convert_with_soffice(file_bytes, ext, None)
+
+
+class _ScratchSpaceError(OSError):
+    """The conversion ran but the scratch dir had no room for its output."""
+
+
+def _preview_scratch_dir(input_size: int) -> Optional[str]:
+    """PREVIEW_SCRATCH_DIR if it has room for this conversion, else None (default tempdir).
+
+    Docker's default /dev/shm is only 64MB, so a few concurrent 25MB previews would fill it.
+    """
+    if PREVIEW_SCRATCH_DIR is None:
+        return None
+    try:
+        free_bytes = shutil.disk_usage(PREVIEW_SCRATCH_DIR).free
+    except OSError:
+        return None
+    if free_bytes < input_size * PREVIEW_SCRATCH_HEADROOM_FACTOR:
+        return None
+    return PREVIEW_SCRATCH_DIR
+
+
+async def _convert_with_soffice(file_bytes: bytes, ext: str, scratch_dir: Optional[str]) -> bytes:
+    """One-shot `soffice --convert-to pdf` in a temp dir under scratch_dir.
+
+    Raises OSError if staging the input fails; conversion failures raise HTTPException(500).
+    """
     # Use a dedicated temp directory so we can clean up easily
-    with tempfile.TemporaryDirectory(prefix="riley_preview_") as tmpdir:
+    with tempfile.TemporaryDirectory(prefix="riley_preview_", dir=scratch_dir) as tmpdir:
         input_path = Path(tmpdir) / f"source{ext}"
         output_path = Path(tmpdir) / "source.pdf"
 
@@ -105,6 +369,9 @@ async def generate_pdf_preview(file_bytes: bytes, filename: str) -> bytes:
                     ),
                 )
 
+            if not output_path.exists() and scratch_dir is not None:
+                # soffice can exit 0 without writing the PDF when the scratch tmpfs is full.
+                raise _ScratchSpaceError(f"output PDF not written under {scratch_dir}")
             if not output_path.exists():
                 raise HTTPException(
                     status_code=500,
@@ -120,7 +387,7 @@ async def generate_pdf_preview(file_bytes: bytes, filename: str) -> bytes:
 
             return pdf_bytes
 
-        except HTTPException:
+        except (HTTPException, _ScratchSpaceError):
             raise
         except FileNotFoundError:
             # soffice not installed or not in PATH
@@ -1,8 +1,11 @@
+import asyncio
 import copy
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Sequence, Optional
+from typing import Any, Callable, Dict, List, Sequence, Optional, Tuple
 import logging
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Filter, FieldCondition, MatchValue, PointStruct
@@ -11,6 +14,174 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Micro-batching for single-point upserts (parent-file records staged by uploads). Concurrent
+# callers enqueue a point and one consumer flushes up to UPSERT_MAX_BATCH points per
+# collection per upsert call, waiting at most UPSERT_MAX_WAIT_SECONDS for a batch to fill.
+UPSERT_MAX_BATCH = 64
+UPSERT_MAX_WAIT_SECONDS = 0.050
+UPSERT_QUEUE_MAXSIZE = 1024
+
+# Payload fields read when building file listings. Listing scrolls fetch only these so
+# large fields (ocr_text, content_preview, comments) never leave Qdrant for a list view.
+FILE_LISTING_PAYLOAD_FIELDS: List[str] = [
+    "record_type",
+    "filename",
+    "name",
+    "type",
+    "file_type",
+    "year",
+    "url",
+    "tags",
+    "status",
+    "assignee",
+    "assigned_to",
+    "messaging_visible_user_ids",
+    "messaging_created_by_user_id",
+    "size",
+    "upload_date",
+    "ai_enabled",
+    "ocr_enabled",
+    "ocr_status",
+    "ocr_confidence",
+    "ocr_extracted_at",
+    "preview_url",
+    "preview_type",
+    "preview_status",
+    "preview_error",
+    "ingestion_status",
+    "extracted_char_count",
+    "chunk_count",
+    "analysis_status",
+    "doc_summary_short",
+    "key_themes",
+    "key_entities",
+    "sentiment_overall",
+    "tone_labels",
+    "framing_labels",
+    "audience_implications",
+    "persuasion_risks",
+    "strategic_opportunities",
+    "major_claims_or_evidence",
+    "analysis_fidelity_level",
+    "analysis_chunks_coverage_ratio",
+    "analysis_chars_coverage_ratio",
+    "analysis_context_reduction_applied",
+    "analysis_execution_mode",
+    "analysis_total_bands",
+    "analysis_analyzed_bands",
+    "analysis_band_coverage_ratio",
+    "analysis_final_fidelity_level",
+    "analysis_validation_status",
+    "analysis_validation_note",
+    "analysis_contradiction_count",
+    "analysis_failed_bands_count",
+    "analysis_validation_reasons_json",
+    "analysis_high_signal_band_coverage_ratio",
+    "analysis_appendix_required",
+    "analysis_appendix_covered",
+    "source_campaign_id",
+    "client_id",
+    "tenant_id",
+    "is_golden",
+    "promoted_at",
+]
+
+
+def scalar_quantization_config() -> Optional[models.ScalarQuantization]:
+    """int8 scalar quantization kept in RAM, or None when disabled in settings."""
+    if not get_settings().QDRANT_SCALAR_QUANTIZATION:
+        return None
+    return models.ScalarQuantization(
+        scalar=models.ScalarQuantizationConfig(
+            type=models.ScalarType.INT8,
+            always_ram=True,
+        )
+    )
+
+
+def _dense_search_params() -> models.SearchParams:
+    # Ignored by collections without quantization; those just get the hnsw_ef setting.
+    settings = get_settings()
+    return models.SearchParams(
+        hnsw_ef=settings.QDRANT_SEARCH_HNSW_EF,
+        quantization=models.QuantizationSearchParams(
+            ignore=False,
+            rescore=True,
+            oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING,
+        ),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _chunk_search_filter(tenant_id: str, require_ai_enabled: bool) -> Filter:
+    """Tenant-scoped filter for chunk searches (excludes parent file records).
+
+    Cached per (tenant, ai_enabled); callers must treat the returned Filter as read-only.
+    """
+    filter_conditions = [
+        FieldCondition(
+            key="client_id",
+            match=MatchValue(value=tenant_id),
+        )
+    ]
+    # Add ai_enabled filter if required
+    if require_ai_enabled:
+        filter_conditions.append(
+            FieldCondition(
+                key="ai_enabled",
+                match=MatchValue(value=True),
+            )
+        )
+    return Filter(
+        must=filter_conditions,
+        must_not=[
+            FieldCondition(
+                key="record_type",
+                match=MatchValue(value="file"),
+            )
+        ],
+    )
+
+
+@lru_cache(maxsize=4096)
+def _file_records_filter(tenant_id: str) -> Filter:
+    """Non-chunk records for a tenant, or promoted records when tenant_id == "global".
+
+    Cached per tenant because listing endpoints rebuild it on every poll. Callers must
+    treat the returned Filter as read-only (derive new Filters instead of mutating).
+    """
+    if tenant_id == "global":
+        # Filter by is_global flag (do NOT filter by client_id)
+        scope_condition = FieldCondition(key="is_global", match=MatchValue(value=True))
+    else:
+        scope_condition = FieldCondition(key="client_id", match=MatchValue(value=tenant_id))
+    return Filter(
+        must=[scope_condition],
+        must_not=[
+            FieldCondition(
+                key="record_type",
+                match=MatchValue(value="chunk"),
+            )
+        ],
+    )
+
+
+def _scored_point_to_dict(point: models.ScoredPoint) -> Dict[str, Any]:
+    """Same keys as ScoredPoint.dict(), read as attributes.
+
+    pydantic's .dict() walks and copies the whole model (payload included) per point; search
+    results are only serialized to JSON afterwards, so the payload is passed through as-is.
+    """
+    return {
+        "id": point.id,
+        "version": point.version,
+        "score": point.score,
+        "payload": point.payload,
+        "vector": point.vector,
+        "shard_key": point.shard_key,
+        "order_value": point.order_value,
+    }
+
 
 class VectorService:
     """Service responsible for all Qdrant vector operations.
@@ -31,24 +202,111 @@ class VectorService:
             self._client = AsyncQdrantClient(
                 url=settings.QDRANT_URL,
                 api_key=settings.QDRANT_API_KEY,
+                prefer_grpc=settings.QDRANT_PREFER_GRPC,
+                grpc_port=settings.QDRANT_GRPC_PORT,
             )
         else:
             # Local dev mode: use host and port
             self._client = AsyncQdrantClient(
                 host=settings.QDRANT_HOST,
                 port=settings.QDRANT_PORT,
+                prefer_grpc=settings.QDRANT_PREFER_GRPC,
+                grpc_port=settings.QDRANT_GRPC_PORT,
             )
         self._bm25_support_cache: Dict[str, bool] = {}
         self._bm25_warned_collections: set[str] = set()
         self._chunk_type_index_unavailable_collections: set[str] = set()
+        self._upload_date_order_unavailable_collections: set[str] = set()
         self._usage_metrics_cache: Optional[Dict[str, Any]] = None
         self._usage_metrics_cache_expires_at: Optional[datetime] = None
         self._usage_metrics_cache_key: Optional[str] = None
+        self._upsert_queue: Optional["asyncio.Queue[Tuple[str, PointStruct, asyncio.Future]]"] = None
+        self._upsert_consumer: Optional["asyncio.Task[None]"] = None
 
     @property
     def client(self) -> AsyncQdrantClient:
         return self._client
 
+    async def _flush_upsert_batch(
+        self,
+        batch: List[Tuple[str, PointStruct, asyncio.Future]],
+    ) -> None:
+        by_collection: Dict[str, List[Tuple[PointStruct, asyncio.Future]]] = {}
+        for collection_name, point, future in batch:
+            if not future.done():
+                by_collection.setdefault(collection_name, []).append((point, future))
+
+        for collection_name, items in by_collection.items():
+            try:
+                await self._client.upsert(
+                    collection_name=collection_name,
+                    points=[point for point, _ in items],
+                )
+            except Exception as exc:
+                if len(items) == 1:
+                    if not items[0][1].done():
+                        items[0][1].set_exception(exc)
+                    continue
+                # One bad point must not fail its batch-mates: retry them individually.
+                logger.warning(
+                    "qdrant_upsert_batch_failed collection=%s size=%s error=%s; retrying per point",
+                    collection_name,
+                    len(items),
+                    exc,
+                )
+                for point, future in items:
+                    try:
+                        await self._client.upsert(collection_name=collection_name, points=[point])
+                    except Exception as point_exc:
+                        if not future.done():
+                            future.set_exception(point_exc)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+                continue
+            for _, future in items:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _run_upsert_consumer(
+        self,
+        queue: "asyncio.Queue[Tuple[str, PointStruct, asyncio.Future]]",
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + UPSERT_MAX_WAIT_SECONDS
+            while len(batch) < UPSERT_MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush_upsert_batch(batch)
+            except Exception as exc:
+                logger.exception("qdrant_upsert_flush_failed size=%s", len(batch))
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+    async def upsert_batched(self, collection_name: str, point: PointStruct) -> None:
+        """Upsert one point, coalescing with concurrent callers into a single upsert call.
+
+        Returns once the point is written; raises the upsert's error otherwise.
+        """
+        if self._upsert_consumer is None or self._upsert_consumer.done():
+            self._upsert_queue = asyncio.Queue(maxsize=UPSERT_QUEUE_MAXSIZE)
+            self._upsert_consumer = asyncio.create_task(
+                self._run_upsert_consumer(self._upsert_queue)
+            )
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._upsert_queue.put((collection_name, point, future))
+        await future
+
     async def ensure_collections(self) -> None:
         """Ensure Tier 1 and Tier 2 collections exist with the configured vector size.
 
@@ -155,6 +413,15 @@ class VectorService:
             and field_name.lower() in message
         )
 
+    @classmethod
+    def _is_missing_order_by_index_error(cls, exc: Exception, field_name: str) -> bool:
+        # Qdrant: "No range index for `order_by` key: `upload_date`. Please create one ..."
+        message = str(exc).lower()
+        return (
+            "no range index for `order_by` key" in message
+            and field_name.lower() in message
+        ) or cls._is_missing_payload_index_error(exc, field_name)
+
     async def _ensure_payload_indexes(self, collection_name: str) -> None:
         """Ensure required payload indexes exist (idempotent)."""
         try:
@@ -182,8 +449,18 @@ class VectorService:
             )
         except Exception:
             pass
-        # Campaign ownership/source fields used by hard-delete and campaign-scoped filters.
-        for field_name in ("client_id", "tenant_id", "source_campaign_id"):
+        # Range index backing newest-first ordered scrolls in list_tenant_files.
+        try:
+            await self._client.create_payload_index(
+                collection_name=collection_name,
+                field_name="upload_date",
+                field_schema=models.PayloadSchemaType.DATETIME,
+            )
+        except Exception:
+            pass
+        # Campaign ownership/source fields used by hard-delete and campaign-scoped filters,
+        # plus filename for the tenant-scoped rename lookup and ocr_status for OCR state filters.
+        for field_name in ("client_id", "tenant_id", "source_campaign_id", "filename", "ocr_status"):
             try:
                 await self._client.create_payload_index(
                     collection_name=collection_name,
@@ -222,6 +499,7 @@ class VectorService:
                     size=settings.EMBEDDING_DIM,
                     distance=distance,
                 ),
+                quantization_config=scalar_quantization_config(),
                 sparse_vectors_config={
                     "bm25": models.SparseVectorParams(
                         modifier=models.Modifier.IDF,
@@ -240,6 +518,7 @@ class VectorService:
                     size=settings.EMBEDDING_DIM,
                     distance=distance,
                 ),
+                quantization_config=scalar_quantization_config(),
             )
         bm25_enabled = await self._ensure_sparse_vectors_config(collection_name)
         self._bm25_support_cache[collection_name] = bm25_enabled
@@ -285,6 +564,8 @@ class VectorService:
     def _point_to_dict(point: Any) -> Dict[str, Any]:
         if isinstance(point, dict):
             return point
+        if isinstance(point, models.ScoredPoint):
+            return _scored_point_to_dict(point)
         if hasattr(point, "dict"):
             return point.dict()
         return {
@@ -351,6 +632,55 @@ class VectorService:
             str(error),
         )
 
+    def _mark_upload_date_order_unavailable(self, collection_name: str, *, error: Exception) -> None:
+        if collection_name in self._upload_date_order_unavailable_collections:
+            return
+        self._upload_date_order_unavailable_collections.add(collection_name)
+        logger.warning(
+            "upload_date_order_disabled collection=%s reason=%s fallback_python_sort=true",
+            collection_name,
+            str(error),
+        )
+
+    async def _scroll_files_newest_first(
+        self,
+        *,
+        collection_name: str,
+        scroll_filter: Filter,
+        limit: int,
+    ) -> List[Any]:
+        """Scroll file records ordered by upload_date (newest first) inside Qdrant."""
+        ordered, _ = await self._client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=limit,
+            order_by=models.OrderBy(key="upload_date", direction=models.Direction.DESC),
+            with_payload=FILE_LISTING_PAYLOAD_FIELDS,
+            with_vectors=False,
+        )
+        points = list(ordered)
+        if len(points) >= limit:
+            return points
+
+        # Ordered scrolls skip points that lack the order key. Legacy records without
+        # upload_date are listed first, matching the "now" fallback used for their date.
+        undated_filter = Filter(
+            must=[
+                *(scroll_filter.must or []),
+                models.IsEmptyCondition(is_empty=models.PayloadField(key="upload_date")),
+            ],
+            should=scroll_filter.should or [],
+            must_not=scroll_filter.must_not or [],
+        )
+        undated, _ = await self._client.scroll(
+            collection_name=collection_name,
+            scroll_filter=undated_filter,
+            limit=limit - len(points),
+            with_payload=FILE_LISTING_PAYLOAD_FIELDS,
+            with_vectors=False,
+        )
+        return [*undated, *points]
+
     @staticmethod
     def _extract_points_from_query_points(raw_result: Any) -> List[Any]:
         if raw_result is None:
@@ -490,6 +820,26 @@ class VectorService:
             _try_add(point)
         return merged
 
+    async def _dense_chunk_search(
+        self,
+        collection_name: str,
+        query_embedding: Sequence[float],
+        query_filter: Filter,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        # query_points rather than the deprecated search(), with the same hnsw_ef and
+        # quantization rescoring as search_silo/search_global.
+        dense_raw = await self._client.query_points(
+            collection_name=collection_name,
+            query=list(query_embedding),
+            query_filter=query_filter,
+            limit=limit,
+            search_params=_dense_search_params(),
+            with_payload=True,
+        )
+        points = self._extract_points_from_query_points(dense_raw)
+        return self._filter_chunk_only([self._point_to_dict(point) for point in points])
+
     async def hybrid_search(
         self,
         *,
@@ -511,52 +861,32 @@ class VectorService:
 
         # Dense branch (existing retrieval behavior baseline)
         try:
-            dense_raw = await self._client.search(
-                collection_name=collection_name,
-                query_vector=query_embedding,
-                query_filter=effective_filter,
-                limit=limit,
-                with_payload=True,
+            dense_results = await self._dense_chunk_search(
+                collection_name, query_embedding, effective_filter, limit
             )
-            dense_results = self._filter_chunk_only([self._point_to_dict(point) for point in dense_raw])
         except Exception as exc:
             if self._is_missing_payload_index_error(exc, "record_type"):
                 fallback_filter = self._drop_record_type_from_must_not(effective_filter)
                 try:
-                    dense_raw = await self._client.search(
-                        collection_name=collection_name,
-                        query_vector=query_embedding,
-                        query_filter=fallback_filter,
-                        limit=limit,
-                        with_payload=True,
+                    dense_results = await self._dense_chunk_search(
+                        collection_name, query_embedding, fallback_filter, limit
                     )
-                    dense_results = self._filter_chunk_only([self._point_to_dict(point) for point in dense_raw])
                 except Exception as record_type_fallback_exc:
                     if self._is_missing_payload_index_error(record_type_fallback_exc, "chunk_type"):
                         self._mark_chunk_type_index_unavailable(collection_name, error=record_type_fallback_exc)
                         fallback_filter = self._drop_field_from_must(fallback_filter, "chunk_type")
-                        dense_raw = await self._client.search(
-                            collection_name=collection_name,
-                            query_vector=query_embedding,
-                            query_filter=fallback_filter,
-                            limit=limit,
-                            with_payload=True,
+                        dense_results = await self._dense_chunk_search(
+                            collection_name, query_embedding, fallback_filter, limit
                         )
-                        dense_results = self._filter_chunk_only([self._point_to_dict(point) for point in dense_raw])
                         effective_filter = fallback_filter
                     else:
                         raise
             elif self._is_missing_payload_index_error(exc, "chunk_type"):
                 self._mark_chunk_type_index_unavailable(collection_name, error=exc)
                 fallback_filter = self._drop_field_from_must(effective_filter, "chunk_type")
-                dense_raw = await self._client.search(
-                    collection_name=collection_name,
-                    query_vector=query_embedding,
-                    query_filter=fallback_filter,
-                    limit=limit,
-                    with_payload=True,
+                dense_results = await self._dense_chunk_search(
+                    collection_name, query_embedding, fallback_filter, limit
                 )
-                dense_results = self._filter_chunk_only([self._point_to_dict(point) for point in dense_raw])
                 effective_filter = fallback_filter
             else:
                 logger.warning(
@@ -756,7 +1086,7 @@ class VectorService:
     async def search_silo(
         self,
         collection_name: str,
-        query_vector: Sequence[float],
+        query_vector: Sequence[float] | np.ndarray,
         tenant_id: str,
         limit: int = 10,
         require_ai_enabled: bool = False,
@@ -768,7 +1098,7 @@ class VectorService:
         
         Args:
             collection_name: Name of the Qdrant collection to search
-            query_vector: The query embedding vector
+            query_vector: The query embedding vector (list or float32 ndarray)
             tenant_id: Tenant/client ID to filter by (required)
             limit: Maximum number of results to return
             require_ai_enabled: If True, only return files where ai_enabled == true
@@ -783,63 +1113,43 @@ class VectorService:
             )
         
         # Construct tenant filter for strict isolation
-        filter_conditions = [
-                FieldCondition(
-                    key="client_id",
-                    match=MatchValue(value=tenant_id),
-                )
-            ]
-        
-        # Add ai_enabled filter if required
-        if require_ai_enabled:
-            filter_conditions.append(
-                FieldCondition(
-                    key="ai_enabled",
-                    match=MatchValue(value=True),
-                )
-            )
-        
-        tenant_filter = Filter(
-            must=filter_conditions,
-            must_not=[
-                FieldCondition(
-                    key="record_type",
-                    match=MatchValue(value="file"),
-                )
-            ],
-        )
+        tenant_filter = _chunk_search_filter(tenant_id, require_ai_enabled)
 
         try:
-            search_result = await self._client.search(
+            query_result = await self._client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=tenant_filter,  # SECURITY: Always use tenant filter
                 limit=limit,
+                search_params=_dense_search_params(),
                 with_payload=True,  # Ensure payload (including filename) is returned
             )
+            search_result = self._extract_points_from_query_points(query_result)
         except Exception as exc:
             if not self._is_missing_payload_index_error(exc, "record_type"):
                 raise
             # Compatibility fallback for collections created before payload indexing.
-            legacy_filter = Filter(must=filter_conditions)
-            search_result = await self._client.search(
+            legacy_filter = Filter(must=tenant_filter.must)
+            query_result = await self._client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=legacy_filter,
                 limit=limit,
+                search_params=_dense_search_params(),
                 with_payload=True,
             )
+            search_result = self._extract_points_from_query_points(query_result)
             search_result = [
                 point for point in search_result
                 if (point.payload or {}).get("record_type") != "file"
             ]
 
-        return [point.dict() for point in search_result]
+        return [_scored_point_to_dict(point) for point in search_result]
 
     async def search_global(
         self,
         collection_name: str,
-        query_vector: Sequence[float],
+        query_vector: Sequence[float] | np.ndarray,
         limit: int = 5,
         filter: Filter | None = None,
     ) -> List[Any]:
@@ -852,7 +1162,7 @@ class VectorService:
         
         Args:
             collection_name: Name of the Qdrant collection to search
-            query_vector: The query embedding vector
+            query_vector: The query embedding vector (list or float32 ndarray)
             limit: Maximum number of results to return
             filter: REQUIRED Filter object to apply (e.g., is_global=True for Tier 1)
         
@@ -882,29 +1192,33 @@ class VectorService:
         )
 
         try:
-            search_result = await self._client.search(
+            query_result = await self._client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=query_filter,  # SECURITY: Always use explicit filter
                 limit=limit,
+                search_params=_dense_search_params(),
                 with_payload=True,  # Ensure payload (including filename) is returned
             )
+            search_result = self._extract_points_from_query_points(query_result)
         except Exception as exc:
             if not self._is_missing_payload_index_error(exc, "record_type"):
                 raise
-            search_result = await self._client.search(
+            query_result = await self._client.query_points(
                 collection_name=collection_name,
-                query_vector=query_vector,
+                query=query_vector,
                 query_filter=filter,
                 limit=limit,
+                search_params=_dense_search_params(),
                 with_payload=True,
             )
+            search_result = self._extract_points_from_query_points(query_result)
             search_result = [
                 point for point in search_result
                 if (point.payload or {}).get("record_type") != "file"
             ]
 
-        return [point.dict() for point in search_result]
+        return [_scored_point_to_dict(point) for point in search_result]
 
     async def list_tenant_files(
         self,
@@ -920,6 +1234,9 @@ class VectorService:
         Special handling: If tenant_id == "global", filters by is_global=True
         instead of client_id to retrieve files from the global archive.
 
+        Files are returned newest first. Ordering is pushed into Qdrant via the
+        upload_date range index; collections without it fall back to a Python sort.
+
         Args:
             collection_name: Name of the Qdrant collection to query.
             tenant_id: The tenant/client ID to filter by, or "global" for global archive.
@@ -932,66 +1249,71 @@ class VectorService:
                 - type: File type/extension from payload
                 - year: Year from payload (if available)
         """
-        # Special handling for global archive
-        if tenant_id == "global":
-            # Filter by is_global flag (do NOT filter by client_id)
-            tenant_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="is_global",
-                        match=MatchValue(value=True),
-                    )
-                ],
-                must_not=[
-                    FieldCondition(
-                        key="record_type",
-                        match=MatchValue(value="chunk"),
+        tenant_filter = _file_records_filter(tenant_id)
+
+        points: Optional[List[Any]] = None
+        if collection_name not in self._upload_date_order_unavailable_collections:
+            try:
+                points = await self._scroll_files_newest_first(
+                    collection_name=collection_name,
+                    scroll_filter=tenant_filter,
+                    limit=limit,
+                )
+            except Exception as exc:
+                # Only a missing upload_date index disables ordering for the collection;
+                # transient failures fall back for this call alone. Legacy collections
+                # without record_type indexing take the fallback below as well.
+                if self._is_missing_order_by_index_error(exc, "upload_date"):
+                    self._mark_upload_date_order_unavailable(collection_name, error=exc)
+                elif not self._is_missing_payload_index_error(exc, "record_type"):
+                    logger.warning(
+                        "upload_date_order_failed collection=%s reason=%s fallback_python_sort=true",
+                        collection_name,
+                        str(exc),
                     )
-                ],
-            )
-        else:
-            # Standard tenant-scoped filter
-            tenant_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="client_id",
-                        match=MatchValue(value=tenant_id),
+
+        if points is None:
+            # Use scroll to get all matching points
+            try:
+                scroll_result = await self._client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=tenant_filter,
+                    limit=limit,
+                    with_payload=FILE_LISTING_PAYLOAD_FIELDS,
+                )
+                points = scroll_result[0]
+            except Exception as exc:
+                if not self._is_missing_payload_index_error(exc, "record_type"):
+                    raise
+                legacy_filter = Filter(
+                    must=tenant_filter.must or [],
+                    should=tenant_filter.should or [],
+                )
+                # Chunks are dropped client-side here, so one page of `limit` points can hold
+                # fewer than `limit` files; follow next_page_offset until enough are collected.
+                points = []
+                offset = None
+                while len(points) < limit:
+                    batch, offset = await self._client.scroll(
+                        collection_name=collection_name,
+                        scroll_filter=legacy_filter,
+                        limit=limit,
+                        offset=offset,
+                        with_payload=FILE_LISTING_PAYLOAD_FIELDS,
                     )
-                ],
-                must_not=[
-                    FieldCondition(
-                        key="record_type",
-                        match=MatchValue(value="chunk"),
+                    points.extend(
+                        point for point in batch
+                        if (point.payload or {}).get("record_type") != "chunk"
                     )
-                ],
-            )
-
-        # Use scroll to get all matching points
-        try:
-            scroll_result = await self._client.scroll(
-                collection_name=collection_name,
-                scroll_filter=tenant_filter,
-                limit=limit,
-                with_payload=True,
-            )
-            points = scroll_result[0]
-        except Exception as exc:
-            if not self._is_missing_payload_index_error(exc, "record_type"):
-                raise
-            legacy_filter = Filter(
-                must=tenant_filter.must or [],
-                should=tenant_filter.should or [],
-            )
-            scroll_result = await self._client.scroll(
-                collection_name=collection_name,
-                scroll_filter=legacy_filter,
-                limit=limit,
-                with_payload=True,
+                    if offset is None or not batch:
+                        break
+                points = points[:limit]
+            fallback_now = datetime.now().isoformat()
+            points = sorted(
+                points,
+                key=lambda point: str((point.payload or {}).get("upload_date") or fallback_now),
+                reverse=True,
             )
-            points = [
-                point for point in scroll_result[0]
-                if (point.payload or {}).get("record_type") != "chunk"
-            ]
 
         files = []
         for point in points:
@@ -1084,20 +1406,7 @@ class VectorService:
         """
         # Filter for files marked as global (is_global=True)
         # This ensures we only get files that were explicitly promoted
-        global_filter = Filter(
-            must=[
-                FieldCondition(
-                    key="is_global",
-                    match=MatchValue(value=True),
-                )
-            ],
-            must_not=[
-                FieldCondition(
-                    key="record_type",
-                    match=MatchValue(value="chunk"),
-                )
-            ],
-        )
+        global_filter = _file_records_filter("global")
 
         points: List[Any] = []
         offset = None
@@ -1109,7 +1418,7 @@ class VectorService:
                     scroll_filter=global_filter,
                     limit=page_size,
                     offset=offset,
-                    with_payload=True,
+                    with_payload=FILE_LISTING_PAYLOAD_FIELDS,
                     with_vectors=False,  # Don't need vectors for listing
                 )
                 batch = scroll_result[0]
@@ -1125,7 +1434,7 @@ class VectorService:
                     scroll_filter=legacy_filter,
                     limit=page_size,
                     offset=offset,
-                    with_payload=True,
+                    with_payload=FILE_LISTING_PAYLOAD_FIELDS,
                     with_vectors=False,
                 )
                 batch = [
@@ -1211,36 +1520,7 @@ class VectorService:
         tenant_id: str,
     ) -> Dict[str, Any]:
         """Return campaign/global document ingestion summary for researcher visibility."""
-        if tenant_id == "global":
-            summary_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="is_global",
-                        match=MatchValue(value=True),
-                    )
-                ],
-                must_not=[
-                    FieldCondition(
-                        key="record_type",
-                        match=MatchValue(value="chunk"),
-                    )
-                ],
-            )
-        else:
-            summary_filter = Filter(
-                must=[
-                    FieldCondition(
-                        key="client_id",
-                        match=MatchValue(value=tenant_id),
-                    )
-                ],
-                must_not=[
-                    FieldCondition(
-                        key="record_type",
-                        match=MatchValue(value="chunk"),
-                    )
-                ],
-            )
+        summary_filter = _file_records_filter(tenant_id)
 
         points: List[Any] = []
         offset = None
@@ -1886,8 +2166,9 @@ class VectorService:
             ]
         )
         
-        # Collect all file URLs before deletion
+        # Collect all file URLs before deletion (only the url field leaves Qdrant)
         file_urls: List[str] = []
+        found_points = False
         offset = None
         
         # Scroll through all points for this tenant
@@ -1895,15 +2176,16 @@ class VectorService:
             scroll_result = await self._client.scroll(
                 collection_name=settings.QDRANT_COLLECTION_TIER_2,
                 scroll_filter=tenant_filter,
-                limit=100,  # Process in batches
+                limit=1000,  # Process in batches
                 offset=offset,
-                with_payload=True,
+                with_payload=["url"],
                 with_vectors=False,
             )
             
             points = scroll_result[0]
             if not points:
                 break
+            found_points = True
             
             # Extract file URLs from payloads
             for point in points:
@@ -1917,40 +2199,12 @@ class VectorService:
             if offset is None:
                 break
         
-        # Delete all points for this tenant
-        if file_urls:
-            # Get all point IDs to delete
-            point_ids: List[str] = []
-            offset = None
-            
-            while True:
-                scroll_result = await self._client.scroll(
-                    collection_name=settings.QDRANT_COLLECTION_TIER_2,
-                    scroll_filter=tenant_filter,
-                    limit=100,
-                    offset=offset,
-                    with_payload=False,
-                    with_vectors=False,
-                )
-                
-                points = scroll_result[0]
-                if not points:
-                    break
-                
-                point_ids.extend([str(point.id) for point in points])
-                
-                offset = scroll_result[1]
-                if offset is None:
-                    break
-            
-            # Delete all points
-            if point_ids:
-                await self._client.delete(
-                    collection_name=settings.QDRANT_COLLECTION_TIER_2,
-                    points_selector=models.PointIdsList(
-                        points=point_ids
-                    )
-                )
+        # Delete all points for this tenant in one filter-based call; no id scroll or id list.
+        if found_points:
+            await self._client.delete(
+                collection_name=settings.QDRANT_COLLECTION_TIER_2,
+                points_selector=models.FilterSelector(filter=tenant_filter),
+            )
         
         return file_urls
 
@@ -0,0 +1,202 @@
+"""In-process caches for search query embeddings and search results.
+
+Repeated or concurrent searches for the same text would otherwise each pay a Gemini
+embedding round trip (and a Qdrant search). Entries are keyed by a SHA-256 of the
+normalized query text; concurrent misses for the same key share one in-flight call.
+
+Exact misses fall back to a small SimHash index of recent queries, so near-duplicates
+(punctuation, a typo) can reuse an embedding instead of calling Gemini again.
+
+Cached embeddings are stored int8-quantized (symmetric, per-vector scale): a quarter of the
+float32 footprint, with reconstruction error far below what cosine ranking notices.
+
+Caches are per-process and best-effort: a restart or TTL expiry only costs a recompute.
+"""
+
+import asyncio
+from difflib import SequenceMatcher
+import hashlib
+from functools import partial
+import re
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from cachetools import TTLCache
+import numpy as np
+
+T = TypeVar("T")
+
+QuantizedEmbedding = Tuple[np.ndarray, float]
+
+# Query embeddings are deterministic for a given model, so they can live for a while.
+EMBED_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)  # 1 hour
+# Search results change with uploads/deletes; keep the window short and invalidate on writes.
+RESULT_CACHE: TTLCache = TTLCache(maxsize=2_000, ttl=60)  # 1 minute
+
+_inflight: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+
+GLOBAL_SCOPE = "global"
+
+# Near-duplicate reuse: SimHash Hamming distance <= 4 of 64 bits (~94% similar), then
+# confirmed on the normalized strings so unrelated queries that collide are rejected.
+_FUZZY_MAX_ENTRIES = 4096
+_FUZZY_MAX_HAMMING = 4
+_FUZZY_MIN_TEXT_SIMILARITY = 0.95
+_SIMHASH_BITS = 64
+_SHINGLE_CHARS = 3
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+# Ring buffer: fingerprints live in a contiguous uint64 array so the Hamming prefilter is
+# one vectorized XOR + popcount; _fuzzy_entries[i] holds (model_name, fuzzy_text, embedding).
+_fuzzy_hashes = np.zeros(_FUZZY_MAX_ENTRIES, dtype=np.uint64)
+_fuzzy_entries: List[Optional[Tuple[str, str, QuantizedEmbedding]]] = [None] * _FUZZY_MAX_ENTRIES
+_fuzzy_next = 0
+_fuzzy_size = 0
+
+
+def normalize_query_text(text: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share a key."""
+    return " ".join(text.lower().split())
+
+
+def quantize_embedding(vector: np.ndarray) -> QuantizedEmbedding:
+    """Symmetric int8 quantization: returns (int8 values, float scale)."""
+    peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    quantized = np.round(vector / scale).astype(np.int8)
+    quantized.flags.writeable = False
+    return quantized, scale
+
+
+def dequantize_embedding(entry: QuantizedEmbedding) -> np.ndarray:
+    quantized, scale = entry
+    return quantized.astype(np.float32) * np.float32(scale)
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(normalize_query_text(text).encode("utf-8")).hexdigest()
+
+
+def _fuzzy_text(text: str) -> str:
+    """Normalized text with punctuation dropped; "budget?" and "budget" compare equal."""
+    return _PUNCTUATION_RE.sub("", normalize_query_text(text))
+
+
+def _simhash(fuzzy_text: str) -> int:
+    # Character shingles rather than word shingles: short queries have too few words for a
+    # stable fingerprint, and a one-letter typo would change every word shingle it touches.
+    shingles = [
+        fuzzy_text[i:i + _SHINGLE_CHARS]
+        for i in range(max(1, len(fuzzy_text) - _SHINGLE_CHARS + 1))
+    ]
+
+    weights = [0] * _SIMHASH_BITS
+    for shingle in shingles:
+        digest = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(_SIMHASH_BITS):
+            weights[bit] += 1 if (digest >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def find_similar_embedding(model_name: str, text: str) -> Optional[QuantizedEmbedding]:
+    """Return a recently computed embedding for a near-duplicate query, if any."""
+    if not _fuzzy_size:
+        return None
+    normalized = _fuzzy_text(text)
+    fingerprint = np.uint64(_simhash(normalized))
+    distances = np.bitwise_count(_fuzzy_hashes[:_fuzzy_size] ^ fingerprint)
+    candidates = np.flatnonzero(distances <= _FUZZY_MAX_HAMMING)
+    # Newest first: slots before the write cursor are the most recent writes.
+    for index in sorted(candidates.tolist(), key=lambda i: (i >= _fuzzy_next, -i)):
+        entry = _fuzzy_entries[index]
+        if entry is None:
+            continue
+        candidate_model, candidate_text, embedding = entry
+        if candidate_model != model_name:
+            continue
+        if SequenceMatcher(None, normalized, candidate_text).ratio() >= _FUZZY_MIN_TEXT_SIMILARITY:
+            return embedding
+    return None
+
+
+def remember_embedding(model_name: str, text: str, embedding: QuantizedEmbedding) -> None:
+    global _fuzzy_next, _fuzzy_size
+    normalized = _fuzzy_text(text)
+    _fuzzy_hashes[_fuzzy_next] = _simhash(normalized)
+    _fuzzy_entries[_fuzzy_next] = (model_name, normalized, embedding)
+    _fuzzy_next = (_fuzzy_next + 1) % _FUZZY_MAX_ENTRIES
+    _fuzzy_size = min(_fuzzy_size + 1, _FUZZY_MAX_ENTRIES)
+
+
+def embed_cache_key(model_name: str, text: str) -> Tuple[str, str]:
+    return (model_name, _text_digest(text))
+
+
+def result_cache_key(
+    collection_name: str,
+    scope: str,
+    model_name: str,
+    text: str,
+    limit: Optional[int] = None,
+) -> Tuple[str, str, str, str, Optional[int]]:
+    """Key for a search result; scope is the tenant_id, or GLOBAL_SCOPE for firm-wide search."""
+    return (collection_name, scope, model_name, _text_digest(text), limit)
+
+
+def _store_result(
+    cache: TTLCache,
+    inflight_key: Tuple[int, Hashable],
+    future: "asyncio.Future[Any]",
+) -> None:
+    # Invalidation drops the in-flight entry; a result computed across it must not be cached.
+    if _inflight.get(inflight_key) is not future:
+        return
+    _inflight.pop(inflight_key, None)
+    if future.cancelled() or future.exception() is not None:
+        return
+    cache[inflight_key[1]] = future.result()
+
+
+async def get_or_compute(
+    cache: TTLCache,
+    key: Hashable,
+    compute: Callable[[], Awaitable[T]],
+) -> T:
+    """Return cache[key], computing it once even when many callers miss concurrently.
+
+    Failures are propagated to every waiter and are not cached.
+    """
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    inflight_key = (id(cache), key)
+    inflight = _inflight.get(inflight_key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(compute())
+        _inflight[inflight_key] = inflight
+        inflight.add_done_callback(partial(_store_result, cache, inflight_key))
+    # Shield so one cancelled request does not cancel the call other waiters share.
+    return await asyncio.shield(inflight)
+
+
+def invalidate_search_results(*scopes: Optional[str]) -> None:
+    """Drop cached search results for the given tenant ids (or GLOBAL_SCOPE)."""
+    targets = {scope for scope in scopes if scope}
+    if not targets:
+        return
+    stale: List[Any] = [key for key in list(RESULT_CACHE.keys()) if key[1] in targets]
+    for key in stale:
+        RESULT_CACHE.pop(key, None)
+    result_cache_id = id(RESULT_CACHE)
+    for inflight_key in list(_inflight):
+        cache_id, key = inflight_key
+        if cache_id == result_cache_id and key[1] in targets:
+            _inflight.pop(inflight_key, None)
@@ -79,6 +79,16 @@ def main() -> None:
                 size=settings.EMBEDDING_DIM,
                 distance=distance,
             ),
+            quantization_config=(
+                models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        always_ram=True,
+                    )
+                )
+                if settings.QDRANT_SCALAR_QUANTIZATION
+                else None
+            ),
         )
 
         print(f"Deleted {name} (if existed), created with dim={settings.EMBEDDING_DIM}")
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from app.routers import files
+from app.routers.files import (
+    TIER_1_COLLECTION,
+    TIER_2_COLLECTION,
+    _file_extension,
+    _invalidate_file_list_cache,
+    list_files,
+)
+
+
+class _BlockingLoader:
+    """Stands in for _load_file_list: counts calls and blocks until released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, *, tenant_id: str, graph) -> dict:
+        self.calls += 1
+        call_number = self.calls
+        await self.release.wait()
+        return {"files": [{"id": f"{tenant_id}-{call_number}"}]}
+
+
+def _body(response) -> dict:
+    return json.loads(response.body)
+
+
+class FileListCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        files._file_list_cache.clear()
+        files._file_list_inflight.clear()
+        files._file_list_generation.clear()
+
+    async def _list(self, tenant_id: str = "t1"):
+        return await list_files(tenant_id=tenant_id, current_user={"id": "u1"}, graph=None)
+
+    async def test_concurrent_polls_share_one_load(self) -> None:
+        loader = _BlockingLoader()
+        with patch("app.routers.files._load_file_list", new=loader):
+            first = asyncio.create_task(self._list())
+            second = asyncio.create_task(self._list())
+            await asyncio.sleep(0)
+            loader.release.set()
+            responses = await asyncio.gather(first, second)
+
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(_body(responses[0]), {"files": [{"id": "t1-1"}]})
+        self.assertEqual(_body(responses[1]), _body(responses[0]))
+
+    async def test_completed_load_is_served_from_cache(self) -> None:
+        loader = _BlockingLoader()
+        loader.release.set()
+        with patch("app.routers.files._load_file_list", new=loader):
+            await self._list()
+            cached = await self._list()
+
+        self.assertEqual(loader.calls, 1)
+        self.assertEqual(_body(cached), {"files": [{"id": "t1-1"}]})
+
+    async def test_mutation_during_load_is_not_cached(self) -> None:
+        loader = _BlockingLoader()
+        with patch("app.routers.files._load_file_list", new=loader):
+            stale = asyncio.create_task(self._list())
+            await asyncio.sleep(0)
+            _invalidate_file_list_cache("t1")
+            loader.release.set()
+            await stale
+
+            self.assertNotIn("t1", files._file_list_cache)
+            fresh = await self._list()
+
+        self.assertEqual(loader.calls, 2)
+        self.assertEqual(_body(fresh), {"files": [{"id": "t1-2"}]})
+
+    def test_invalidation_bumps_generation(self) -> None:
+        files._file_list_cache["t1"] = {"files": []}
+        _invalidate_file_list_cache("t1")
+        _invalidate_file_list_cache("t1", None)
+
+        self.assertEqual(files._file_list_generation, {"t1": 2})
+        self.assertNotIn("t1", files._file_list_cache)
+
+    def test_tier_1_or_promoted_mutation_drops_global_listing(self) -> None:
+        files._file_list_cache["global"] = {"files": []}
+        _invalidate_file_list_cache("t1", collection_name=TIER_1_COLLECTION)
+        self.assertNotIn("global", files._file_list_cache)
+
+        files._file_list_cache["global"] = {"files": []}
+        _invalidate_file_list_cache("t1", payload={"is_global": True})
+        self.assertNotIn("global", files._file_list_cache)
+        self.assertEqual(files._file_list_generation["global"], 2)
+
+    def test_tier_2_mutation_keeps_global_listing(self) -> None:
+        files._file_list_cache["global"] = {"files": []}
+        _invalidate_file_list_cache("t1", collection_name=TIER_2_COLLECTION, payload={"client_id": "t1"})
+        self.assertIn("global", files._file_list_cache)
+
+
+class FileExtensionTests(unittest.TestCase):
+    def test_matches_path_suffix_semantics(self) -> None:
+        cases = {
+            "Budget.PDF": "pdf",
+            "archive.tar.gz": "gz",
+            "README": "",
+            ".env": "",
+            "drafts/.env": "",
+            "v1.2/notes": "",
+            "name.": "",
+            "": "",
+        }
+        for filename, expected in cases.items():
+            with self.subTest(filename=filename):
+                self.assertEqual(_file_extension(filename), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
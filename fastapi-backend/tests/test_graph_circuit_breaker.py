@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.services.graph import GraphOverloadedError, GraphService
+
+
+def _settings() -> SimpleNamespace:
+    return SimpleNamespace(
+        NEO4J_MAX_CONNECTION_POOL_SIZE=14,
+        NEO4J_CIRCUIT_BREAKER_UTILIZATION=0.9,
+        NEO4J_CIRCUIT_BREAKER_WINDOW_SECONDS=5.0,
+    )
+
+
+def _service() -> GraphService:
+    with patch("app.services.graph.get_settings", return_value=_settings()):
+        return GraphService(driver=MagicMock())
+
+
+def _hold_slots(service: GraphService, count: int) -> None:
+    service._slot_holders.update(object() for _ in range(count))
+
+
+class GraphCircuitBreakerTests(unittest.TestCase):
+    def test_slot_total_leaves_pool_margin(self) -> None:
+        service = _service()
+        self.assertEqual(service._session_slot_total, 10)
+
+    def test_breaker_stays_closed_below_threshold(self) -> None:
+        service = _service()
+        _hold_slots(service, 8)
+        self.assertFalse(service._circuit_open())
+        self.assertIsNone(service._saturated_since)
+
+    def test_queued_waiters_do_not_count_toward_utilization(self) -> None:
+        service = _service()
+        service._session_slot_demand = 50
+        self.assertFalse(service._circuit_open())
+        self.assertIsNone(service._saturated_since)
+
+    def test_breaker_opens_after_saturation_window(self) -> None:
+        service = _service()
+        _hold_slots(service, 10)
+        with patch("app.services.graph.time.monotonic", side_effect=[100.0, 103.0, 105.0]):
+            self.assertFalse(service._circuit_open())
+            self.assertFalse(service._circuit_open())
+            self.assertTrue(service._circuit_open())
+
+    def test_breaker_closes_and_resets_window_when_slots_free_up(self) -> None:
+        service = _service()
+        _hold_slots(service, 10)
+        with patch("app.services.graph.time.monotonic", side_effect=[100.0, 106.0, 107.0]):
+            service._circuit_open()
+            self.assertTrue(service._circuit_open())
+
+            service._slot_holders.clear()
+            self.assertFalse(service._circuit_open())
+            self.assertIsNone(service._saturated_since)
+
+            # Saturating again starts a fresh window rather than reopening immediately.
+            _hold_slots(service, 10)
+            self.assertFalse(service._circuit_open())
+            self.assertEqual(service._saturated_since, 107.0)
+
+
+class GraphSessionSlotTests(unittest.IsolatedAsyncioTestCase):
+    async def test_open_breaker_rejects_new_sessions(self) -> None:
+        service = _service()
+        _hold_slots(service, 10)
+        service._saturated_since = 0.0
+        with self.assertRaises(GraphOverloadedError):
+            async with service._session():
+                pass
+        service._driver.session.assert_not_called()
+
+    async def test_slot_is_scoped_to_the_holding_task(self) -> None:
+        service = _service()
+        current = asyncio.current_task()
+
+        async def _child_holds_slot() -> bool:
+            return asyncio.current_task() in service._slot_holders
+
+        async with service._session():
+            self.assertIn(current, service._slot_holders)
+            self.assertEqual(service.pool_stats()["session_slots_in_use"], 1)
+            # A task spawned while the slot is held must acquire its own.
+            self.assertFalse(await asyncio.create_task(_child_holds_slot()))
+            # Nested sessions in the same task reuse the held slot.
+            async with service._session():
+                self.assertEqual(len(service._slot_holders), 1)
+
+        self.assertEqual(service._slot_holders, set())
+        self.assertEqual(service._session_slot_demand, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import io
+import unittest
+import uuid
+from typing import List, Optional
+from unittest.mock import patch
+
+from docx import Document
+from fastapi import HTTPException
+
+from app.services import ingestion
+from app.services.ingestion import (
+    UPLOAD_READ_CHUNK_BYTES,
+    _ocr_required_for_file,
+    _read_docx,
+    _read_html,
+    _run_in_cpu_pool,
+    _uuid7,
+    read_upload_bounded,
+)
+
+
+class _FakeUpload:
+    """Minimal UploadFile stand-in: optional declared size, records each read size."""
+
+    def __init__(self, content: bytes, size: Optional[int] = None) -> None:
+        self.size = size
+        self.reads: List[int] = []
+        self._stream = io.BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads.append(size)
+        return self._stream.read(size)
+
+
+class CpuPoolExtractionTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        await ingestion.shutdown_cpu_pool()
+
+    async def test_pool_uses_forkserver_workers(self) -> None:
+        pool = ingestion._get_cpu_pool()
+        self.assertEqual(pool._mp_context.get_start_method(), "forkserver")
+
+    async def test_read_docx_runs_in_pool(self) -> None:
+        document = Document()
+        document.add_paragraph("Campaign field plan")
+        document.add_paragraph("   ")
+        document.add_paragraph("Door-knocking targets by precinct")
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        text = await _run_in_cpu_pool(_read_docx, buffer.getvalue())
+
+        self.assertEqual(text, "Campaign field plan\nDoor-knocking targets by precinct")
+
+    async def test_read_html_runs_in_pool(self) -> None:
+        html = (
+            b"<html><head><style>p { color: red; }</style><script>var x = 1;</script></head>"
+            b"<body><p>  Press release  </p>\n\n\n<p>Embargoed until Monday</p></body></html>"
+        )
+
+        text = await _run_in_cpu_pool(_read_html, html)
+
+        self.assertEqual(text, "Press release\nEmbargoed until Monday")
+
+    async def test_shutdown_resets_pool(self) -> None:
+        ingestion._get_cpu_pool()
+        await ingestion.shutdown_cpu_pool()
+        self.assertIsNone(ingestion._cpu_pool)
+
+
+class ReadUploadBoundedTests(unittest.IsolatedAsyncioTestCase):
+    async def test_declared_size_over_limit_rejected_before_reading(self) -> None:
+        upload = _FakeUpload(b"x" * 10, size=11)
+        with self.assertRaises(HTTPException) as ctx:
+            await read_upload_bounded(upload, max_bytes=10)
+        self.assertEqual(ctx.exception.status_code, 413)
+        self.assertEqual(upload.reads, [])
+
+    async def test_declared_size_in_limit_uses_one_capped_read(self) -> None:
+        upload = _FakeUpload(b"x" * 10, size=10)
+        self.assertEqual(await read_upload_bounded(upload, max_bytes=10), b"x" * 10)
+        self.assertEqual(upload.reads, [11])
+
+    async def test_understated_declared_size_still_rejected(self) -> None:
+        upload = _FakeUpload(b"x" * 50, size=5)
+        with self.assertRaises(HTTPException) as ctx:
+            await read_upload_bounded(upload, max_bytes=10)
+        self.assertEqual(ctx.exception.status_code, 413)
+        self.assertEqual(upload.reads, [11])
+
+    async def test_without_size_reads_in_chunks(self) -> None:
+        content = b"a" * (UPLOAD_READ_CHUNK_BYTES + 3)
+        upload = _FakeUpload(content)
+        result = await read_upload_bounded(upload, max_bytes=2 * UPLOAD_READ_CHUNK_BYTES)
+        self.assertEqual(result, content)
+        self.assertEqual(upload.reads, [UPLOAD_READ_CHUNK_BYTES] * 3)
+
+    async def test_without_size_stops_once_limit_is_passed(self) -> None:
+        upload = _FakeUpload(b"a" * (3 * UPLOAD_READ_CHUNK_BYTES))
+        with self.assertRaises(HTTPException) as ctx:
+            await read_upload_bounded(upload, max_bytes=UPLOAD_READ_CHUNK_BYTES + 1)
+        self.assertEqual(ctx.exception.status_code, 413)
+        self.assertEqual(len(upload.reads), 2)
+
+    async def test_empty_upload_without_size(self) -> None:
+        self.assertEqual(await read_upload_bounded(_FakeUpload(b""), max_bytes=10), b"")
+
+
+class Uuid7Tests(unittest.TestCase):
+    def test_version_and_variant_bits(self) -> None:
+        for _ in range(64):
+            value = uuid.UUID(_uuid7())
+            self.assertEqual(value.version, 7)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_leading_bits_carry_unix_milliseconds(self) -> None:
+        now_ms = 1_760_000_000_123
+        with patch.object(ingestion.time, "time_ns", return_value=now_ms * 1_000_000):
+            value = uuid.UUID(_uuid7())
+        self.assertEqual(value.int >> 80, now_ms)
+
+    def test_later_ids_sort_after_earlier_ids(self) -> None:
+        ids = []
+        for ms in (1_760_000_000_000, 1_760_000_000_001, 1_760_000_005_000):
+            with patch.object(ingestion.time, "time_ns", return_value=ms * 1_000_000):
+                ids.append(_uuid7())
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual(len(set(ids)), 3)
+
+
+class OcrRequiredForFileTests(unittest.TestCase):
+    def _required(self, file_type: str, quality_status: str = "good", text_len: int = 5000,
+                  file_size: int = 10_000) -> bool:
+        return _ocr_required_for_file(
+            file_type=file_type,
+            quality_status=quality_status,
+            cleaned_text="x" * text_len,
+            file_size=file_size,
+        )
+
+    def test_images_always_need_ocr(self) -> None:
+        self.assertTrue(self._required("PNG"))
+
+    def test_low_text_visual_document_needs_ocr(self) -> None:
+        self.assertTrue(self._required("pdf", quality_status="low_text"))
+        self.assertFalse(self._required("docx", quality_status="low_text"))
+
+    def test_ocr_needed_applies_to_any_type(self) -> None:
+        self.assertTrue(self._required("docx", quality_status="ocr_needed"))
+
+    def test_good_visual_document_with_thin_text_or_large_size(self) -> None:
+        self.assertTrue(self._required("pptx", text_len=100))
+        self.assertTrue(self._required("pdf", file_size=300_000))
+        self.assertFalse(self._required("pdf"))
+
+    def test_good_text_documents_skip_ocr(self) -> None:
+        self.assertFalse(self._required("docx", text_len=100, file_size=300_000))
+        self.assertFalse(self._required(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from app.services import query_cache
+from app.services.query_cache import (
+    EMBED_CACHE,
+    RESULT_CACHE,
+    dequantize_embedding,
+    find_similar_embedding,
+    get_or_compute,
+    invalidate_search_results,
+    quantize_embedding,
+    remember_embedding,
+    result_cache_key,
+)
+
+_QUERY = "what is our q3 digital ad budget for the smith campaign"
+
+
+def _reset_query_cache() -> None:
+    EMBED_CACHE.clear()
+    RESULT_CACHE.clear()
+    query_cache._inflight.clear()
+    query_cache._fuzzy_hashes[:] = 0
+    query_cache._fuzzy_entries[:] = [None] * query_cache._FUZZY_MAX_ENTRIES
+    query_cache._fuzzy_next = 0
+    query_cache._fuzzy_size = 0
+
+
+class _Compute:
+    """Counts calls and blocks until released; returns `value` or raises `error`."""
+
+    def __init__(self, value=None, error: Exception = None) -> None:
+        self.calls = 0
+        self.value = value
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class GetOrComputeTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        _reset_query_cache()
+
+    async def test_concurrent_misses_share_one_compute(self) -> None:
+        compute = _Compute(value=["hit"])
+        waiters = [
+            asyncio.create_task(get_or_compute(EMBED_CACHE, "k", compute)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        compute.release.set()
+        results = await asyncio.gather(*waiters)
+
+        self.assertEqual(compute.calls, 1)
+        self.assertEqual(results, [["hit"]] * 3)
+        self.assertEqual(EMBED_CACHE["k"], ["hit"])
+        self.assertEqual(query_cache._inflight, {})
+
+    async def test_cached_value_skips_compute(self) -> None:
+        EMBED_CACHE["k"] = "cached"
+        compute = _Compute(value="fresh")
+        self.assertEqual(await get_or_compute(EMBED_CACHE, "k", compute), "cached")
+        self.assertEqual(compute.calls, 0)
+
+    async def test_failure_reaches_every_waiter_and_is_not_cached(self) -> None:
+        compute = _Compute(error=RuntimeError("gemini down"))
+        waiters = [
+            asyncio.create_task(get_or_compute(EMBED_CACHE, "k", compute)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        compute.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertNotIn("k", EMBED_CACHE)
+        self.assertEqual(query_cache._inflight, {})
+
+        retry = _Compute(value="ok")
+        retry.release.set()
+        self.assertEqual(await get_or_compute(EMBED_CACHE, "k", retry), "ok")
+        self.assertEqual(retry.calls, 1)
+
+    async def test_cancelled_waiter_does_not_cancel_shared_compute(self) -> None:
+        compute = _Compute(value="shared")
+        cancelled = asyncio.create_task(get_or_compute(EMBED_CACHE, "k", compute))
+        survivor = asyncio.create_task(get_or_compute(EMBED_CACHE, "k", compute))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+        compute.release.set()
+
+        self.assertEqual(await survivor, "shared")
+        self.assertEqual(compute.calls, 1)
+        self.assertEqual(EMBED_CACHE["k"], "shared")
+
+    async def test_invalidation_during_compute_skips_caching(self) -> None:
+        key = result_cache_key("tier2", "t1", "model", _QUERY)
+        compute = _Compute(value=["stale"])
+        waiter = asyncio.create_task(get_or_compute(RESULT_CACHE, key, compute))
+        await asyncio.sleep(0)
+
+        invalidate_search_results("t1")
+        compute.release.set()
+
+        # The waiter still gets its answer; it just isn't kept for later requests.
+        self.assertEqual(await waiter, ["stale"])
+        self.assertNotIn(key, RESULT_CACHE)
+
+        fresh = _Compute(value=["fresh"])
+        fresh.release.set()
+        self.assertEqual(await get_or_compute(RESULT_CACHE, key, fresh), ["fresh"])
+        self.assertEqual(fresh.calls, 1)
+
+
+class InvalidateSearchResultsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _reset_query_cache()
+
+    def test_only_matching_scopes_are_dropped(self) -> None:
+        t1_key = result_cache_key("tier2", "t1", "model", _QUERY)
+        t2_key = result_cache_key("tier2", "t2", "model", _QUERY)
+        global_key = result_cache_key("tier1", query_cache.GLOBAL_SCOPE, "model", _QUERY, 10)
+        for key in (t1_key, t2_key, global_key):
+            RESULT_CACHE[key] = ["result"]
+
+        invalidate_search_results("t1", None, query_cache.GLOBAL_SCOPE)
+
+        self.assertNotIn(t1_key, RESULT_CACHE)
+        self.assertNotIn(global_key, RESULT_CACHE)
+        self.assertIn(t2_key, RESULT_CACHE)
+
+    def test_no_scopes_is_a_no_op(self) -> None:
+        key = result_cache_key("tier2", "t1", "model", _QUERY)
+        RESULT_CACHE[key] = ["result"]
+        invalidate_search_results(None, "")
+        self.assertIn(key, RESULT_CACHE)
+
+
+class QuantizationTests(unittest.TestCase):
+    def test_round_trip_error_is_within_half_a_step(self) -> None:
+        vector = np.random.default_rng(7).normal(size=768).astype(np.float32)
+        quantized, scale = quantize_embedding(vector)
+
+        self.assertEqual(quantized.dtype, np.int8)
+        self.assertFalse(quantized.flags.writeable)
+        self.assertEqual(int(np.max(np.abs(quantized))), 127)
+        restored = dequantize_embedding((quantized, scale))
+        self.assertEqual(restored.dtype, np.float32)
+        self.assertLessEqual(float(np.max(np.abs(restored - vector))), scale / 2 + 1e-6)
+
+        cosine = float(
+            np.dot(restored, vector) / (np.linalg.norm(restored) * np.linalg.norm(vector))
+        )
+        self.assertGreater(cosine, 0.999)
+
+    def test_zero_vector_uses_unit_scale(self) -> None:
+        quantized, scale = quantize_embedding(np.zeros(4, dtype=np.float32))
+        self.assertEqual(scale, 1.0)
+        self.assertEqual(dequantize_embedding((quantized, scale)).tolist(), [0.0] * 4)
+
+
+class NearDuplicateLookupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _reset_query_cache()
+        self.embedding = quantize_embedding(np.arange(1, 9, dtype=np.float32))
+
+    def test_empty_index_returns_none(self) -> None:
+        self.assertIsNone(find_similar_embedding("model", _QUERY))
+
+    def test_case_and_punctuation_variants_match(self) -> None:
+        remember_embedding("model", _QUERY, self.embedding)
+        found = find_similar_embedding("model", "What is our Q3 digital ad budget for the Smith campaign?")
+        self.assertIs(found, self.embedding)
+
+    def test_single_typo_matches(self) -> None:
+        remember_embedding("model", _QUERY, self.embedding)
+        found = find_similar_embedding("model", "what is ou q3 digital ad budget for the smith campaign")
+        self.assertIs(found, self.embedding)
+
+    def test_other_model_or_unrelated_query_does_not_match(self) -> None:
+        remember_embedding("model", _QUERY, self.embedding)
+        self.assertIsNone(find_similar_embedding("other-model", _QUERY))
+        self.assertIsNone(find_similar_embedding("model", "volunteer schedule for saturday canvassing"))
+
+    def test_fingerprint_collision_is_rejected_by_text_check(self) -> None:
+        remember_embedding("model", "volunteer schedule for saturday canvassing", self.embedding)
+        # Force the stored fingerprint to equal the query's, as a SimHash collision would.
+        query_cache._fuzzy_hashes[0] = query_cache._simhash(query_cache._fuzzy_text(_QUERY))
+        self.assertIsNone(find_similar_embedding("model", _QUERY))
+
+    def test_newest_near_duplicate_wins(self) -> None:
+        newer = quantize_embedding(np.arange(8, 0, -1, dtype=np.float32))
+        remember_embedding("model", _QUERY, self.embedding)
+        remember_embedding("model", _QUERY + "?", newer)
+        self.assertIs(find_similar_embedding("model", _QUERY), newer)
+
+
+if __name__ == "__main__":
+    unittest.main()